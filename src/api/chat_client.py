@@ -0,0 +1,267 @@
+"""
+브라우저 없이 채팅 API를 직접 호출하는 HTTP/SSE 클라이언트
+
+브라우저로 한 번 채팅해서 ChatPage.send_message가 부르는 엔드포인트를 NetworkTracker 기록에서 찾고
+(discover_endpoint), 이후에는 로그인 세션 스냅샷의 쿠키로 같은 요청을 requests로 보낸다.
+응답은 도착하는 대로 읽어 조각(delta)마다 콜백을 부르고, 결과는 브라우저 측정과 같은 StreamingResult로 돌려준다.
+(send_message_observed 이름도 같아서 LoadGenerator 세션으로 그대로 쓸 수 있음)
+
+    endpoint = chat.discover_chat_endpoint("안녕")          # 브라우저에서 1회
+    endpoint.save(CHAT_ENDPOINT_PATH)
+    client = ChatClient.from_snapshot(ChatEndpoint.load(CHAT_ENDPOINT_PATH), session_cache.load(acc))
+    result = client.send_message_observed("자기소개를 부탁해")
+
+- 요청 본문: 발견 당시 본문(JSON)에서 보낸 메시지가 들어 있던 위치(message_path)만 바꿔서 재사용
+- 응답 해석: text/event-stream이면 SSE data 줄, 아니면 받은 청크 그대로를 delta로 본다.
+  data가 JSON이면 DELTA_KEYS 순서로 처음 나오는 문자열 필드를 delta로 쓴다. ("[DONE]"은 종료 신호)
+"""
+
+import codecs
+import json
+import os
+import time
+from typing import NamedTuple, Optional
+
+import requests
+
+from src.utils.stream_observer import StreamingResult
+
+# delta로 볼 JSON 필드 (앞쪽 우선, 중첩 구조는 깊이 우선으로 탐색)
+DELTA_KEYS = ("delta", "content", "text", "token", "message", "answer")
+
+# 발견한 요청에서 재사용할 헤더 (쿠키/브라우저 고유 헤더 제외)
+REPLAY_HEADERS = ("content-type", "accept", "authorization")
+
+_JSON_TYPES = (dict, list)
+
+
+class ChatEndpoint(NamedTuple):
+    url: str
+    method: str
+    headers: dict
+    body: Optional[object]      # JSON 본문 템플릿 (JSON이 아니면 원문 문자열)
+    message_path: Optional[list]  # body 안에서 메시지가 들어갈 위치 (키/인덱스 목록)
+
+    def build_body(self, message):
+        if self.message_path is None:
+            return self.body
+        body = json.loads(json.dumps(self.body))
+        target = body
+        for key in self.message_path[:-1]:
+            target = target[key]
+        target[self.message_path[-1]] = message
+        return body
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self._asdict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(**json.load(f))
+
+
+def _find_path(value, needle, path=()):
+    """JSON 값 안에서 문자열 needle이 들어 있는 위치"""
+    if isinstance(value, str):
+        return list(path) if value == needle else None
+    items = value.items() if isinstance(value, dict) else enumerate(value) if isinstance(value, list) else ()
+    for key, child in items:
+        found = _find_path(child, needle, path + (key,))
+        if found is not None:
+            return found
+    return None
+
+
+def discover_endpoint(records, message):
+    """
+    NetworkTracker 기록 중 채팅 요청을 골라 ChatEndpoint로 변환 (없으면 None)
+    - 본문에 message가 들어 있는 POST 요청, 그중 스트리밍 응답 → 오래 걸린 순으로 우선
+    """
+    candidates = []
+    for record in records:
+        if record.method != "POST" or not record.post_data:
+            continue
+        try:
+            body = json.loads(record.post_data)
+        except ValueError:
+            body = None
+        if isinstance(body, _JSON_TYPES):
+            # JSON은 \uXXXX로 이스케이프될 수 있으므로 파싱한 값에서 찾음
+            message_path = _find_path(body, message)
+            if message_path is None:
+                continue
+        elif message in record.post_data:
+            body, message_path = record.post_data, None
+        else:
+            continue
+        streaming = (record.mime_type or "").startswith("text/event-stream")
+        candidates.append((streaming, record.duration_ms, record, body, message_path))
+    if not candidates:
+        return None
+    _, _, record, body, message_path = max(candidates, key=lambda c: (c[0], c[1]))
+    headers = {k: v for k, v in (record.request_headers or {}).items() if k.lower() in REPLAY_HEADERS}
+    return ChatEndpoint(record.url, record.method, headers, body, message_path)
+
+
+def extract_delta(data):
+    """SSE data 한 건 → delta 문자열 (없으면 "", 종료 신호면 None)"""
+    if data.strip() == "[DONE]":
+        return None
+    try:
+        payload = json.loads(data)
+    except ValueError:
+        return data
+    if isinstance(payload, str):
+        return payload
+    return _find_delta(payload) or ""
+
+
+def _find_delta(value):
+    if isinstance(value, dict):
+        for key in DELTA_KEYS:
+            if isinstance(value.get(key), str):
+                return value[key]
+        children = value.values()
+    elif isinstance(value, list):
+        children = value
+    else:
+        return None
+    for child in children:
+        if isinstance(child, _JSON_TYPES):
+            found = _find_delta(child)
+            if found:
+                return found
+    return None
+
+
+class SSEParser:
+    """받은 텍스트 청크를 모아 완성된 이벤트의 data 문자열을 돌려준다"""
+
+    def __init__(self):
+        self._buffer = ""
+        self._data = []
+
+    def feed(self, chunk):
+        self._buffer += chunk
+        events = []
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            line = line.rstrip("\r")
+            if not line:
+                if self._data:
+                    events.append("\n".join(self._data))
+                    self._data = []
+            elif line.startswith("data:"):
+                value = line[5:]
+                self._data.append(value[1:] if value.startswith(" ") else value)
+        return events
+
+    def flush(self):
+        """스트림이 빈 줄 없이 끝났을 때 남은 이벤트"""
+        return self.feed("\n\n") if self._buffer or self._data else []
+
+
+def _iter_text(response):
+    """
+    도착한 만큼씩 텍스트로 읽기
+    iter_content(chunk_size=None)는 chunked 인코딩이 아닌 응답이면 연결이 끝날 때까지 모아서 돌려주므로
+    urllib3의 read1(받은 만큼만 반환)을 우선 사용
+    """
+    raw = response.raw
+    if not hasattr(raw, "read1"):  # urllib3 1.x
+        yield from response.iter_content(chunk_size=1, decode_unicode=True)
+        return
+    decoder = codecs.getincrementaldecoder(response.encoding)(errors="replace")
+    while True:
+        data = raw.read1(8192, decode_content=True)
+        if not data:
+            break
+        text = decoder.decode(data)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+class ChatClient:
+
+    def __init__(self, endpoint, cookies=(), session=None, timeout=60):
+        """cookies: CDP Network.getAllCookies 형식의 dict 목록 (name/value/domain/path)"""
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+            )
+
+    @classmethod
+    def from_snapshot(cls, endpoint, snapshot, **kwargs):
+        """로그인 세션 스냅샷(SessionCache.load 결과)의 쿠키로 생성"""
+        if not snapshot:
+            raise ValueError("로그인 세션 스냅샷이 없습니다 (브라우저로 먼저 로그인 필요)")
+        return cls(endpoint, snapshot["cookies"], **kwargs)
+
+    def stream(self, message, timeout=None):
+        """(도착 시각, delta) 를 받는 대로 yield (시각은 time.perf_counter)"""
+        endpoint = self.endpoint
+        body = endpoint.build_body(message)
+        kwargs = {"json": body} if isinstance(body, _JSON_TYPES) else {"data": body}
+        with self.session.request(
+            endpoint.method, endpoint.url, headers=endpoint.headers,
+            stream=True, timeout=timeout or self.timeout, **kwargs,
+        ) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            sse = content_type.startswith("text/event-stream")
+            if "charset" not in content_type:
+                response.encoding = "utf-8"  # text/*의 requests 기본값(ISO-8859-1)이면 한글이 깨짐
+            parser = SSEParser()
+            for chunk in _iter_text(response):
+                now = time.perf_counter()
+                if not sse:
+                    yield now, chunk
+                    continue
+                for data in parser.feed(chunk):
+                    delta = extract_delta(data)
+                    if delta is None:
+                        return
+                    if delta:
+                        yield now, delta
+            for data in parser.flush():
+                delta = extract_delta(data)
+                if delta:
+                    yield time.perf_counter(), delta
+
+    def send_message_observed(self, message, timeout=None, on_delta=None):
+        """
+        메시지 전송 → StreamingResult (브라우저 측정과 같은 지표)
+        on_delta(경과 ms, delta): 조각이 도착할 때마다 호출되는 타이밍 훅
+        """
+        submit = time.perf_counter()
+        times, parts = [], []
+        for arrived, delta in self.stream(message, timeout):
+            times.append(arrived)
+            parts.append(delta)
+            if on_delta:
+                on_delta((arrived - submit) * 1000, delta)
+        text = "".join(parts).strip()
+        raw = {
+            "installedAt": submit * 1000,
+            "submitAt": submit * 1000,
+            "chunks": [[t * 1000, 0] for t in times],
+            "text": text,
+        }
+        return StreamingResult.from_raw(raw)
+
+    def send_message(self, message, timeout=None):
+        """응답 전체 텍스트"""
+        return "".join(delta for _, delta in self.stream(message, timeout)).strip()
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,123 @@
+"""
+관리자 계정 임대(lease) 관리
+
+pytest-xdist로 병렬 실행할 때 두 워커가 같은 계정을 쓰면
+채팅 히스토리/크레딧/아바타 상태가 서로 꼬인다.
+계정마다 잠금 파일을 하나씩 두고 OS 파일 잠금으로 "한 계정 = 한 워커"를 보장한다.
+
+- 빈 계정이 없으면 다른 워커가 반납할 때까지 대기한다.
+- 잠금은 프로세스가 죽으면 OS가 자동으로 풀어주므로, 워커가 비정상 종료돼도 계정이 묶이지 않는다.
+"""
+
+import hashlib
+import os
+import re
+import time
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+def _try_lock(fh):
+    """잠금 획득 시도 (기다리지 않음). 성공하면 True"""
+    try:
+        fh.seek(0)
+        if os.name == "nt":
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fh):
+    try:
+        fh.seek(0)
+        if os.name == "nt":
+            msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    except OSError:
+        pass
+
+
+def _worker_index(worker_id):
+    """'gw3' → 3 (xdist 워커가 아니면 0)"""
+    m = re.search(r"(\d+)$", worker_id or "")
+    return int(m.group(1)) if m else 0
+
+
+class AccountLease:
+    """
+    계정 하나를 독점적으로 빌려주는 임대 관리자
+    - accounts: 임대 대상 AdminAccount 목록 (아이디/비밀번호가 없는 계정은 제외됨)
+    - lock_dir: 잠금 파일 폴더 (같은 머신의 모든 워커가 같은 폴더를 써야 함)
+    - timeout: 빈 계정을 기다리는 최대 시간(초)
+    """
+
+    def __init__(self, accounts, lock_dir, timeout=900, poll_interval=1.0, worker_id=None):
+        self.accounts = [a for a in accounts if a.username and a.password]
+        self.lock_dir = lock_dir
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "master")
+        self.account = None
+        self._fh = None
+
+    def _lock_path(self, account):
+        key = hashlib.sha1(account.username.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.lock_dir, f"{key}.lock")
+
+    def _candidates(self):
+        # 워커마다 시작 위치를 다르게 해서 처음부터 같은 계정을 두고 경쟁하지 않게 함
+        if not self.accounts:
+            return []
+        start = _worker_index(self.worker_id) % len(self.accounts)
+        return self.accounts[start:] + self.accounts[:start]
+
+    def acquire(self):
+        """빈 계정을 하나 잠그고 반환. timeout 안에 못 구하면 TimeoutError"""
+        if self.account:
+            return self.account
+        if not self.accounts:
+            raise ValueError("임대할 수 있는 계정이 없습니다 (.env의 ADMINn_USERNAME/PASSWORD 확인)")
+
+        os.makedirs(self.lock_dir, exist_ok=True)
+        deadline = time.monotonic() + self.timeout
+        waiting_logged = False
+
+        while True:
+            for account in self._candidates():
+                fh = open(self._lock_path(account), "a+")
+                if _try_lock(fh):
+                    # 누가 잡고 있는지 진단용으로 기록
+                    fh.seek(0)
+                    fh.truncate()
+                    fh.write(f"{self.worker_id} pid={os.getpid()}\n")
+                    fh.flush()
+                    self.account, self._fh = account, fh
+                    print(f"[계정 임대] {self.worker_id} → {account.description}")
+                    return account
+                fh.close()
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"{self.timeout}초 동안 빈 계정이 없습니다 "
+                    f"(계정 {len(self.accounts)}개, 워커: {self.worker_id})"
+                )
+            if not waiting_logged:
+                print(f"[계정 임대] {self.worker_id}: 모든 계정 사용 중 → 대기")
+                waiting_logged = True
+            time.sleep(self.poll_interval)
+
+    def release(self):
+        """계정 반납 (여러 번 호출해도 안전)"""
+        if not self._fh:
+            return
+        _unlock(self._fh)
+        self._fh.close()
+        print(f"[계정 임대] {self.worker_id} 반납 → {self.account.description}")
+        self.account, self._fh = None, None
@@ -3,11 +3,70 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# 로컬 대역 앱 (tests/helpers/standin): 실제 서비스 대신 127.0.0.1에 띄운 앱으로 스위트 실행
+# xdist 워커마다 포트를 하나씩 비켜서 따로 띄움 (gw0 → STANDIN_PORT, gw1 → +1 ...)
+STANDIN_APP = os.getenv("STANDIN_APP", "0") == "1"
+STANDIN_PORT = int(os.getenv("STANDIN_PORT", "8765")) + int(os.getenv("PYTEST_XDIST_WORKER", "gw0")[2:] or 0)
+STANDIN_ORIGIN = f"http://127.0.0.1:{STANDIN_PORT}"
+
+if STANDIN_APP:
+    # 대역 앱은 아무 계정이나 통과하므로 계정 환경변수가 없어도 돌 수 있게 기본값 지정
+    for _n in (1, 2, 3):
+        os.environ.setdefault(f"ADMIN{_n}_USERNAME", f"qa{_n}@standin.local")
+        os.environ.setdefault(f"ADMIN{_n}_PASSWORD", "standin")
+
 # 기본 설정
-BASE_URL = os.getenv("BASE_URL", "https://qaproject.elice.io/ai-helpy-chat")
-DEFAULT_TIMEOUT = int(os.getenv("TIMEOUT", "10"))
+BASE_URL = os.getenv("BASE_URL", f"{STANDIN_ORIGIN}/ai-helpy-chat" if STANDIN_APP else "https://qaproject.elice.io/ai-helpy-chat")
+LOGIN_URL = os.getenv("LOGIN_URL", f"{STANDIN_ORIGIN}/accounts/signin/me" if STANDIN_APP else "https://accounts.elice.io/accounts/signin/me")
+DEFAULT_TIMEOUT = int(os.getenv("TIMEOUT", "30"))  # 요소 대기 기본값이자 적응형 타임아웃 상한 (초)
 HEADLESS = os.getenv("HEADLESS", "0") == "1"
 
+# 요소 대기 방식: event(MutationObserver 기반, 기본) / poll(기존 WebDriverWait 0.5초 폴링)
+WAIT_BACKEND = os.getenv("WAIT_BACKEND", "event")
+
+# 적응형 타임아웃: locator별 실제 대기 시간 기록 → p99 × 배수 (ADAPTIVE_TIMEOUT_MIN ~ DEFAULT_TIMEOUT 사이)
+ADAPTIVE_TIMEOUTS = os.getenv("ADAPTIVE_TIMEOUTS", "1") == "1"
+TIMING_STORE_PATH = os.getenv("TIMING_STORE_PATH")  # 없으면 실행 대상별 기본 파일 (timing_store.store_path)
+ADAPTIVE_TIMEOUT_FACTOR = float(os.getenv("ADAPTIVE_TIMEOUT_FACTOR", "3"))
+ADAPTIVE_TIMEOUT_MIN = float(os.getenv("ADAPTIVE_TIMEOUT_MIN", "5"))  # 초
+ADAPTIVE_MIN_SAMPLES = int(os.getenv("ADAPTIVE_MIN_SAMPLES", "10"))
+
+# 스트리밍 응답 종료 판정 (ms): 툴바/중지 버튼 신호가 있으면 SETTLE, 없으면 QUIET 동안 글자 변화가 없을 때 종료
+RESPONSE_QUIET_MS = int(os.getenv("RESPONSE_QUIET_MS", "1500"))
+RESPONSE_SETTLE_MS = int(os.getenv("RESPONSE_SETTLE_MS", "300"))
+RESPONSE_COMPLETION_TIMEOUT = float(os.getenv("RESPONSE_COMPLETION_TIMEOUT", "180"))  # 첫 글자 → 완료 한도 (초)
+
+# 채팅 지연 벤치마크 (tests/chat_basic 성능 테스트)
+BENCHMARK_ENABLED = os.getenv("CHAT_BENCH", "0") == "1"  # 지연 벤치마크는 요청이 많아 opt-in
+BENCHMARK_PROMPTS = os.getenv("BENCHMARK_PROMPTS")  # 프롬프트 파일 경로 (없으면 src/resources/benchmark_prompts.txt)
+BENCHMARK_ITERATIONS = int(os.getenv("BENCHMARK_ITERATIONS", "3"))
+BENCHMARK_WARMUP = int(os.getenv("BENCHMARK_WARMUP", "1"))
+BENCHMARK_TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "0.2"))  # 기준선 대비 허용 증가율
+BENCHMARK_DIR = os.getenv("BENCHMARK_DIR", "reports/benchmarks")
+BENCHMARK_UPDATE_BASELINE = os.getenv("BENCHMARK_UPDATE_BASELINE", "0") == "1"
+
+# 동시 세션 부하 생성 (LOAD_SESSIONS=0이면 부하 테스트 생략)
+LOAD_SESSIONS = int(os.getenv("LOAD_SESSIONS", "0"))
+LOAD_RAMP_UP_S = float(os.getenv("LOAD_RAMP_UP_S", "60"))
+LOAD_STEADY_S = float(os.getenv("LOAD_STEADY_S", "300"))
+LOAD_RATE_PER_MIN = float(os.getenv("LOAD_RATE_PER_MIN", "2"))  # 세션당 분당 전송 수
+LOAD_BUCKET_S = float(os.getenv("LOAD_BUCKET_S", "10"))
+LOAD_MAX_ERROR_RATE = float(os.getenv("LOAD_MAX_ERROR_RATE", "0.05"))
+
+# 브라우저 없는 채팅 API 클라이언트: 브라우저로 찾아 둔 채팅 엔드포인트 저장 위치
+CHAT_ENDPOINT_PATH = os.getenv("CHAT_ENDPOINT_PATH", ".cache/chat_endpoint.json")
+
+# API 트래픽 녹화/재생: off(실제 서버) / record(테스트별 카세트 저장) / replay(카세트로 응답)
+TRAFFIC_MODE = os.getenv("TRAFFIC_MODE", "off")
+TRAFFIC_CASSETTE_DIR = os.getenv("TRAFFIC_CASSETTE_DIR", "tests/cassettes")
+TRAFFIC_REPLAY_TIMING = os.getenv("TRAFFIC_REPLAY_TIMING", "original")  # original / zero
+TRAFFIC_REPLAY_MISSING = os.getenv("TRAFFIC_REPLAY_MISSING", "fail")    # 카세트에 없는 요청: fail / live
+
+# 로그인 세션 캐시 (쿠키 + localStorage/sessionStorage 스냅샷)
+SESSION_CACHE = os.getenv("SESSION_CACHE", "1") == "1"
+SESSION_CACHE_DIR = os.getenv("SESSION_CACHE_DIR", ".cache/sessions")
+SESSION_CACHE_TTL = int(os.getenv("SESSION_CACHE_TTL", "1800"))  # 초
+
 # ========================================
 # 관리자 계정 설정                          ------(11/13 황지애 추가)
 # ========================================
@@ -41,12 +100,63 @@ ADMIN3 = AdminAccount(
     description="관리자 3"
 )
 
-ALL_ADMINS = [ADMIN1, ADMIN2, ADMIN3]
+# ADMIN4_USERNAME / ADMIN4_PASSWORD ... 처럼 번호를 이어서 추가하면 병렬 실행용 계정으로 함께 사용
+def _load_extra_admins(start=4):
+    extras = []
+    n = start
+    while os.getenv(f"ADMIN{n}_USERNAME"):
+        extras.append(AdminAccount(
+            username=os.getenv(f"ADMIN{n}_USERNAME"),
+            password=os.getenv(f"ADMIN{n}_PASSWORD"),
+            description=f"관리자 {n}"
+        ))
+        n += 1
+    return extras
+
+ALL_ADMINS = [ADMIN1, ADMIN2, ADMIN3] + _load_extra_admins()
+
+# ========================================
+# 병렬 실행(pytest-xdist)용 계정 임대
+# ========================================
+
+ACCOUNT_LEASE = os.getenv("ACCOUNT_LEASE", "0") == "1"
+ACCOUNT_LOCK_DIR = os.getenv("ACCOUNT_LOCK_DIR", ".cache/account_locks")
+ACCOUNT_LEASE_TIMEOUT = int(os.getenv("ACCOUNT_LEASE_TIMEOUT", "900"))  # 초
+
+_lease = None
+
+def lease_admin():
+    """
+    현재 프로세스(xdist 워커)가 독점할 계정 반환
+    - 처음 호출 시 빈 계정을 잠그고, 이후에는 같은 계정을 계속 반환
+    - 모든 계정이 사용 중이면 반납될 때까지 대기
+    """
+    global _lease
+    if _lease is None:
+        from src.config.account_lease import AccountLease
+        _lease = AccountLease(ALL_ADMINS, ACCOUNT_LOCK_DIR, timeout=ACCOUNT_LEASE_TIMEOUT)
+    return _lease.acquire()
+
+def lease_extra_admin(label):
+    """
+    같은 프로세스에서 계정이 더 필요할 때(부하 테스트 세션 등) 따로 임대 → 잠금을 잡은 AccountLease
+    - 이 프로세스의 기본 임대 계정, 다른 워커의 계정과 겹치지 않음 / 사용 후 release() 필요
+    """
+    from src.config.account_lease import AccountLease
+    lease = AccountLease(ALL_ADMINS, ACCOUNT_LOCK_DIR, timeout=ACCOUNT_LEASE_TIMEOUT, worker_id=label)
+    lease.acquire()
+    return lease
+
+def release_admin_lease():
+    """임대한 계정 반납 (세션 종료 시 호출, 프로세스가 죽으면 OS가 자동 해제)"""
+    if _lease is not None:
+        _lease.release()
 
 def get_default_admin():
     """
     기본 관리자 계정 반환
     - MY_ADMIN_ACCOUNT 환경변수 있으면 → 고정 계정
+    - xdist 워커이거나 ACCOUNT_LEASE=1 → 워커 전용으로 임대한 계정
     - 없으면 → 랜덤 선택
     """
     import random
@@ -54,11 +164,7 @@ def get_default_admin():
     account_name = os.getenv("MY_ADMIN_ACCOUNT")
     
     if account_name:
-        mapping = {
-            "ADMIN1": ADMIN1,
-            "ADMIN2": ADMIN2,
-            "ADMIN3": ADMIN3
-        }
+        mapping = {f"ADMIN{i}": acc for i, acc in enumerate(ALL_ADMINS, start=1)}
         account = mapping.get(account_name)
         if account:
             print(f"[고정 계정] {account_name} 사용")
@@ -66,6 +172,9 @@ def get_default_admin():
         else:
             print(f"⚠️ 알 수 없는 계정: {account_name}, 랜덤 선택")
     
+    if ACCOUNT_LEASE or os.getenv("PYTEST_XDIST_WORKER"):
+        return lease_admin()
+    
     account = random.choice(ALL_ADMINS)
     print(f"[랜덤 계정] {account.description} 선택")
     return account
@@ -8,6 +8,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
 
+# 로컬 모듈
+from src.config.settings import DEFAULT_TIMEOUT, WAIT_BACKEND
+from src.utils import dom_query, dom_wait, element_proxy, network_tracker, settle, timing_store
+from src.utils.locator_chain import LocatorChain
+
 class BasePage:
 
     # 셀렉터 상수
@@ -22,25 +27,101 @@ class BasePage:
         self.driver.get(url)
         # 웹 페이지 열기
 
-    def wait_for_clickable(self, locator, timeout=30):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
-        )
+    def _wait(self, locator, condition, timeout, poll_condition):
+        """
+        timeout을 직접 넘기면 그 값을, 생략하면 locator별로 학습된 적응형 타임아웃을 사용
+        (학습 전이거나 ADAPTIVE_TIMEOUTS=0이면 DEFAULT_TIMEOUT)
+        실제로 걸린 시간은 timing_store에 기록
+        반환 요소는 ElementProxy (stale 시 자동 재탐색)
+        locator 자리에 LocatorChain을 넘기면 모든 대안을 한 번에 평가
+        """
+        if isinstance(locator, LocatorChain):
+            poll_condition = locator.condition(condition)
 
-    def wait_for_element(self, locator, timeout=30):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
+        store = timing_store.get_store()
+        key = timing_store.locator_key(locator, condition)
+        explicit = timeout is not None
+        if not explicit:
+            timeout = store.timeout_for(key, DEFAULT_TIMEOUT) if store else DEFAULT_TIMEOUT
+
+        start = time.perf_counter()
+        try:
+            result = self._wait_backend(locator, condition, timeout, poll_condition)
+        except TimeoutException:
+            # 일부러 짧게 준 확인용 대기는 학습에서 제외
+            if store and not explicit:
+                store.record(key, time.perf_counter() - start)
+                if timeout < DEFAULT_TIMEOUT:
+                    print(f"[timing] 적응형 타임아웃 {timeout:.1f}s 초과: {key}")
+            raise
+        if store:
+            store.record(key, time.perf_counter() - start)
+
+        # stale 되면 같은 locator로 다시 찾아 쓰는 핸들로 반환
+        if condition == "present_all":
+            return [element_proxy.wrap(el, locator, i) for i, el in enumerate(result)]
+        return element_proxy.wrap(result, locator)
+
+    def _wait_backend(self, locator, condition, timeout, poll_condition):
+        """
+        이벤트 기반 대기(dom_wait) 우선, 주입이 불가능하면 남은 시간 동안 WebDriverWait 폴링
+        WAIT_BACKEND=poll 이면 처음부터 폴링
+        """
+        if WAIT_BACKEND == "event":
+            try:
+                return dom_wait.wait_for(self.driver, locator, condition, timeout)
+            except dom_wait.EventWaitUnavailable as e:
+                timeout = max(e.remaining, 0)
+        return WebDriverWait(self.driver, timeout).until(poll_condition)
+
+    def wait_for_clickable(self, locator, timeout=None):
+        return self._wait(locator, "clickable", timeout, EC.element_to_be_clickable(locator))
+
+    def wait_for_element(self, locator, timeout=None):
+        return self._wait(locator, "visible", timeout, EC.visibility_of_element_located(locator))
         # 단일 요소
         # 화면에 요소가 나타날 때까지 기다림 (locator: 찾고 싶은 버튼/입력창/영역 위치)
 
-    def wait_for_elements(self, locator, timeout=30):
+    def wait_for_present(self, locator, timeout=None):
+        # 화면 표시 여부와 관계없이 DOM에 생길 때까지 대기 (숨겨진 input 등)
+        return self._wait(locator, "present", timeout, EC.presence_of_element_located(locator))
+
+    def wait_for_elements(self, locator, timeout=None):
         # 여러 요소를 기다려서 리스트로 반환
         # locator: (By.CSS_SELECTOR, 'selector') 형태
-        return WebDriverWait(self.driver, timeout).until(
+        return self._wait(
+            locator, "present_all", timeout,
             lambda d: d.find_elements(*locator) if d.find_elements(*locator) else False
         )
 
+    def wait_until_settled(self, quiet_ms=150, timeout=5):
+        """
+        DOM 변경/CSS 애니메이션/fetch·XHR 요청이 quiet_ms 동안 없을 때까지 대기 (고정 sleep 대체)
+        timeout 안에 안정화되지 않아도 예외 없이 False 반환
+        """
+        return settle.wait_until_settled(self.driver, quiet_ms, timeout)
+
+    @property
+    def network(self):
+        """이 드라이버의 NetworkTracker (진행 중 요청 수, 요청 기록 조회)"""
+        return network_tracker.tracker_for(self.driver)
+
+    def wait_for_network_idle(self, filter=None, idle_ms=500, timeout=30, after=None):
+        """
+        filter(URL 패턴)에 맞는 요청이 idle_ms 동안 하나도 진행 중이지 않을 때까지 대기
+        예) mark = self.network.mark(); 전송 클릭; self.wait_for_network_idle("/api/", after=mark)
+        """
+        return self.network.wait_for_network_idle(filter, idle_ms, timeout, after)
+
+    def query_many(self, targets, fields):
+        """
+        여러 요소의 텍스트/속성/스타일/위치/표시 여부를 스크립트 한 번으로 읽기
+        예) self.query_many(self.CHAT_TITLES, ["text", "css:text-overflow"])
+            → [{"text": "...", "css:text-overflow": "ellipsis"}, ...]
+        필드 목록은 src/utils/dom_query.py 참고
+        """
+        return dom_query.query_many(self.driver, targets, fields)
+
     def click(self, locator):
         element = self.wait_for_element(locator)
         element.click()
@@ -123,8 +204,8 @@ class BasePage:
         except TimeoutException as e:
             pytest.fail(f"로그아웃 실패: 프로필 버튼 없음: {e}")
 
-        # 드롭다운 열릴 때까지 대기
-        time.sleep(1)
+        # 드롭다운 열림 애니메이션이 끝날 때까지 대기
+        self.wait_until_settled()
 
         # 2) 로그아웃 버튼 찾기
         # SVG 아이콘으로 찾고 → 부모 요소 클릭
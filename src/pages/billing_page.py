@@ -155,9 +155,14 @@ class BillingPage(BasePage):
             "return getComputedStyle(arguments[0]).backgroundColor;", el
         )
 
+    def hover_props(self, el):
+        """HOVER_PROPS 값을 한 번에 읽기"""
+        record = self.query_many(el, [f"css:{p}" for p in self.HOVER_PROPS])[0]
+        return {p: record[f"css:{p}"] for p in self.HOVER_PROPS}
+
     def any_prop_changed(self, el, before_props):
         """CSS 속성이 변경되었는지 확인"""
-        after = {p: self.get_css(el, p) for p in self.HOVER_PROPS}
+        after = self.hover_props(el)
         changed = any(before_props[p] != after[p] for p in self.HOVER_PROPS)
         return changed, after
 
@@ -171,14 +176,14 @@ class BillingPage(BasePage):
             # 테마가 자주 쓰는 값들
             "opacity", "filter", "backdrop-filter", "transform",
         ]
-        snap = {p: self.get_css(el, p) for p in props}
-        # 의사요소(오버레이)까지 확인
-        snap["::before-bg"] = self.driver.execute_script(
-            "return getComputedStyle(arguments[0],'::before').backgroundColor;", el
-        )
-        snap["::after-bg"] = self.driver.execute_script(
-            "return getComputedStyle(arguments[0],'::after').backgroundColor;", el
-        )
+        # 의사요소(오버레이)까지 한 번에 확인
+        record = self.query_many(el, [f"css:{p}" for p in props] + [
+            "css::before:background-color",
+            "css::after:background-color",
+        ])[0]
+        snap = {p: record[f"css:{p}"] for p in props}
+        snap["::before-bg"] = record["css::before:background-color"]
+        snap["::after-bg"] = record["css::after:background-color"]
         return snap
 
     # ======================
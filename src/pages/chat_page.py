@@ -1,42 +1,89 @@
 # 작성자: 이홍주
 
 import os
-import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 
+from src.api.chat_client import discover_endpoint
 from src.pages.base_page import BasePage
+from src.utils import chat_history
+from src.utils.locator_chain import LocatorChain, css, text, xpath
+from src.utils.response_completion import CompletionDetector
+from src.utils.stream_observer import StreamObserver
 
 
 #import pyperclip
 
-def wait_for_new_response(driver, prev_count, timeout=40):
-    """새로운 챗봇 응답(article)이 로드될 때까지 대기"""
+def wait_for_new_response(driver, prev_count, timeout=40, detector=None, completion_timeout=None):
+    """
+    새로운 챗봇 응답(article)이 끝까지 작성될 때까지 대기
+    (글자가 처음 생긴 시점이 아니라 스트리밍이 끝난 시점 → CompletionDetector 참고)
+    timeout은 첫 글자까지, 그 뒤 완료까지는 completion_timeout(기본 RESPONSE_COMPLETION_TIMEOUT)
+    """
     SELECTOR = 'div[role="article"]'
-    def _new_article_loaded(d):
-        try:
-            articles = d.find_elements(By.CSS_SELECTOR, SELECTOR)
-            if len(articles) <= prev_count:
-                return False
-            latest = articles[-1]
-            text = latest.text.strip()
-
-            return len(text) > 0
-        
-        except StaleElementReferenceException:
-            return False
-
-    WebDriverWait(driver, timeout).until(_new_article_loaded)
+    reason = (detector or CompletionDetector()).wait(driver, prev_count, timeout, completion_timeout)
+    print(f"[response] 응답 완료 ({reason})")
     return driver.find_elements(By.CSS_SELECTOR, SELECTOR)
 
 
 
 class ChatPage(BasePage):
 
+    # 대화 항목(a) 안의 ellipsis 메뉴 버튼 (svg 아이콘을 직접 자식으로 가진 button)
+    MENU_BUTTON_IN_ITEM = chat_history.MENU_SELECTOR
+    # 대화 항목(a) 안의 제목
+    TITLE_IN_ITEM = chat_history.TITLE_SELECTOR
+
+    # 대화 목록/메뉴 locator (대안을 순서대로 한 번에 평가하는 fallback 체인)
+    CHAT_ITEMS = LocatorChain(
+        css('div[data-testid="virtuoso-item-list"] a'),
+        xpath('//div[@data-testid="virtuoso-item-list"]//a'),
+        name="대화 항목",
+    )
+    CHAT_ELLIPSIS_ICON = LocatorChain(
+        css('svg[data-testid="ellipsis-verticalIcon"]'),
+        xpath('//button//*[name()="svg" and @data-testid="ellipsis-verticalIcon"]'),
+        xpath('//*[@id=":rh:"]/div/div/div[1]/div/div/div[1]/a[1]/div[2]/button/svg'),
+        name="대화 ellipsis 아이콘",
+    )
+    RENAME_MENU = (By.XPATH, '//span[text()="Rename"]')
+    RENAME_INPUT = LocatorChain(
+        css('input[type="text"]'),
+        xpath('//*[@id=":r66:"]'),
+        name="이름 변경 입력창",
+    )
+    RENAME_SAVE = LocatorChain(
+        css('button[type="submit"]'),
+        xpath('//*[@id=":r67:"]'),
+        name="이름 변경 저장 버튼",
+    )
+    DELETE_MENU = LocatorChain(
+        css("p.MuiTypography-root.MuiTypography-body1.css-1v3cy5h"),
+        text("Delete", tag="p"),
+        name="Delete 메뉴",
+    )
+    DELETE_CONFIRM = LocatorChain(
+        css("button.MuiButton-containedError"),
+        xpath('//button[contains(@class,"MuiButton-containedError")]'),
+        name="삭제 확인 버튼",
+    )
+    SEARCH_BUTTON = LocatorChain(
+        xpath("//div[@role='button'][.//span[text()='검색']]"),
+        xpath("//svg[@data-testid='magnifying-glassIcon']/ancestor::div[@role='button']"),
+        name="검색 버튼",
+    )
+    SEARCH_INPUT = LocatorChain(css("input[cmdk-input]"), xpath("//input[@cmdk-input]"), name="검색 입력창")
+    SEARCH_RESULTS = LocatorChain(css("[cmdk-item]"), xpath("//div[@cmdk-item]"), name="검색 결과")
+    FIRST_SEARCH_RESULT = LocatorChain(
+        css("[cmdk-item]:first-child"),
+        xpath("(//div[@cmdk-item])[1]"),
+        name="첫 번째 검색 결과",
+    )
+
     def __init__(self, driver: webdriver.Chrome, timeout=15):
         super().__init__(driver, timeout)
         PAGE_DIR = os.path.dirname(os.path.abspath(__file__))  # 현재 폴더 절대 경로로 반환
@@ -63,6 +110,33 @@ class ChatPage(BasePage):
         responses = wait_for_new_response(self.driver, prev_count)
         return responses[-1].text
 
+    def send_message_observed(self, message: str, timeout=60):
+        """
+        메시지 전송 + 스트리밍 응답 측정 → StreamingResult (TTFT, tok/s, 최종 텍스트 등)
+        timeout 안에 응답이 시작되지 않으면 TimeoutException
+        """
+        observer = StreamObserver(self.driver)
+        input_box = self.driver.find_element(By.CSS_SELECTOR, 'textarea:not([aria-hidden="true"])')
+        input_box.send_keys(message)
+
+        observer.install()  # 전송 직전 설치 (입력 중 keydown은 측정에 섞이지 않음)
+        input_box.send_keys("\n")
+
+        result = observer.finish(timeout)
+        if result is None:
+            raise TimeoutException(f"{timeout}초 안에 응답이 시작되지 않았습니다.")
+        print(f"[stream] {result.summary()}")
+        return result
+
+    def discover_chat_endpoint(self, message: str):
+        """
+        메시지를 보내면서 채팅 API 요청을 기록 → ChatEndpoint (브라우저 없는 ChatClient 용)
+        못 찾으면 None
+        """
+        mark = self.network.mark()
+        self.send_message(message)
+        return discover_endpoint(self.network.records(after=mark), message)
+
 
     def click_plus(self): # + 버튼 클릭
         input_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-haspopup='true']")
@@ -71,10 +145,10 @@ class ChatPage(BasePage):
     def file_upload(self, file_name: str): # 파일 업로드 버튼 클릭
         prev_count = len(self.driver.find_elements(By.CSS_SELECTOR, 'div[role="article"]'))
         
-        file_input = WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="file"]')))
+        file_input = self.wait_for_present((By.CSS_SELECTOR, 'input[type="file"]'))
         file_path = os.path.join(self.resource_dir, file_name)
         file_input.send_keys(file_path)
-        WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located((By.XPATH,f"//span[contains(@class, 'truncate') and contains(text(), '{os.path.basename(file_path)}')]")))
+        self.wait_for_element((By.XPATH,f"//span[contains(@class, 'truncate') and contains(text(), '{os.path.basename(file_path)}')]"))
 
 
         input_box = self.driver.find_element(By.CSS_SELECTOR, 'textarea:not([aria-hidden="true"])')
@@ -93,14 +167,10 @@ class ChatPage(BasePage):
         clipboard_button.click()
     
     def click_thumbs_up(self): # 도움됨 버튼 클릭
-        thumbs_up_button = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button:has(svg.lucide-thumbs-up)")))
+        thumbs_up_button = self.wait_for_clickable((By.CSS_SELECTOR, "button:has(svg.lucide-thumbs-up)"))
         thumbs_up_button.click()
         
-        dialog = WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, "div[role='dialog'][data-state='open']")
-            )
-        )
+        dialog = self.wait_for_element((By.CSS_SELECTOR, "div[role='dialog'][data-state='open']"))
         dialog.find_element(
             By.XPATH,
             ".//h2/span"
@@ -108,23 +178,17 @@ class ChatPage(BasePage):
 
 
     def click_thumbs_down(self): # 도움안됨 버튼 클릭
-        thumbs_down_button = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button:has(svg.lucide-thumbs-down)")))
+        thumbs_down_button = self.wait_for_clickable((By.CSS_SELECTOR, "button:has(svg.lucide-thumbs-down)"))
         thumbs_down_button.click()
 
-        dialog = WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, "div[role='dialog'][data-state='open']")
-            )
-        )
+        dialog = self.wait_for_element((By.CSS_SELECTOR, "div[role='dialog'][data-state='open']"))
         dialog.find_element(
             By.XPATH,
             ".//h2/span"
         )
 
     def send_feedback(self, message: str): # 피드백 입력
-        dialog = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "//div[@role='dialog' and @data-state='open']"))
-        )
+        dialog = self.wait_for_present((By.XPATH, "//div[@role='dialog' and @data-state='open']"))
 
         input_box = dialog.find_element(By.TAG_NAME, "textarea")
     
@@ -140,19 +204,13 @@ class ChatPage(BasePage):
         input_button.click()
 
     def click_edit(self): # 수정 제출 버튼 클릭
-        wait = WebDriverWait(self.driver, 10)
-
         # 1. 버튼의 부모 .group 요소를 hover (group-hover 때문에 필요)
-        group_area = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".group"))
-        )
+        group_area = self.wait_for_present((By.CSS_SELECTOR, ".group"))
 
         ActionChains(self.driver).move_to_element(group_area).perform()
 
         # 2. hover 후 visible 되는 edit-message 버튼 클릭
-        button = wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "button.edit-message"))
-        )
+        button = self.wait_for_clickable((By.CSS_SELECTOR, "button.edit-message"))
         button.click()
 
     def edit_message(self, message: str): # 메시지 입력
@@ -199,10 +257,8 @@ class ChatPage(BasePage):
         return moved_to_top and moved_to_bottom
     
     def reset_chat(self):
-        wait = WebDriverWait(self.driver, 10)
-    
         # ① 'pen-to-square' 아이콘을 가진 svg 찾기
-        svg_icon = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "svg[data-icon='pen-to-square']")))
+        svg_icon = self.wait_for_present((By.CSS_SELECTOR, "svg[data-icon='pen-to-square']"))
 
         # ② svg 아이콘을 포함한 상위 li (role=button)로 올라가 클릭
         new_chat_button = svg_icon.find_element(By.XPATH, "./ancestor::div[@role='button']")
@@ -242,7 +298,7 @@ class ChatPage(BasePage):
     
         
     def click_image_popup(self):    
-        img = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.XPATH, "//img[contains(@src, 'tools_outputs')]")))
+        img = self.wait_for_clickable((By.XPATH, "//img[contains(@src, 'tools_outputs')]"))
 
 
         img.click()
@@ -250,23 +306,15 @@ class ChatPage(BasePage):
     def wait_image_popup(self, timeout=5):
         """이미지 클릭 후 팝업이 실제로 열렸는지 검증"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, "//div[@role='dialog' and @data-state='open']")
-                )
-            )
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//body[contains(@style,'pointer-events: none')]")
-                )
-            )
+            self.wait_for_element((By.XPATH, "//div[@role='dialog' and @data-state='open']"), timeout)
+            self.wait_for_present((By.XPATH, "//body[contains(@style,'pointer-events: none')]"), timeout)
             return True
 
         except:
             return False
     
     def close_image_popup(self):
-        input_button = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.XPATH, "//button[@aria-label='Close lightbox']")))
+        input_button = self.wait_for_clickable((By.XPATH, "//button[@aria-label='Close lightbox']"))
         input_button.click()
 
     def click_image_quiz(self):
@@ -276,77 +324,64 @@ class ChatPage(BasePage):
 
 # 이하 작성자: 김은아 ==============================================
 
-    def get_chat_list(self, timeout=10):
+    def get_chat_list(self, timeout=None, limit=None):
         """
-        사이드바의 채팅 히스토리 목록 강제 로드 + chat_items 반환
-        마지막까지 스크롤해서 모든 항목을 가져오도록 수정
+        사이드바의 채팅 히스토리 목록 → ChatHistorySnapshot (id/제목/위치 등 값만 담은 불변 목록)
+        가상 스크롤 목록을 한 화면씩 내리며 끝까지(또는 limit개까지) 읽는다.
+        클릭 등 요소가 필요하면 resolve_chat(entry)
         """
-        # 대화 목록 전체 컨테이너 대기
-        container = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="virtuoso-item-list"]'))
-        )
+        snapshot = self.get_chat_snapshot(limit, timeout)
 
-        # 반복 스크롤: 마지막까지 DOM 렌더링
-        prev_height = -1
-        while True:
-            self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", container)
-            time.sleep(0.5)  # 렌더링 안정화
-            curr_height = self.driver.execute_script("return arguments[0].scrollHeight", container)
-            if curr_height == prev_height:
-                break
-            prev_height = curr_height
-
-        # a 태그(대화 항목) 요소 가져오기
-        chat_items = WebDriverWait(self.driver, timeout).until(
-            lambda d: container.find_elements(By.TAG_NAME, "a")
-            if len(container.find_elements(By.TAG_NAME, "a")) > 0
-            else False
-        )
+        assert len(snapshot) > 0, "대화 항목이 존재하지 않습니다."
+        print(f"[BasePage] 대화 목록이 {len(snapshot)}개 있습니다.")
 
-        assert len(chat_items) > 0, "대화 항목이 존재하지 않습니다."
-        print(f"[BasePage] 대화 목록이 {len(chat_items)}개 있습니다.")
+        return snapshot
 
-        return chat_items
+    def iter_chat_history(self, timeout=None, **kwargs):
+        """
+        대화 목록을 위에서부터 한 화면씩 내리며 ChatHistoryEntry를 바로 yield
+        필요한 항목을 찾으면 break 하면 되고, 그 아래는 스크롤하지 않는다. (src/utils/chat_history.py 참고)
+        """
+        self.wait_for_present((By.CSS_SELECTOR, chat_history.LIST_SELECTOR), timeout)
+        return chat_history.iter_chat_history(self.driver, **kwargs)
+
+    def get_chat_snapshot(self, limit=None, timeout=None):
+        """대화 목록 스냅샷 (limit개를 채우면 더 스크롤하지 않음, 목록이 비어 있어도 예외 없음)"""
+        self.wait_for_present((By.CSS_SELECTOR, chat_history.LIST_SELECTOR), timeout)
+        return chat_history.ChatHistorySnapshot.capture(self.driver, limit)
+
+    def find_chat(self, title, exact=True, timeout=None):
+        """제목이 일치하는(exact=False면 포함하는) 첫 대화 항목, 없으면 None"""
+        for entry in self.iter_chat_history(timeout):
+            if entry.title == title or (not exact and title in entry.title):
+                return entry
+        return None
+
+    def resolve_chat(self, entry):
+        """스냅샷 항목 → 화면 가운데로 꺼낸 대화 링크(a) 요소"""
+        element = chat_history.resolve_entry(self.driver, entry)
+        assert element is not None, f"대화 항목을 화면에서 찾을 수 없습니다: {entry.title} ({entry.id})"
+        return element
 
     # -------------------- 11/14 김은아 추가 --------------------
 
-    def get_menu_buttons(self):
-        chat_items = self.get_chat_list()
-        menu_buttons = []
-
-        for item in chat_items:
-            # svg 아이콘 먼저 찾기
-            svg = item.find_elements(
-                By.CSS_SELECTOR,
-                "button.MuiIconButton-root svg[data-testid='ellipsis-verticalIcon']"
-            )
-            if svg:
-                # svg의 부모 = button
-                menu_buttons.append(svg[0].find_element(By.XPATH, "./.."))
-
-        return menu_buttons
+    def get_menu_buttons(self, target=None, timeout=None):
+        """
+        대화 항목의 ellipsis 메뉴 버튼 목록 (목록 전체를 스크롤하지 않고 스크립트 한 번으로 조회)
+        target: 없으면 지금 그려진 모든 항목 / 위치(int)·제목(str)·ChatHistoryEntry면 그 항목만 화면에 꺼내서 [버튼]
+        """
+        self.wait_for_present(self.CHAT_ITEMS, timeout)
+        buttons = chat_history.find_menu_buttons(self.driver, target)
+        print(f"[chat_history] 메뉴 버튼 {len(buttons)}개" + (f" (대상: {target})" if target is not None else ""))
+        return buttons
 
     def get_popup_buttons(self):
         # 메뉴 클릭 후 뜨는 Rename / Delete li 요소
-        wait = WebDriverWait(self.driver, 10)
-        rename_button = wait.until(
-            EC.element_to_be_clickable(
-                (By.XPATH, "//li//span[text()='Rename']")
-            )
-        )
-        delete_button = wait.until(
-            EC.element_to_be_clickable(
-                (By.XPATH, "//li//p[text()='Delete']")
-            )
-        )
+        rename_button = self.wait_for_clickable((By.XPATH, "//li//span[text()='Rename']"))
+        delete_button = self.wait_for_clickable((By.XPATH, "//li//p[text()='Delete']"))
         return rename_button, delete_button
 
     def click_delete_popup(self):
         # 마지막 Delete 버튼 (팝업 안)
-        wait = WebDriverWait(self.driver, 10)
-        final_delete = wait.until(
-            EC.element_to_be_clickable(
-                (By.CSS_SELECTOR, "button[id*=':r'][type='button']")
-            )
-        )
+        final_delete = self.wait_for_clickable((By.CSS_SELECTOR, "button[id*=':r'][type='button']"))
         final_delete.click()
\ No newline at end of file
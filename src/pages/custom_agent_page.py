@@ -1,11 +1,12 @@
 from src.pages.base_page import BasePage
+from src.config.settings import BASE_URL
 
 
 class CustomAgentPage(BasePage):
     """커스텀 에이전트 페이지 관련 기능"""
 
     def open_custom_agent(self):
-        self.open("https://qaproject.elice.io/ai-helpy-chat/custom-agent")
+        self.open(f"{BASE_URL}/custom-agent")
 
 # ------------------- 11/18 커스텀 페이지 로그인 파트 추가 (김은아) -------------------
 
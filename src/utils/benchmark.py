@@ -0,0 +1,164 @@
+"""
+채팅 응답 지연 벤치마크
+
+프롬프트 목록(corpus)을 iterations번 반복해 보내고, 응답마다
+- ttft_ms: 전송 → 첫 글자 (StreamingResult.ttft_ms)
+- complete_ms: 전송 → 응답 완료 (StreamingResult.total_ms)
+를 모아 p50/p90/p95/p99, min/max, 평균, 표준편차로 요약한다.
+warmup회는 먼저 보내되 집계에서 뺀다. (첫 요청의 연결/캐시 비용 제외)
+
+    runner = ChatBenchmark(ChatPage(driver), load_prompts(), iterations=5, warmup=1)
+    report = runner.run()
+    regressions = compare_to_baseline(report, load_report(BASELINE_PATH))
+
+기준선(baseline) 비교: 지표별 p50/p95가 기준선 × (1 + tolerance)를 넘으면 회귀로 본다.
+기준선 파일이 없으면 비교하지 않으며, BENCHMARK_UPDATE_BASELINE=1로 실행하면 이번 결과를 기준선으로 저장한다.
+"""
+
+import json
+import os
+import statistics
+import time
+from datetime import datetime
+from typing import NamedTuple
+
+from selenium.common.exceptions import TimeoutException
+
+from src.utils.timing_store import percentile
+
+METRICS = ("ttft_ms", "complete_ms")
+GATED_STATS = ("p50", "p95")
+
+RESOURCE_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "resources"))
+DEFAULT_PROMPTS_PATH = os.path.join(RESOURCE_DIR, "benchmark_prompts.txt")
+
+
+class LatencyStats(NamedTuple):
+    count: int
+    min: float
+    max: float
+    mean: float
+    stddev: float
+    p50: float
+    p90: float
+    p95: float
+    p99: float
+
+
+def summarize(samples):
+    """지연 표본(ms) → LatencyStats (표본이 없으면 None)"""
+    if not samples:
+        return None
+    return LatencyStats(
+        count=len(samples),
+        min=round(min(samples), 1),
+        max=round(max(samples), 1),
+        mean=round(statistics.fmean(samples), 1),
+        stddev=round(statistics.stdev(samples), 1) if len(samples) > 1 else 0.0,
+        p50=round(percentile(samples, 50), 1),
+        p90=round(percentile(samples, 90), 1),
+        p95=round(percentile(samples, 95), 1),
+        p99=round(percentile(samples, 99), 1),
+    )
+
+
+def load_prompts(path=None):
+    """한 줄에 프롬프트 하나 (빈 줄, #으로 시작하는 줄 제외)"""
+    with open(path or DEFAULT_PROMPTS_PATH, encoding="utf-8") as f:
+        prompts = [line.strip() for line in f]
+    return [p for p in prompts if p and not p.startswith("#")]
+
+
+def load_report(path):
+    """저장된 리포트/기준선 (없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_report(report, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def compare_to_baseline(report, baseline, tolerance=0.2):
+    """기준선보다 (1 + tolerance)배 넘게 느려진 항목: [(지표, 통계, 기준선 값, 이번 값)]"""
+    if not baseline:
+        return []
+    regressions = []
+    for metric in METRICS:
+        now = report["metrics"].get(metric)
+        before = baseline.get("metrics", {}).get(metric)
+        if not now or not before:
+            continue
+        for stat in GATED_STATS:
+            if now[stat] > before[stat] * (1 + tolerance):
+                regressions.append((metric, stat, before[stat], now[stat]))
+    return regressions
+
+
+class ChatBenchmark:
+
+    def __init__(self, chat, prompts, iterations=5, warmup=1, timeout=60, fresh_chat=True):
+        """
+        chat: 로그인해서 채팅 화면이 열린 ChatPage
+        fresh_chat: 매 요청 전에 새 대화 시작 (대화가 길어지며 생기는 지연 증가를 배제)
+        """
+        if not prompts:
+            raise ValueError("프롬프트가 하나 이상 필요합니다")
+        self.chat = chat
+        self.prompts = list(prompts)
+        self.iterations = iterations
+        self.warmup = warmup
+        self.timeout = timeout
+        self.fresh_chat = fresh_chat
+
+    def _send(self, prompt):
+        if self.fresh_chat:
+            self.chat.reset_chat()
+        return self.chat.send_message_observed(prompt, self.timeout)
+
+    def run(self):
+        samples, errors = [], []
+        for i in range(self.warmup):
+            prompt = self.prompts[i % len(self.prompts)]
+            try:
+                self._send(prompt)
+            except TimeoutException as e:  # 예열 실패도 기록만 하고 측정은 계속
+                errors.append({"iteration": "warmup", "prompt": prompt, "error": str(e)})
+
+        started = time.monotonic()
+        for iteration in range(self.iterations):
+            for prompt in self.prompts:
+                try:
+                    result = self._send(prompt)
+                except TimeoutException as e:
+                    errors.append({"iteration": iteration, "prompt": prompt, "error": str(e)})
+                    continue
+                if not result.completed:
+                    errors.append({"iteration": iteration, "prompt": prompt, "error": "응답 미완료"})
+                    continue
+                samples.append({
+                    "iteration": iteration,
+                    "prompt": prompt,
+                    "ttft_ms": result.ttft_ms,
+                    "complete_ms": result.total_ms,
+                    "tokens_per_sec": result.tokens_per_sec,
+                })
+
+        metrics = {}
+        for metric in METRICS:
+            stats = summarize([s[metric] for s in samples])
+            metrics[metric] = stats._asdict() if stats else None
+        return {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "iterations": self.iterations,
+            "warmup": self.warmup,
+            "prompts": self.prompts,
+            "duration_s": round(time.monotonic() - started, 1),
+            "metrics": metrics,
+            "errors": errors,
+            "samples": samples,
+        }
@@ -0,0 +1,338 @@
+"""
+가상 스크롤(Virtuoso) 대화 목록을 화면 단위로 훑으며 읽기
+
+Virtuoso는 보이는 범위(+여유분)의 행만 DOM에 그리므로, 끝까지 스크롤한 뒤 find_elements("a")를 하면
+마지막 화면 근처의 항목만 남고 목록이 길수록 스크롤 대기만 늘어난다.
+iter_chat_history()는 스크롤 컨테이너를 한 화면씩 내리면서, 단계마다 스크립트 한 번으로
+"지금 그려진 행"의 href/제목/시각/위치를 읽고 대화 id로 중복을 걸러 새 항목만 바로 yield 한다.
+
+    for entry in iter_chat_history(driver):
+        if entry.title == "찾는 대화":
+            break            # 필요한 만큼만 읽고 멈춤 (남은 목록은 스크롤하지 않음)
+
+- 한 단계 = 스크립트 1회: (스크롤) → 목록 DOM이 다시 그려질 때까지 대기 → 그려진 행 읽기
+- 끝에 닿았는데 새 항목이 없으면 UI 안정화(추가 페이지 로드)를 한 번 기다려 보고, 그래도 없으면 종료
+- 행은 ChatHistoryEntry (position = data-index, 없으면 읽은 순서)
+
+WebElement 목록을 들고 다니면 .text / find_element 마다 왕복이 생기고 가상 스크롤로 금방 stale 해진다.
+ChatHistorySnapshot은 읽어 둔 값만 가진 불변 목록이고, 클릭 등 동작이 필요할 때만
+resolve_entry()로 해당 행을 화면에 그리게 한 뒤 요소를 찾는다.
+
+    before = ChatHistorySnapshot.capture(driver)
+    ... 이름 변경 ...
+    after = ChatHistorySnapshot.capture(driver, limit=10)
+    after.by_id(entry.id).title, before.diff(after).renamed
+"""
+
+from typing import NamedTuple, Optional
+
+from src.utils import settle
+
+LIST_SELECTOR = '[data-testid="virtuoso-item-list"]'
+ROW_LINK_SELECTOR = "a[href]"
+TITLE_SELECTOR = "p.MuiTypography-root.MuiTypography-inherit"
+MENU_SELECTOR = "button.MuiIconButton-root:has(> svg[data-testid='ellipsis-verticalIcon'])"
+
+# 목록 컨테이너 / 스크롤 컨테이너 / 행 읽기 (아래 스크립트들이 공통으로 사용)
+LIST_HELPERS_JS = """
+const list = document.querySelector(listSelector);
+
+// 목록을 감싼 실제 스크롤 컨테이너 (없으면 문서 자체)
+function findScroller() {
+    let el = list.parentElement;
+    while (el && el !== document.body) {
+        const style = getComputedStyle(el);
+        if (/(auto|scroll)/.test(style.overflowY) && el.scrollHeight > el.clientHeight) return el;
+        el = el.parentElement;
+    }
+    return document.scrollingElement;
+}
+
+function conversationId(a) {
+    return a.getAttribute('href').split(/[?#]/)[0].replace(/\\/+$/, '').split('/').pop();
+}
+
+function position(a) {
+    const holder = a.closest('[data-index]');
+    return holder ? Number(holder.getAttribute('data-index')) : null;
+}
+
+function titleOf(a) {
+    const el = a.querySelector(titleSelector);
+    return ((el || a).innerText || '').trim();
+}
+"""
+
+HARVEST_SCRIPT = """
+const [listSelector, linkSelector, titleSelector, menuSelector, stepRatio, reset, renderMs] = arguments;
+const done = arguments[arguments.length - 1];
+""" + LIST_HELPERS_JS + """
+if (!list) return done(null);
+const scroller = findScroller();
+
+function readRows() {
+    return Array.from(list.querySelectorAll(linkSelector), a => {
+        const time = a.querySelector('time[datetime]');
+        const stamp = a.querySelector('[data-timestamp]');
+        return {
+            id: conversationId(a),
+            href: a.href,
+            title: titleOf(a),
+            timestamp: time ? time.getAttribute('datetime') : stamp ? stamp.getAttribute('data-timestamp') : null,
+            position: position(a),
+            hasMenu: !!a.querySelector(menuSelector),
+        };
+    });
+}
+
+function finish() {
+    done({
+        rows: readRows(),
+        atEnd: scroller.scrollTop + scroller.clientHeight >= scroller.scrollHeight - 2,
+        scrollTop: scroller.scrollTop,
+    });
+}
+
+const before = scroller.scrollTop;
+if (reset) scroller.scrollTop = 0;
+else if (stepRatio > 0) scroller.scrollTop = before + Math.max(1, scroller.clientHeight * stepRatio);
+if (scroller.scrollTop === before) return finish();
+
+// 스크롤 후 목록이 다시 그려지면 다음 프레임에 읽음 (변화가 없으면 renderMs 뒤에 읽음)
+let finished = false;
+const settle = () => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    requestAnimationFrame(() => requestAnimationFrame(finish));
+};
+const observer = new MutationObserver(settle);
+observer.observe(list, {childList: true, subtree: true, attributes: true, characterData: true});
+setTimeout(settle, renderMs);
+"""
+
+# 대상 행(id / position / title 중 주어진 것) 하나를 화면 가운데로 꺼내서 링크(a)와 ellipsis 버튼 반환
+# 그려져 있지 않고 position을 알면, 그려진 행 높이로 위치를 추정해서 스크롤한 뒤 다시 찾음
+REVEAL_SCRIPT = """
+const [listSelector, linkSelector, titleSelector, menuSelector, target, renderMs] = arguments;
+const done = arguments[arguments.length - 1];
+""" + LIST_HELPERS_JS + """
+if (!list) return done(null);
+
+function matches(a) {
+    if (target.id != null) return conversationId(a) === target.id;
+    if (target.position != null) return position(a) === target.position;
+    return titleOf(a) === target.title;
+}
+
+function findLink() {
+    for (const a of list.querySelectorAll(linkSelector)) if (matches(a)) return a;
+    return null;
+}
+
+function reveal(a) {
+    a.scrollIntoView({block: 'center'});
+    done({link: a, menu: a.querySelector(menuSelector)});
+}
+
+const found = findLink();
+if (found) return reveal(found);
+const sample = list.querySelector('[data-index]');
+if (target.position == null || !sample) return done(null);
+
+const scroller = findScroller();
+scroller.scrollTop = Math.max(0, target.position * sample.offsetHeight - scroller.clientHeight / 2);
+const start = performance.now();
+(function retry() {
+    const a = findLink();
+    if (a) return reveal(a);
+    if (performance.now() - start > renderMs) return done(null);
+    requestAnimationFrame(retry);
+})();
+"""
+
+# 지금 그려진 모든 행의 ellipsis 버튼 (행 순서대로, 버튼이 없는 행은 제외)
+MENU_BUTTONS_SCRIPT = """
+const [listSelector, linkSelector, menuSelector] = arguments;
+const list = document.querySelector(listSelector);
+if (!list) return [];
+return Array.from(list.querySelectorAll(linkSelector), a => a.querySelector(menuSelector)).filter(Boolean);
+"""
+
+
+class ChatHistoryEntry(NamedTuple):
+    """대화 목록 한 행 (읽은 시점의 값, 요소는 들고 있지 않음)"""
+    id: str
+    href: str
+    title: str
+    position: int
+    has_menu: bool
+    timestamp: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(row["id"], row["href"], row["title"], row["position"], row["hasMenu"], row["timestamp"])
+
+
+class SnapshotDiff(NamedTuple):
+    added: list      # 새로 생긴 항목 (after 기준)
+    removed: list    # 사라진 항목 (before 기준)
+    renamed: list    # 제목이 바뀐 항목 (before, after) 쌍
+
+    @property
+    def empty(self):
+        return not (self.added or self.removed or self.renamed)
+
+
+class ChatHistorySnapshot:
+    """
+    대화 목록 스냅샷 (위에서부터 순서대로)
+    complete: 목록 끝까지 읽었으면 True, limit으로 중간에 멈췄으면 False
+    """
+
+    def __init__(self, entries, complete=True):
+        self.entries = tuple(entries)
+        self.complete = complete
+        self._by_id = {e.id: e for e in self.entries}
+
+    @classmethod
+    def capture(cls, driver, limit=None, **kwargs):
+        entries = []
+        for entry in iter_chat_history(driver, **kwargs):
+            entries.append(entry)
+            if limit is not None and len(entries) >= limit:
+                return cls(entries, complete=False)
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, index):
+        return self.entries[index]
+
+    def __contains__(self, conversation_id):
+        return conversation_id in self._by_id
+
+    def __repr__(self):
+        return f"<ChatHistorySnapshot {len(self.entries)}개{'' if self.complete else ' (일부)'}>"
+
+    @property
+    def first(self):
+        return self.entries[0] if self.entries else None
+
+    @property
+    def ids(self):
+        return [e.id for e in self.entries]
+
+    @property
+    def titles(self):
+        return [e.title for e in self.entries]
+
+    def by_id(self, conversation_id):
+        return self._by_id.get(conversation_id)
+
+    def by_title(self, title, exact=True):
+        """제목이 일치하는(exact=False면 포함하는) 첫 항목"""
+        return next((e for e in self.entries if e.title == title or (not exact and title in e.title)), None)
+
+    def diff(self, other):
+        """self(이전) → other(이후) 변화 (둘 중 하나가 일부만 읽은 스냅샷이면 겹치는 범위만 의미 있음)"""
+        added = [e for e in other if e.id not in self]
+        removed = [e for e in self if e.id not in other]
+        renamed = [(e, other.by_id(e.id)) for e in self if e.id in other and other.by_id(e.id).title != e.title]
+        return SnapshotDiff(added, removed, renamed)
+
+
+def reveal_row(driver, target, render_ms=1000, list_selector=LIST_SELECTOR, title_selector=TITLE_SELECTOR):
+    """
+    target(dict: id / position / title 중 하나 이상)에 해당하는 행을 화면 가운데로 꺼냄
+    반환: {"link": a 요소, "menu": ellipsis 버튼 또는 None}, 찾지 못하면 None
+    (title만 주면 지금 그려진 행에서만 찾음)
+    """
+    return driver.execute_async_script(
+        REVEAL_SCRIPT, list_selector, ROW_LINK_SELECTOR, title_selector, MENU_SELECTOR, target, render_ms,
+    )
+
+
+def resolve_entry(driver, entry, render_ms=1000, list_selector=LIST_SELECTOR):
+    """
+    항목의 대화 링크(a) 요소를 화면 가운데로 꺼내서 반환 (그려져 있지 않으면 위치로 스크롤해서 찾음)
+    찾지 못하면 None
+    """
+    found = reveal_row(driver, {"id": entry.id, "position": entry.position}, render_ms, list_selector)
+    return found and found["link"]
+
+
+def find_menu_buttons(driver, target=None, render_ms=1000, list_selector=LIST_SELECTOR):
+    """
+    대화 행의 ellipsis 메뉴 버튼 목록 (스크립트 한 번, 목록 전체를 스크롤하지 않음)
+    - target 없음: 지금 그려진 모든 행의 버튼
+    - target=int(위치 data-index) / ChatHistoryEntry: 그 행만 화면으로 꺼내서 [버튼]
+    - target=str(제목): 그려진 행에서 먼저 찾고, 없으면 목록을 위에서부터 훑어 처음 일치하는 행
+    찾지 못하면 빈 리스트
+    """
+    if target is None:
+        return driver.execute_script(MENU_BUTTONS_SCRIPT, list_selector, ROW_LINK_SELECTOR, MENU_SELECTOR)
+
+    if isinstance(target, ChatHistoryEntry):
+        spec = {"id": target.id, "position": target.position}
+    elif isinstance(target, int):
+        spec = {"position": target}
+    else:
+        spec = {"title": target}
+    found = reveal_row(driver, spec, render_ms, list_selector)
+
+    if found is None and "title" in spec:
+        entry = next((e for e in iter_chat_history(driver, list_selector=list_selector) if e.title == target), None)
+        if entry is not None:
+            found = reveal_row(driver, {"id": entry.id, "position": entry.position}, render_ms, list_selector)
+    return [found["menu"]] if found and found["menu"] else []
+
+
+def iter_chat_history(driver, step=0.9, render_ms=300, load_more_ms=500, from_top=True,
+                      list_selector=LIST_SELECTOR, title_selector=TITLE_SELECTOR):
+    """
+    대화 목록 행(ChatHistoryEntry)을 위에서부터 중복 없이 yield
+    step: 한 단계에 내릴 거리 (화면 높이 대비, 1 미만이면 화면끼리 조금 겹쳐서 빠지는 행이 없음)
+    render_ms: 스크롤 후 목록이 다시 그려지기를 기다리는 최대 시간
+    load_more_ms: 끝에 닿았을 때 추가 로드를 기다리는 조용한 시간 (0이면 기다리지 않음)
+    목록 컨테이너가 없으면 아무것도 yield 하지 않음
+    스크롤이 더 내려가지 않는데 새 행도 없으면 atEnd가 아니어도 끝으로 봄 (높이 계산이 어긋난 목록에서 무한 반복 방지)
+    """
+    seen = set()
+    reset, waited_at_end = from_top, False
+    last_top = None
+    while True:
+        state = driver.execute_async_script(
+            HARVEST_SCRIPT, list_selector, ROW_LINK_SELECTOR, title_selector, MENU_SELECTOR,
+            step, reset, render_ms,
+        )
+        if state is None:
+            return
+        new_rows = 0
+        for row in state["rows"]:
+            if row["id"] in seen:
+                continue
+            seen.add(row["id"])
+            if row["position"] is None:
+                row["position"] = len(seen) - 1
+            new_rows += 1
+            yield ChatHistoryEntry.from_row(row)
+
+        stuck = state["scrollTop"] == last_top and not new_rows
+        last_top = state["scrollTop"]
+        if reset:
+            # 맨 위로 옮긴 직후 읽은 화면이면 스크롤 없이 끝을 판정하지 않음
+            reset = False
+            continue
+        if not (state["atEnd"] or stuck) or new_rows:
+            waited_at_end = False
+            continue
+        if waited_at_end or not load_more_ms:
+            return
+        # 끝에 닿았지만 무한 스크롤로 다음 페이지가 붙을 수 있으니 한 번만 더 기다려 봄
+        settle.wait_until_settled(driver, load_more_ms, timeout=max(5, load_more_ms / 1000 * 4))
+        waited_at_end = True
@@ -0,0 +1,124 @@
+"""
+여러 요소의 상태를 한 번의 스크립트 호출로 읽기
+
+element.text, value_of_css_property(), get_attribute() 는 호출마다 WebDriver 왕복이 생겨
+요소 N개 × 속성 M개를 읽으면 N×M번 왕복한다.
+query_many()는 대상 요소를 페이지 안에서 한 번에 찾고, 요청한 필드를 모두 읽어 dict 리스트로 돌려준다.
+
+지원 필드
+- "text"              : innerText (앞뒤 공백 제거)
+- "visible"           : Selenium is_displayed와 같은 기준
+- "rect"              : {"x", "y", "width", "height"} (문서 기준 좌표, element.rect와 같음)
+- "tag"               : 소문자 태그명
+- "element"           : WebElement
+- "attr:<name>"       : getAttribute(name)
+- "css:<prop>"        : getComputedStyle(el).getPropertyValue(prop)
+- "css::<pseudo>:<prop>" : 의사요소 스타일 (예: "css::before:background-color")
+- "find:<css>"        : 요소 안에서 css로 찾은 첫 번째 하위 요소 (없으면 None)
+"""
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from src.utils.dom_wait import DOM_HELPERS_JS, to_alternatives
+
+FIELD_PREFIXES = ("attr:", "css:", "find:")
+PLAIN_FIELDS = ("text", "visible", "rect", "tag", "element")
+
+QUERY_SCRIPT = DOM_HELPERS_JS + """
+const [targets, fields] = arguments;
+
+const elements = [];
+for (const target of targets) {
+    if (target.element) {
+        elements.push(target.element);
+        continue;
+    }
+    // 대안 목록이면 처음으로 결과가 있는 대안만 사용
+    for (const [kind, value] of target.alternatives) {
+        const found = findAll(kind, value);
+        if (found.length) {
+            elements.push(...found);
+            break;
+        }
+    }
+}
+
+function readField(el, field, styles) {
+    if (field === 'text') return (el.innerText || '').trim();
+    if (field === 'visible') return isVisible(el);
+    if (field === 'tag') return el.tagName.toLowerCase();
+    if (field === 'element') return el;
+    if (field === 'rect') {
+        const r = el.getBoundingClientRect();
+        return {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height};
+    }
+    if (field.startsWith('attr:')) return el.getAttribute(field.slice(5));
+    if (field.startsWith('find:')) return el.querySelector(field.slice(5));
+    if (field.startsWith('css:')) {
+        let pseudo = null;
+        let prop = field.slice(4);
+        if (prop.startsWith(':')) {
+            const sep = prop.indexOf(':', 2);
+            pseudo = prop.slice(0, sep);
+            prop = prop.slice(sep + 1);
+        }
+        const key = pseudo || '';
+        if (!(key in styles)) styles[key] = getComputedStyle(el, pseudo);
+        return styles[key].getPropertyValue(prop);
+    }
+    return null;
+}
+
+return elements.map(el => {
+    const styles = {};
+    const record = {};
+    for (const field of fields) record[field] = readField(el, field, styles);
+    return record;
+});
+"""
+
+
+def _is_locator(target):
+    if hasattr(target, "compiled"):  # LocatorChain
+        return True
+    return isinstance(target, tuple) and len(target) == 2 and isinstance(target[0], str)
+
+
+def _check_fields(fields):
+    for field in fields:
+        if field in PLAIN_FIELDS:
+            continue
+        if field.startswith(FIELD_PREFIXES) and field.split(":", 1)[1]:
+            if field.startswith("css::") and field.count(":") < 3:
+                raise ValueError(f"의사요소 필드 형식은 css::before:<prop> 입니다: {field}")
+            continue
+        raise ValueError(f"지원하지 않는 필드: {field}")
+
+
+def query_many(driver, targets, fields):
+    """
+    targets: locator(LocatorChain 포함), WebElement, 또는 둘을 섞은 리스트
+             (locator는 find_elements처럼 일치하는 요소 전부가 대상)
+    fields: 읽을 필드 목록 (모듈 docstring 참고)
+    반환: 요소마다 {필드: 값} dict, targets 순서 그대로
+    """
+    if _is_locator(targets) or isinstance(targets, WebElement):
+        targets = [targets]
+    fields = list(fields)
+    _check_fields(fields)
+
+    specs = []
+    for target in targets:
+        if isinstance(target, WebElement):
+            specs.append({"element": target})
+            continue
+        alternatives = to_alternatives(target)
+        if alternatives is None:
+            # 페이지 안에서 평가할 수 없는 locator는 WebDriver로 먼저 찾아서 넘김
+            specs += [{"element": el} for el in driver.find_elements(*target)]
+        else:
+            specs.append({"alternatives": alternatives})
+
+    if not specs:
+        return []
+    return driver.execute_script(QUERY_SCRIPT, specs, fields)
@@ -0,0 +1,222 @@
+"""
+이벤트 기반 요소 대기
+
+WebDriverWait는 0.5초마다 WebDriver 왕복으로 조건을 다시 확인하므로
+요소가 나타난 뒤에도 최대 0.5초를 더 기다리고, 폴링 요청이 페이지와 경쟁한다.
+
+여기서는 execute_async_script로 페이지 안에 MutationObserver를 설치해
+DOM/속성이 바뀌거나 transition/animation이 끝나는 순간 바로 조건을 다시 확인한다.
+(스타일 변경 없이 레이아웃만 바뀌는 경우를 위해 100ms 주기 재확인도 같이 돈다)
+
+- 조건 판정은 Selenium expected_conditions와 같게 맞춘다.
+  visible/clickable: 첫 번째로 찾은 요소 기준, present_all: 하나 이상 존재
+- 스크립트 한 번은 MAX_SCRIPT_WAIT초까지만 기다리고, 남은 시간은 다시 나눠서 대기
+  (ChromeDriver 스크립트 타임아웃 30초보다 짧게 유지)
+- 대기 중 페이지 이동으로 스크립트가 끊기면 새 페이지에서 다시 대기
+- 주입이 불가능한 경우(지원하지 않는 locator, 스크립트 실행 실패)는 EventWaitUnavailable로
+  남은 시간을 알려주고, 호출 쪽(BasePage)이 기존 WebDriverWait 폴링으로 이어서 기다린다.
+"""
+
+import time
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+MAX_SCRIPT_WAIT = 20     # 초 (스크립트 1회 최대 대기)
+RECHECK_INTERVAL = 100   # ms (변경 이벤트가 없을 때의 주기 재확인)
+
+# 페이지 안에서 쓰는 공통 함수 (dom_query 등 다른 스크립트에서도 재사용)
+# isVisible은 Selenium is_displayed와 같은 기준 (display/visibility/opacity/크기)
+DOM_HELPERS_JS = """
+function findAll(kind, value) {
+    if (kind === 'css') {
+        return Array.from(document.querySelectorAll(value));
+    }
+    const snapshot = document.evaluate(
+        value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const found = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        const node = snapshot.snapshotItem(i);
+        if (node.nodeType === Node.ELEMENT_NODE) found.push(node);
+    }
+    return found;
+}
+
+function isVisible(el) {
+    if (!el.isConnected) return false;
+    if (el.tagName === 'INPUT' && (el.type || '').toLowerCase() === 'hidden') return false;
+    for (let node = el; node && node.nodeType === Node.ELEMENT_NODE; node = node.parentElement) {
+        const style = getComputedStyle(node);
+        if (style.display === 'none') return false;
+        if (node === el && (style.visibility === 'hidden' || style.visibility === 'collapse')) return false;
+        if (parseFloat(style.opacity) === 0) return false;
+    }
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+"""
+
+WAIT_SCRIPT = DOM_HELPERS_JS + """
+const [alternatives, condition, timeoutMs, recheckMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+function matches(el) {
+    if (condition === 'present') return true;
+    if (!isVisible(el)) return false;
+    if (condition === 'clickable') return !el.disabled;
+    return true;
+}
+
+function check() {
+    for (let index = 0; index < alternatives.length; index++) {
+        const [kind, value] = alternatives[index];
+        const found = findAll(kind, value);
+        if (condition === 'present_all') {
+            if (found.length) return {elements: found, alternative: index};
+            continue;
+        }
+        if (found.length && matches(found[0])) {
+            return {elements: [found[0]], alternative: index};
+        }
+    }
+    return null;
+}
+
+let finished = false;
+let observer = null;
+let timer = null;
+let interval = null;
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(interval);
+    document.removeEventListener('transitionend', onChange, true);
+    document.removeEventListener('animationend', onChange, true);
+    done(result);
+}
+
+function onChange() {
+    if (finished) return;
+    try {
+        const result = check();
+        if (result) finish(result);
+    } catch (e) {
+        finish({error: String(e && e.message || e)});
+    }
+}
+
+onChange();
+if (!finished) {
+    observer = new MutationObserver(onChange);
+    observer.observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true,
+    });
+    document.addEventListener('transitionend', onChange, true);
+    document.addEventListener('animationend', onChange, true);
+    interval = setInterval(onChange, recheckMs);
+    timer = setTimeout(() => finish({timeout: true}), timeoutMs);
+}
+"""
+
+# 스크립트 실행 중 페이지가 바뀌었을 때 ChromeDriver가 돌려주는 메시지
+NAVIGATION_ERRORS = ("document unloaded", "unloaded while waiting", "execution context was destroyed")
+
+
+class EventWaitUnavailable(Exception):
+    """이벤트 대기를 쓸 수 없음 → remaining초 동안 폴링으로 이어서 대기"""
+
+    def __init__(self, remaining, reason=""):
+        super().__init__(reason)
+        self.remaining = remaining
+
+
+def xpath_literal(text):
+    """작은따옴표/큰따옴표가 섞인 문자열도 XPath 문자열 리터럴로 변환"""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in parts) + ")"
+
+
+def _css_string(text):
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def to_alternatives(locator):
+    """
+    (By.*, value) 또는 LocatorChain → 페이지에서 평가할 [["css"|"xpath", selector]] 목록
+    변환할 수 없는 locator면 None
+    """
+    if hasattr(locator, "compiled"):
+        return locator.compiled
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return [["css", value]]
+    if by == By.XPATH:
+        return [["xpath", value]]
+    if by == By.ID:
+        return [["css", f"[id={_css_string(value)}]"]]
+    if by == By.NAME:
+        return [["css", f"[name={_css_string(value)}]"]]
+    if by == By.CLASS_NAME:
+        return [["css", f"[class~={_css_string(value)}]"]]
+    if by == By.TAG_NAME:
+        return [["css", value]]
+    if by == By.LINK_TEXT:
+        return [["xpath", f"//a[normalize-space(.)={xpath_literal(value.strip())}]"]]
+    if by == By.PARTIAL_LINK_TEXT:
+        return [["xpath", f"//a[contains(normalize-space(.), {xpath_literal(value.strip())})]"]]
+    return None
+
+
+def wait_for(driver, locator, condition="visible", timeout=30):
+    """
+    condition이 만족될 때까지 이벤트 기반으로 대기
+    - "present" / "visible" / "clickable": 요소 1개 반환
+    - "present_all": 찾은 요소 리스트 반환
+    - 시간 초과: TimeoutException
+    - 이벤트 대기 불가: EventWaitUnavailable (남은 시간 포함)
+    """
+    deadline = time.monotonic() + timeout
+    alternatives = to_alternatives(locator)
+    if alternatives is None:
+        raise EventWaitUnavailable(timeout, f"지원하지 않는 locator: {locator}")
+
+    while True:
+        remaining = deadline - time.monotonic()
+        chunk = max(0.0, min(remaining, MAX_SCRIPT_WAIT))
+        try:
+            result = driver.execute_async_script(
+                WAIT_SCRIPT, alternatives, condition, int(chunk * 1000), RECHECK_INTERVAL
+            )
+        except JavascriptException as e:
+            if any(msg in str(e) for msg in NAVIGATION_ERRORS) and time.monotonic() < deadline:
+                continue
+            raise EventWaitUnavailable(deadline - time.monotonic(), str(e)) from e
+        except TimeoutException as e:
+            # 스크립트 타임아웃이 chunk보다 짧게 설정된 드라이버
+            raise EventWaitUnavailable(deadline - time.monotonic(), str(e)) from e
+        except WebDriverException as e:
+            if any(msg in str(e) for msg in NAVIGATION_ERRORS) and time.monotonic() < deadline:
+                continue
+            raise
+
+        if result and result.get("error"):
+            # 잘못된 selector 등 → 폴링 쪽에서 Selenium 예외로 드러나게 넘김
+            raise EventWaitUnavailable(deadline - time.monotonic(), result["error"])
+        if result and result.get("elements"):
+            if hasattr(locator, "record_hit"):
+                locator.record_hit(result["alternative"])
+            elements = result["elements"]
+            return elements if condition == "present_all" else elements[0]
+        if time.monotonic() >= deadline:
+            raise TimeoutException(f"{timeout}초 동안 조건({condition}) 미충족: {locator}")
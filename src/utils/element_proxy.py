@@ -0,0 +1,101 @@
+"""
+stale 되지 않는 요소 핸들
+
+React가 목록/버튼을 다시 그리면 이전에 찾아 둔 WebElement는 StaleElementReferenceException을 낸다.
+ElementProxy는 자신을 찾을 때 쓴 locator와 index를 기억해 두었다가,
+stale 예외가 나면 같은 locator로 다시 찾아서 명령을 재시도한다. (최대 budget회)
+
+- WebElement 하위 클래스라서 click/text/send_keys/execute_script 인자 등 기존 코드 그대로 사용 가능
+- 재탐색할 때마다 RESOLVE_STATS에 locator별 횟수가 쌓인다.
+  (conftest가 테스트마다 초기화하고 user_properties로 남김 → 어떤 화면이 DOM을 자주 갈아엎는지 확인)
+"""
+
+import threading
+from collections import Counter
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+DEFAULT_BUDGET = 3
+
+
+class ResolveStats:
+    """locator별 재탐색 횟수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.counts = Counter()
+        self.failures = Counter()   # budget을 다 쓰고도 실패한 횟수
+
+    def record(self, locator, failed=False):
+        key = f"{locator[0]}={locator[1]}" if isinstance(locator, tuple) else str(locator)
+        with self._lock:
+            (self.failures if failed else self.counts)[key] += 1
+
+    def summary(self):
+        with self._lock:
+            return {
+                "re_resolved": sum(self.counts.values()),
+                "failed": sum(self.failures.values()),
+                "by_locator": dict(self.counts.most_common()),
+            }
+
+
+RESOLVE_STATS = ResolveStats()
+
+
+class ElementProxy(WebElement):
+    """
+    locator[index] 요소를 가리키는 WebElement
+    stale 예외가 나면 driver.find_elements(*locator)[index]로 다시 찾아 재시도
+    """
+
+    def __init__(self, element, locator, index=0, budget=DEFAULT_BUDGET):
+        super().__init__(element.parent, element.id)
+        self.locator = locator
+        self.index = index
+        self.budget = budget
+
+    def _re_resolve(self):
+        if hasattr(self.locator, "find_elements"):  # LocatorChain (처음 찾을 때 이미 집계됨)
+            found = self.locator.find_elements(self.parent, record=False)
+        else:
+            found = self.parent.find_elements(*self.locator)
+        if self.index >= len(found):
+            return False
+        self._id = found[self.index].id
+        return True
+
+    def _retry(self, action):
+        for attempt in range(self.budget + 1):
+            try:
+                return action()
+            except StaleElementReferenceException:
+                if attempt == self.budget or not self._re_resolve():
+                    RESOLVE_STATS.record(self.locator, failed=True)
+                    raise
+                RESOLVE_STATS.record(self.locator)
+
+    def _execute(self, command, params=None):
+        # 부모 _execute가 params에 id를 넣으므로 재시도마다 새로 복사
+        return self._retry(lambda: super(ElementProxy, self)._execute(command, dict(params or {})))
+
+    # 아래 두 메서드는 _execute 대신 execute_script로 동작하므로 따로 감싼다
+    def is_displayed(self):
+        return self._retry(super().is_displayed)
+
+    def get_attribute(self, name):
+        return self._retry(lambda: super(ElementProxy, self).get_attribute(name))
+
+    def __repr__(self):
+        return f"<ElementProxy {self.locator!s}[{self.index}] id={self._id}>"
+
+
+def wrap(element, locator, index=0):
+    """이미 ElementProxy이거나 locator가 없으면 그대로 반환"""
+    if element is None or isinstance(element, ElementProxy):
+        return element
+    return ElementProxy(element, locator, index)
@@ -0,0 +1,199 @@
+"""
+여러 세션 동시 채팅 부하 생성
+
+세션(로그인된 ChatPage 등)마다 스레드 하나가 목표 속도(세션당 분당 rate_per_min개)로 프롬프트를 보낸다.
+- ramp_up_s 동안 세션을 하나씩 고르게 늘리고, 이후 steady_s 동안 모든 세션이 같이 보낸다.
+- 응답이 늦어져도 밀린 요청을 몰아 보내지 않는다. (다음 전송 = max(예정 시각, 지금))
+- 세션은 session_factory(index)로 만든다. 반환값은 send_message_observed(prompt, timeout)로
+  StreamingResult를 돌려주는 객체면 된다. (브라우저 생성/로그인/정리는 호출 쪽 책임)
+
+결과는 bucket_s 간격 시계열로 집계한다. (완료 시각 기준)
+    t, phase, active_sessions, requests, errors, error_rate, throughput_rps,
+    ttft_p50_ms, ttft_p95_ms, complete_p50_ms, complete_p95_ms
+
+    generator = LoadGenerator(factory, prompts, LoadProfile(sessions=4, ramp_up_s=60, steady_s=300))
+    report = generator.run()
+    save_time_series(report["series"], "reports/benchmarks/chat_load.csv")
+"""
+
+import csv
+import os
+import threading
+import time
+from typing import NamedTuple
+
+from src.utils.benchmark import summarize
+from src.utils.timing_store import percentile
+
+SERIES_FIELDS = (
+    "t", "phase", "active_sessions", "requests", "errors", "error_rate", "throughput_rps",
+    "ttft_p50_ms", "ttft_p95_ms", "complete_p50_ms", "complete_p95_ms",
+)
+
+
+class LoadProfile(NamedTuple):
+    sessions: int = 4
+    ramp_up_s: float = 60
+    steady_s: float = 300
+    rate_per_min: float = 2.0   # 세션당 분당 전송 수
+    bucket_s: float = 10
+    timeout: float = 60         # 응답 1건 최대 대기 (초)
+
+    @property
+    def duration_s(self):
+        return self.ramp_up_s + self.steady_s
+
+    def start_offset(self, index):
+        """index번째 세션이 시작하는 시각 (ramp_up 구간에 고르게 분산)"""
+        return self.ramp_up_s * index / self.sessions
+
+    def phase_at(self, t):
+        return "ramp_up" if t < self.ramp_up_s else "steady"
+
+
+class LoadSample(NamedTuple):
+    session: int
+    prompt: str
+    started_s: float         # 부하 시작 기준
+    finished_s: float
+    ttft_ms: float
+    complete_ms: float
+    error: str               # 성공이면 ""
+
+
+class LoadGenerator:
+
+    def __init__(self, session_factory, prompts, profile=LoadProfile()):
+        if not prompts:
+            raise ValueError("프롬프트가 하나 이상 필요합니다")
+        self.session_factory = session_factory
+        self.prompts = list(prompts)
+        self.profile = profile
+        self.samples = []
+        self.session_spans = {}   # index → (시작, 종료) 초, 세션 생성 실패는 기록 안 함
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._start = None
+
+    def _now(self):
+        return time.monotonic() - self._start
+
+    def _record(self, sample):
+        with self._lock:
+            self.samples.append(sample)
+
+    def _send(self, index, session, prompt):
+        started = self._now()
+        try:
+            result = session.send_message_observed(prompt, self.profile.timeout)
+        except Exception as e:  # 부하 중 실패는 모두 오류율로 집계
+            return LoadSample(index, prompt, started, self._now(), 0.0, 0.0, f"{type(e).__name__}: {e}")
+        finished = self._now()
+        if result is None or not result.completed:
+            return LoadSample(index, prompt, started, finished, 0.0, 0.0, "응답 미완료")
+        return LoadSample(index, prompt, started, finished, result.ttft_ms, result.total_ms, "")
+
+    def _run_session(self, index):
+        profile = self.profile
+        if self._stop.wait(profile.start_offset(index)):
+            return
+        try:
+            session = self.session_factory(index)
+        except Exception as e:
+            now = self._now()
+            self._record(LoadSample(index, "", now, now, 0.0, 0.0, f"세션 생성 실패 {type(e).__name__}: {e}"))
+            return
+
+        begin = self._now()
+        interval = 60 / profile.rate_per_min
+        next_at = begin
+        count = 0
+        while self._now() < profile.duration_s and not self._stop.is_set():
+            prompt = self.prompts[(index + count) % len(self.prompts)]
+            self._record(self._send(index, session, prompt))
+            count += 1
+            next_at = max(next_at + interval, self._now())
+            if self._stop.wait(max(0, next_at - self._now())):
+                break
+        with self._lock:
+            self.session_spans[index] = (begin, self._now())
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self):
+        """부하 실행 후 리포트 dict 반환 (profile / phases / series / samples)"""
+        self._start = time.monotonic()
+        threads = [
+            threading.Thread(target=self._run_session, args=(i,), name=f"load-session-{i}", daemon=True)
+            for i in range(self.profile.sessions)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self.report()
+
+    def report(self):
+        samples = sorted(self.samples, key=lambda s: s.finished_s)
+        phases = {}
+        for phase in ("ramp_up", "steady"):
+            in_phase = [s for s in samples if self.profile.phase_at(s.started_s) == phase]
+            ok = [s for s in in_phase if not s.error]
+            phases[phase] = {
+                "requests": len(in_phase),
+                "errors": len(in_phase) - len(ok),
+                "ttft_ms": _stats_dict([s.ttft_ms for s in ok]),
+                "complete_ms": _stats_dict([s.complete_ms for s in ok]),
+            }
+        return {
+            "profile": self.profile._asdict(),
+            "phases": phases,
+            "series": time_series(samples, self.profile, self.session_spans),
+            "samples": [s._asdict() for s in samples],
+        }
+
+
+def _stats_dict(values):
+    stats = summarize(values)
+    return stats._asdict() if stats else None
+
+
+def _p(values, pct):
+    return round(percentile(values, pct), 1) if values else None
+
+
+def time_series(samples, profile, session_spans=None):
+    """완료 시각 기준 bucket_s 간격 집계 (요청이 없는 구간도 0으로 포함)"""
+    spans = list((session_spans or {}).values())
+    last = max([profile.duration_s] + [s.finished_s for s in samples])
+    buckets = int(last // profile.bucket_s) + 1
+    series = []
+    for b in range(buckets):
+        start, end = b * profile.bucket_s, (b + 1) * profile.bucket_s
+        in_bucket = [s for s in samples if start <= s.finished_s < end]
+        ok = [s for s in in_bucket if not s.error]
+        errors = len(in_bucket) - len(ok)
+        series.append({
+            "t": start,
+            "phase": profile.phase_at(start),
+            "active_sessions": sum(1 for begin, finish in spans if begin < end and finish >= start),
+            "requests": len(in_bucket),
+            "errors": errors,
+            "error_rate": round(errors / len(in_bucket), 3) if in_bucket else 0.0,
+            "throughput_rps": round(len(ok) / profile.bucket_s, 3),
+            "ttft_p50_ms": _p([s.ttft_ms for s in ok], 50),
+            "ttft_p95_ms": _p([s.ttft_ms for s in ok], 95),
+            "complete_p50_ms": _p([s.complete_ms for s in ok], 50),
+            "complete_p95_ms": _p([s.complete_ms for s in ok], 95),
+        })
+    return series
+
+
+def save_time_series(series, path):
+    """시계열을 CSV로 저장 (빈 값은 빈 칸)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SERIES_FIELDS)
+        writer.writeheader()
+        writer.writerows(series)
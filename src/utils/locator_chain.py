@@ -0,0 +1,133 @@
+"""
+여러 대안을 묶은 locator (fallback 체인)
+
+기존 테스트는 "CSS로 wait → 타임아웃 → XPath로 다시 wait" 식이라
+첫 번째 대안이 틀리면 타임아웃을 한 번 통째로 기다린 뒤에야 다음 대안을 시도했다.
+LocatorChain은 모든 대안을 dom_wait의 페이지 안 스크립트에 한꺼번에 넘겨,
+확인할 때마다 순서대로 전부 평가하고 처음 맞은 요소를 돌려준다. (대안이 늘어도 추가 대기 없음)
+
+    DELETE_MENU = LocatorChain(
+        css("p.MuiTypography-body1.css-1v3cy5h"),
+        text("Delete", tag="p"),
+        name="Delete 메뉴",
+    )
+    page.wait_for_clickable(DELETE_MENU)
+
+- 대안 종류: css / xpath / text(보이는 글자) / role(ARIA role + 이름), (By.*, value) 튜플도 가능
+- 어떤 대안이 맞았는지 hits에 기록 → fallback_report()로 첫 번째 대안이 빗나가는 체인 확인
+"""
+
+from collections import Counter
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from src.utils.dom_wait import to_alternatives, xpath_literal
+
+_BY = {"css": By.CSS_SELECTOR, "xpath": By.XPATH}
+
+# 태그 자체가 role을 갖는 경우 (role 속성이 없어도 매칭)
+IMPLICIT_ROLES = {
+    "button": ("button",),
+    "link": ("a",),
+    "textbox": ("textarea", "input"),
+    "listitem": ("li",),
+    "dialog": ("dialog",),
+}
+
+_chains = []
+
+
+def css(selector):
+    return ("css", selector)
+
+
+def xpath(expression):
+    return ("xpath", expression)
+
+
+def text(value, tag="*"):
+    """자기 텍스트(하위 요소 제외)가 value와 같은 요소 (앞뒤 공백 무시)"""
+    return ("xpath", f"//{tag}[text()[normalize-space(.)={xpath_literal(value.strip())}]]")
+
+
+def role(name_of_role, name=None):
+    """ARIA role(명시 또는 태그 기본값) + 선택적으로 접근성 이름(aria-label 또는 글자)"""
+    tags = IMPLICIT_ROLES.get(name_of_role, ())
+    conditions = [f"@role={xpath_literal(name_of_role)}"] + [f"self::{tag}" for tag in tags]
+    expression = f"//*[{' or '.join(conditions)}]"
+    if name is not None:
+        literal = xpath_literal(name)
+        expression += f"[@aria-label={literal} or normalize-space(.)={literal}]"
+    return ("xpath", expression)
+
+
+class LocatorChain:
+
+    def __init__(self, *alternatives, name=None):
+        if not alternatives:
+            raise ValueError("대안이 하나 이상 필요합니다")
+        self.alternatives = alternatives
+        self.name = name
+        self.compiled = []
+        for alternative in alternatives:
+            kind, value = alternative
+            if kind in _BY:
+                self.compiled.append([kind, value])
+                continue
+            converted = to_alternatives(alternative)
+            if converted is None:
+                raise ValueError(f"지원하지 않는 대안: {alternative}")
+            self.compiled += converted
+        self.hits = Counter()
+        _chains.append(self)
+
+    def record_hit(self, index):
+        self.hits[index] += 1
+
+    def find_elements(self, driver, record=True):
+        """
+        WebDriver로 대안을 순서대로 찾기 (폴링 fallback / stale 재탐색용)
+        record=False: 이미 집계된 조회를 다시 찾는 경우(stale 재탐색) → fallback 리포트에 세지 않음
+        """
+        for index, (kind, value) in enumerate(self.compiled):
+            found = driver.find_elements(_BY[kind], value)
+            if found:
+                if record:
+                    self.record_hit(index)
+                return found
+        return []
+
+    def condition(self, condition):
+        """WebDriverWait용 조건 함수 (dom_wait와 같은 기준: 대안별 첫 번째 요소)"""
+        def check(driver):
+            try:
+                for index, (kind, value) in enumerate(self.compiled):
+                    found = driver.find_elements(_BY[kind], value)
+                    if not found:
+                        continue
+                    if condition == "present_all":
+                        self.record_hit(index)
+                        return found
+                    element = found[0]
+                    if condition == "present" or (
+                        element.is_displayed() and (condition == "visible" or element.is_enabled())
+                    ):
+                        self.record_hit(index)
+                        return element
+            except StaleElementReferenceException:
+                pass
+            return False
+        return check
+
+    def __str__(self):
+        return self.name or " | ".join(f"{kind}:{value}" for kind, value in self.compiled)
+
+    def __repr__(self):
+        return f"<LocatorChain {self}>"
+
+
+def fallback_report():
+    """첫 번째가 아닌 대안으로 찾은 적이 있는 체인: [(체인, {대안 번호: 횟수})]"""
+    return [(chain, dict(chain.hits)) for chain in _chains
+            if any(index > 0 for index in chain.hits)]
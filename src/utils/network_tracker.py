@@ -0,0 +1,213 @@
+"""
+CDP Network 이벤트 기반 네트워크 활동 추적
+
+document.readyState는 SPA에서 첫 로드 이후 항상 "complete"라서
+"메시지 전송 후 백엔드 호출이 끝났는지" 같은 신호로 쓸 수 없다.
+ChromeDriver performance 로그(goog:loggingPrefs)로 들어오는 Network.* 이벤트를 읽어
+요청별 시작/종료 시각과 진행 중인 요청 수를 추적한다.
+
+- performance 로그는 읽으면 비워지므로 드라이버마다 tracker_for(driver) 하나만 로그를 읽는다.
+  다른 곳(lean 모드 통계 등)은 tracker.take_events()로 원본 이벤트를 넘겨받는다.
+- filter 인자: None(전체) / 문자열(부분 일치, *가 있으면 glob) / 정규식 / url을 받는 함수
+"""
+
+import fnmatch
+import json
+import re
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+
+class RequestRecord(NamedTuple):
+    """완료(또는 실패)된 요청 1건 (시각은 CDP 모노토닉 초)"""
+    request_id: str
+    url: str
+    method: str
+    resource_type: str
+    started: float
+    finished: float
+    status: Optional[int]
+    encoded_bytes: int
+    failed: bool
+    blocked_reason: Optional[str]
+    request_headers: Optional[dict] = None
+    post_data: Optional[str] = None
+    mime_type: Optional[str] = None     # 응답 Content-Type (예: text/event-stream)
+    responded: Optional[float] = None   # 응답 헤더 수신 시각
+    data_chunks: tuple = ()             # (수신 시각, 바이트 수) 목록 (스트리밍 응답의 조각 타이밍)
+
+    @property
+    def duration_ms(self):
+        return (self.finished - self.started) * 1000
+
+
+def url_matcher(filter):
+    if filter is None:
+        return lambda url: True
+    if callable(filter):
+        return filter
+    if isinstance(filter, re.Pattern):
+        return lambda url: filter.search(url) is not None
+    if "*" in filter or "?" in filter:
+        return lambda url: fnmatch.fnmatchcase(url, filter)
+    return lambda url: filter in url
+
+
+class NetworkTracker:
+    """
+    - poll(): performance 로그를 읽어 상태 갱신 (다른 메서드들이 자동으로 호출)
+    - inflight(filter): 진행 중인 요청 수
+    - records(filter): 완료된 요청 기록 (RequestRecord)
+    - mark() / wait_for_network_idle(filter, after=mark): 특정 시점 이후 요청이 끝날 때까지 대기
+    - take_events(): 지금까지 읽은 원본 Network.* 이벤트를 꺼내고 비움
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """기록 초기화 (드라이버를 다음 테스트에 넘길 때)"""
+        self._pending = {}     # requestId → 진행 중인 요청 정보
+        self._records = []
+        self._events = []
+        self._seen = 0         # 지금까지 시작된 요청 수 (mark 기준)
+
+    def poll(self):
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException:
+            return
+        with self._lock:
+            for entry in entries:
+                message = json.loads(entry["message"])["message"]
+                if message["method"].startswith("Network."):
+                    self._events.append(message)
+                    self._handle(message["method"], message["params"])
+
+    def _handle(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            if request_id in self._pending:
+                # 리다이렉트는 같은 requestId로 이어짐 → URL만 갱신
+                self._pending[request_id]["url"] = params["request"]["url"]
+                return
+            url = params["request"]["url"]
+            if url.startswith("data:"):
+                return
+            self._pending[request_id] = {
+                "url": url,
+                "method": params["request"].get("method", "GET"),
+                "type": params.get("type", "Other"),
+                "started": params["timestamp"],
+                "status": None,
+                "headers": params["request"].get("headers"),
+                "post_data": params["request"].get("postData"),
+                "mime_type": None,
+                "responded": None,
+                "chunks": [],
+                "seq": self._seen + 1,
+            }
+            self._seen += 1
+        elif method == "Network.responseReceived":
+            if request_id in self._pending:
+                self._pending[request_id]["status"] = params["response"].get("status")
+                self._pending[request_id]["mime_type"] = params["response"].get("mimeType")
+                self._pending[request_id]["responded"] = params["timestamp"]
+        elif method == "Network.dataReceived":
+            if request_id in self._pending:
+                self._pending[request_id]["chunks"].append((params["timestamp"], params.get("dataLength", 0)))
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            info = self._pending.pop(request_id, None)
+            if info is None:
+                return
+            self._records.append((info["seq"], RequestRecord(
+                request_id=request_id,
+                url=info["url"],
+                method=info["method"],
+                resource_type=info["type"],
+                started=info["started"],
+                finished=params["timestamp"],
+                status=info["status"],
+                encoded_bytes=int(params.get("encodedDataLength", 0)),
+                failed=method == "Network.loadingFailed",
+                blocked_reason=params.get("blockedReason"),
+                request_headers=info["headers"],
+                post_data=info["post_data"],
+                mime_type=info["mime_type"],
+                responded=info["responded"],
+                data_chunks=tuple(info["chunks"]),
+            )))
+
+    def mark(self):
+        """현재 시점 표시 (이후 시작된 요청만 골라 보기 위함)"""
+        self.poll()
+        return self._seen
+
+    def inflight(self, filter=None, after=0):
+        self.poll()
+        match = url_matcher(filter)
+        return sum(1 for info in list(self._pending.values())
+                   if info["seq"] > after and match(info["url"]))
+
+    def records(self, filter=None, after=0):
+        self.poll()
+        match = url_matcher(filter)
+        return [r for seq, r in list(self._records) if seq > after and match(r.url)]
+
+    def take_events(self):
+        self.poll()
+        with self._lock:
+            events, self._events = self._events, []
+        return events
+
+    def wait_for_network_idle(self, filter=None, idle_ms=500, timeout=30, after=None, poll_interval=0.1):
+        """
+        filter에 맞는 요청이 하나도 진행 중이지 않은 상태가 idle_ms 동안 이어질 때까지 대기
+        - after=mark(): 그 이후 시작된 요청이 최소 1건 끝나야 idle로 인정 (요청 시작 전에 통과하는 것 방지)
+        반환: 조건에 맞는 완료 기록 리스트 / 시간 초과 시 TimeoutException
+        """
+        deadline = time.monotonic() + timeout
+        quiet_since, last_count = None, -1
+        while True:
+            busy = self.inflight(filter, after or 0)
+            done = self.records(filter, after or 0)
+            now = time.monotonic()
+            if busy == 0 and (after is None or done):
+                # 조용한 동안 새로 끝난 요청이 생기면 idle 구간을 다시 잰다
+                if quiet_since is None or len(done) != last_count:
+                    quiet_since, last_count = now, len(done)
+                elif (now - quiet_since) * 1000 >= idle_ms:
+                    return done
+            else:
+                quiet_since = None
+            if now >= deadline:
+                raise TimeoutException(
+                    f"{timeout}초 동안 네트워크가 idle 상태가 되지 않음 (진행 중 {busy}건, filter={filter!r})"
+                )
+            time.sleep(poll_interval)
+
+
+_trackers = {}
+_trackers_lock = threading.Lock()
+
+
+def tracker_for(driver):
+    """드라이버(세션)별 NetworkTracker (없으면 생성)"""
+    # LazyDriver 핸들은 테스트가 끝나면 비워지므로 실제 WebDriver를 붙잡아 둔다
+    driver = getattr(driver, "wrapped_driver", driver)
+    key = driver.session_id
+    with _trackers_lock:
+        if key not in _trackers:
+            _trackers[key] = NetworkTracker(driver)
+        return _trackers[key]
+
+
+def discard(driver):
+    """종료하는 드라이버의 tracker 제거"""
+    with _trackers_lock:
+        _trackers.pop(getattr(driver, "session_id", None), None)
@@ -0,0 +1,152 @@
+"""
+스트리밍 응답 종료 판정
+
+응답은 글자가 조금씩 붙으며 그려지므로 "새 article에 글자가 생김"만으로는
+아직 쓰는 중인 답변을 읽게 된다. CompletionDetector는 아래 신호를 페이지 안에서 함께 보고
+응답이 정말 끝난 가장 이른 시점에 돌아온다.
+
+1. 중지(stop) 버튼이 보이는 동안은 무조건 생성 중
+2. 최신 응답의 답변 카드(ai-card) 안, 응답 본문 바깥에 복사/좋아요/재생성 툴바가 나타나거나, 보이던 중지 버튼이 사라지면
+   (본문 안 코드 블록 복사 버튼, 입력창/헤더 등 다른 곳의 같은 아이콘 버튼은 툴바로 보지 않음)
+   → settle_ms 동안 글자 변화가 없을 때 종료 (마지막 렌더링 흡수)
+3. 위 신호를 찾지 못하는 화면이면 → quiet_ms 동안 글자 변화가 없을 때 종료
+
+quiet_ms / settle_ms 기본값은 settings(RESPONSE_QUIET_MS / RESPONSE_SETTLE_MS),
+셀렉터는 생성자 인자로 바꿀 수 있다.
+
+시간 한도는 두 단계로 나뉜다. 긴 답변(퀴즈 생성 등)은 첫 글자는 빨리 와도 다 쓰는 데 오래 걸리므로
+timeout은 "전송 → 첫 글자"에만 쓰고, 첫 글자 이후에는 completion_timeout(기본 RESPONSE_COMPLETION_TIMEOUT)을 쓴다.
+
+    detector = CompletionDetector(quiet_ms=3000)
+    detector.wait(driver, prev_count, timeout=60)   # → "toolbar" / "stop" / "quiet"
+"""
+
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+from src.config.settings import RESPONSE_COMPLETION_TIMEOUT, RESPONSE_QUIET_MS, RESPONSE_SETTLE_MS
+from src.utils.dom_wait import DOM_HELPERS_JS, MAX_SCRIPT_WAIT, RECHECK_INTERVAL
+
+RESPONSE_SELECTOR = 'div[role="article"]'
+STOP_SELECTOR = (
+    'button[aria-label*="stop" i], button[aria-label*="중지"], '
+    'button:has(svg.lucide-square), button:has(svg.lucide-circle-stop)'
+)
+CARD_SELECTOR = 'div[data-testid="ai-card"]'  # 응답 본문과 툴바를 함께 감싸는 답변 카드 (없으면 본문의 부모)
+TOOLBAR_SELECTOR = (
+    'button:has(svg.lucide-copy), button:has(svg.lucide-thumbs-up), '
+    'button:has(svg.lucide-refresh-cw), button:has(svg.lucide-rotate-ccw)'
+)
+
+# carry: 스크립트를 나눠 부를 때 이어받는 상태 (마지막 글자 / 변화 시각 / 중지 버튼을 본 적 있는지)
+# options.reportStart: 첫 글자가 생기면 바로 'started'로 돌아옴 (Python 쪽에서 시간 한도를 완료 단계로 전환)
+COMPLETION_SCRIPT = DOM_HELPERS_JS + """
+const [selector, prevCount, options, carry, timeoutMs, recheckMs] = arguments;
+const done = arguments[arguments.length - 1];
+const state = carry || {text: null, changedAt: performance.now(), sawStop: false};
+
+function visibleMatches(sel, root) {
+    return sel ? Array.from((root || document).querySelectorAll(sel)).filter(isVisible) : [];
+}
+
+function check() {
+    const all = document.querySelectorAll(selector);
+    if (all.length <= prevCount) return null;
+    const latest = all[all.length - 1];
+    const now = performance.now();
+    const text = (latest.innerText || '').trim();
+    if (text !== state.text) {
+        state.text = text;
+        state.changedAt = now;
+    }
+    if (!text) return null;
+
+    const stopping = visibleMatches(options.stopSelector).length > 0;
+    if (stopping) state.sawStop = true;
+    if (options.reportStart) return 'started';
+    if (stopping) return null;
+    const quiet = now - state.changedAt;
+    // 툴바는 같은 답변 카드 안, 본문 뒤의 버튼만 (본문 안 코드 블록 복사 버튼은 스트리밍 중에도 보이고,
+    // 카드가 없어 부모로 대신할 때 앞선 답변의 툴바가 섞이지 않도록 본문 뒤쪽만 봄)
+    const card = (options.cardSelector && latest.closest(options.cardSelector)) || latest.parentElement;
+    const toolbar = !!card && visibleMatches(options.toolbarSelector, card).some(button =>
+        !latest.contains(button) &&
+        (latest.compareDocumentPosition(button) & Node.DOCUMENT_POSITION_FOLLOWING));
+    if (toolbar && quiet >= options.settleMs) return 'toolbar';
+    if (state.sawStop && quiet >= options.settleMs) return 'stop';
+    if (quiet >= options.quietMs) return 'quiet';
+    return null;
+}
+
+let finished = false;
+const observer = new MutationObserver(tick);
+const timer = setInterval(tick, recheckMs);
+const deadline = setTimeout(() => finish(null), timeoutMs);
+
+function finish(reason) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearInterval(timer);
+    clearTimeout(deadline);
+    done({reason, carry: state});
+}
+
+function tick() {
+    const reason = check();
+    if (reason) finish(reason);
+}
+
+observer.observe(document.body, {subtree: true, childList: true, characterData: true, attributes: true});
+tick();
+"""
+
+
+class CompletionDetector:
+
+    def __init__(self, quiet_ms=None, settle_ms=None, stop_selector=STOP_SELECTOR,
+                 toolbar_selector=TOOLBAR_SELECTOR, selector=RESPONSE_SELECTOR, card_selector=CARD_SELECTOR):
+        self.quiet_ms = RESPONSE_QUIET_MS if quiet_ms is None else quiet_ms
+        self.settle_ms = RESPONSE_SETTLE_MS if settle_ms is None else settle_ms
+        self.stop_selector = stop_selector
+        self.toolbar_selector = toolbar_selector
+        self.selector = selector
+        self.card_selector = card_selector
+
+    def wait(self, driver, prev_count, timeout=40, completion_timeout=None):
+        """
+        prev_count개 이후에 생긴 최신 응답이 끝날 때까지 대기
+        timeout: 전송 → 첫 글자 한도(초) / completion_timeout: 첫 글자 → 완료 한도(초)
+        반환: 종료로 판단한 근거 ("toolbar" / "stop" / "quiet"), 시간 초과 시 TimeoutException
+        """
+        if completion_timeout is None:
+            completion_timeout = RESPONSE_COMPLETION_TIMEOUT
+        options = {
+            "quietMs": self.quiet_ms,
+            "settleMs": self.settle_ms,
+            "stopSelector": self.stop_selector,
+            "toolbarSelector": self.toolbar_selector,
+            "cardSelector": self.card_selector,
+            "reportStart": True,
+        }
+        carry = None
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if options["reportStart"]:
+                    raise TimeoutException(f"{timeout}초 안에 응답이 시작되지 않았습니다.")
+                raise TimeoutException(f"응답이 시작된 뒤 {completion_timeout}초 안에 끝나지 않았습니다.")
+            chunk = min(remaining, MAX_SCRIPT_WAIT)
+            result = driver.execute_async_script(
+                COMPLETION_SCRIPT, self.selector, prev_count, options, carry,
+                int(chunk * 1000), RECHECK_INTERVAL,
+            )
+            carry = result["carry"]
+            if result["reason"] == "started":
+                options = {**options, "reportStart": False}
+                deadline = time.monotonic() + completion_timeout
+                continue
+            if result["reason"]:
+                return result["reason"]
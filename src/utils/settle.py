@@ -0,0 +1,105 @@
+"""
+UI 안정화(settle) 대기
+
+time.sleep(0.5~2)로 "화면이 다 바뀌었겠지" 하고 기다리던 부분을 대체한다.
+페이지 안에서 requestAnimationFrame마다 아래 조건을 확인하고,
+quiet_ms 동안 계속 조용하면 바로 반환한다.
+
+- DOM 변경(MutationObserver) 없음
+- 진행 중인 CSS transition/animation 없음 (무한 반복 애니메이션 = 로딩 스피너 등은 제외)
+- 진행 중인 fetch/XHR 없음
+
+fetch/XHR 감시는 첫 호출 때 문서에 한 번 설치된다. (설치 이전에 시작된 요청은 세지 못하지만
+그 응답으로 생기는 DOM 변경은 MutationObserver가 잡는다)
+"""
+
+import time
+
+from selenium.common.exceptions import JavascriptException, WebDriverException
+
+from src.utils.dom_wait import NAVIGATION_ERRORS
+
+SETTLE_SCRIPT = """
+const [quietMs, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+if (!window.__qaSettle) {
+    const state = {inflight: 0, lastActivity: performance.now()};
+    const touch = () => { state.lastActivity = performance.now(); };
+
+    new MutationObserver(touch).observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true,
+    });
+    for (const type of ['transitionstart', 'transitionend', 'animationstart', 'animationend']) {
+        document.addEventListener(type, touch, true);
+    }
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (...args) {
+            state.inflight++;
+            touch();
+            return originalFetch.apply(this, args).finally(() => { state.inflight--; touch(); });
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        state.inflight++;
+        touch();
+        this.addEventListener('loadend', () => { state.inflight--; touch(); }, {once: true});
+        return originalSend.apply(this, args);
+    };
+    window.__qaSettle = state;
+}
+
+const state = window.__qaSettle;
+const start = performance.now();
+
+function animating() {
+    if (!document.getAnimations) return false;
+    return document.getAnimations().some(a =>
+        a.playState === 'running' &&
+        !(a.effect && a.effect.getComputedTiming().iterations === Infinity));
+}
+
+function tick() {
+    const now = performance.now();
+    if (animating()) state.lastActivity = now;
+    if (state.inflight === 0 && now - state.lastActivity >= quietMs) {
+        done({settled: true, waited: now - start});
+        return;
+    }
+    if (now - start >= timeoutMs) {
+        done({settled: false, waited: now - start, inflight: state.inflight});
+        return;
+    }
+    // 백그라운드 탭에서는 rAF가 멈추므로 타이머로 대신 확인
+    if (document.hidden) setTimeout(tick, 16); else requestAnimationFrame(tick);
+}
+
+// 호출 직전의 클릭/스크롤 등도 "방금 일어난 변화"로 취급
+state.lastActivity = Math.max(state.lastActivity, start);
+tick();
+"""
+
+
+def wait_until_settled(driver, quiet_ms=150, timeout=5):
+    """
+    UI가 quiet_ms 동안 조용해질 때까지 대기
+    반환: 안정화됐으면 True, timeout까지 계속 바뀌면 False (예외는 내지 않음)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        try:
+            result = driver.execute_async_script(SETTLE_SCRIPT, quiet_ms, int(remaining * 1000))
+        except JavascriptException as e:
+            # 대기 중 페이지 이동 → 새 문서에서 다시 확인
+            if any(msg in str(e) for msg in NAVIGATION_ERRORS):
+                continue
+            return False
+        except WebDriverException:
+            return False
+        return bool(result and result.get("settled"))
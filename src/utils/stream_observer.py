@@ -0,0 +1,162 @@
+"""
+스트리밍 응답 관찰 (TTFT / 생성 시간 / 초당 글자·토큰 수)
+
+메시지를 보내기 전에 페이지에 MutationObserver를 설치해 두고,
+새로 생긴 응답 요소(기본: div[role="article"])의 글자 수가 바뀔 때마다 performance.now()로 기록한다.
+WebDriver 왕복 지연이 섞이지 않도록 전송 시각도 페이지 안에서 잰다. (Enter 키 / 전송 버튼 클릭)
+
+    observer = StreamObserver(driver)
+    observer.install()
+    (메시지 전송)
+    result = observer.finish(timeout=60)
+    result.ttft_ms, result.tokens_per_sec, result.text ...
+
+- ttft_ms: 전송 → 첫 글자 표시 (화면 기준 first token)
+- generation_ms: 첫 글자 → 마지막 글자 변화
+- 토큰 수는 토크나이저 없이 "단어 + 구두점" 단위로 센 근사값
+- 응답 종료 판정은 response_completion.CompletionDetector
+"""
+
+import re
+from typing import NamedTuple
+
+from selenium.common.exceptions import TimeoutException
+
+from src.utils.response_completion import RESPONSE_SELECTOR, CompletionDetector
+
+INSTALL_SCRIPT = """
+const selector = arguments[0];
+const previous = window.__qaStream;
+if (previous) previous.dispose();
+
+const state = {
+    baseCount: document.querySelectorAll(selector).length,
+    installedAt: performance.now(),
+    submitAt: null,
+    chunks: [],          // [시각, 글자 수]
+    lastLength: 0,
+    target: null,
+};
+
+const markSubmit = () => { if (state.submitAt === null) state.submitAt = performance.now(); };
+const onKey = (e) => { if (e.key === 'Enter' && !e.shiftKey && !e.isComposing) markSubmit(); };
+const onClick = (e) => {
+    if (e.target.closest && e.target.closest('button[type="submit"], #chat-submit')) markSubmit();
+};
+
+state.sample = () => {
+    const all = document.querySelectorAll(selector);
+    if (all.length <= state.baseCount) return;
+    state.target = all[all.length - 1];
+    const length = (state.target.innerText || '').length;
+    if (length !== state.lastLength) {
+        state.chunks.push([performance.now(), length]);
+        state.lastLength = length;
+    }
+};
+
+const observer = new MutationObserver(state.sample);
+observer.observe(document.body, {subtree: true, childList: true, characterData: true});
+document.addEventListener('keydown', onKey, true);
+document.addEventListener('click', onClick, true);
+
+state.dispose = () => {
+    observer.disconnect();
+    document.removeEventListener('keydown', onKey, true);
+    document.removeEventListener('click', onClick, true);
+};
+window.__qaStream = state;
+return state.baseCount;
+"""
+
+COLLECT_SCRIPT = """
+const state = window.__qaStream;
+if (!state) return null;
+state.sample();
+state.dispose();
+window.__qaStream = null;
+return {
+    installedAt: state.installedAt,
+    submitAt: state.submitAt,
+    chunks: state.chunks,
+    text: state.target ? (state.target.innerText || '').trim() : '',
+};
+"""
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+def count_tokens(text):
+    """단어/구두점 단위 근사 토큰 수"""
+    return len(_TOKEN_PATTERN.findall(text))
+
+
+class StreamingResult(NamedTuple):
+    ttft_ms: float          # 전송 → 첫 글자
+    generation_ms: float    # 첫 글자 → 마지막 변화
+    total_ms: float         # 전송 → 마지막 변화
+    chars: int
+    tokens: int
+    chars_per_sec: float
+    tokens_per_sec: float
+    chunks: int             # 글자 수가 바뀐 횟수
+    completed: bool         # 시간 안에 응답이 멈췄는지
+    text: str
+
+    @classmethod
+    def from_raw(cls, raw, completed=True):
+        """COLLECT_SCRIPT 결과 → StreamingResult (응답이 없으면 None)"""
+        chunks = raw.get("chunks") or []
+        if not chunks:
+            return None
+        submit = raw["submitAt"] if raw.get("submitAt") is not None else raw["installedAt"]
+        first, last = chunks[0][0], chunks[-1][0]
+        text = raw.get("text", "")
+        tokens = count_tokens(text)
+        generation_ms = last - first
+        seconds = generation_ms / 1000
+        return cls(
+            ttft_ms=round(first - submit, 1),
+            generation_ms=round(generation_ms, 1),
+            total_ms=round(last - submit, 1),
+            chars=len(text),
+            tokens=tokens,
+            chars_per_sec=round(len(text) / seconds, 1) if seconds > 0 else 0.0,
+            tokens_per_sec=round(tokens / seconds, 1) if seconds > 0 else 0.0,
+            chunks=len(chunks),
+            completed=completed,
+            text=text,
+        )
+
+    def summary(self):
+        return (
+            f"TTFT {self.ttft_ms:.0f}ms / 생성 {self.generation_ms:.0f}ms / "
+            f"{self.chars}자 {self.tokens}토큰 ({self.tokens_per_sec:.1f} tok/s, {self.chunks}회 갱신)"
+        )
+
+
+class StreamObserver:
+    """응답 종료 판정은 CompletionDetector (wait_for_new_response와 같은 기준)"""
+
+    def __init__(self, driver, selector=RESPONSE_SELECTOR, detector=None):
+        self.driver = driver
+        self.selector = selector
+        self.detector = detector or CompletionDetector(selector=selector)
+        self.base_count = None
+
+    def install(self):
+        """메시지 전송 직전에 호출"""
+        self.base_count = self.driver.execute_script(INSTALL_SCRIPT, self.selector)
+
+    def collect(self, completed=True):
+        raw = self.driver.execute_script(COLLECT_SCRIPT)
+        return StreamingResult.from_raw(raw, completed) if raw else None
+
+    def finish(self, timeout=60, completion_timeout=None):
+        """응답이 끝날 때까지 기다린 뒤 결과 반환 (응답이 아예 없으면 None, 한도는 CompletionDetector.wait 참고)"""
+        try:
+            self.detector.wait(self.driver, self.base_count, timeout, completion_timeout)
+            completed = True
+        except TimeoutException:
+            completed = False
+        return self.collect(completed)
@@ -0,0 +1,148 @@
+"""
+locator별 대기 시간 기록 + 적응형 타임아웃
+
+BasePage의 wait_* 가 실제로 걸린 시간을 locator 단위로 JSON 파일에 쌓아 두고,
+다음 실행부터는 "지금까지 걸린 시간의 p99 × 여유 배수"를 타임아웃으로 쓴다.
+
+- 앱이 고장 났을 때: 평소 0.3초면 뜨던 요소를 30초씩 기다리지 않고 빨리 실패
+- 앱이 느릴 때: 평소보다 느린 locator는 p99가 올라가 타임아웃도 같이 늘어남
+- 표본이 min_samples개 미만이면 학습 전으로 보고 기본 타임아웃 사용
+- 타임아웃 난 대기도 "최소 그 시간만큼 걸렸다"로 기록해 다음 타임아웃이 늘어나게 한다.
+- drift_report(): 이번 실행의 중앙값이 이전 기록보다 크게 느려진 locator 목록
+
+파일은 실행 종료 시 한 번 저장한다. (병렬 워커는 저장 직전에 파일을 다시 읽어 합친다)
+녹화 재생(TRAFFIC_MODE=replay)이나 로컬 대역 앱(STANDIN_APP=1)처럼 실서비스와 속도가 다른 실행은 기록 파일을 따로 쓴다. (store_path 참고)
+"""
+
+import json
+import math
+import os
+import statistics
+import tempfile
+import threading
+
+from src.config import settings
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위수"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def locator_key(locator, condition):
+    if not isinstance(locator, tuple):  # LocatorChain
+        return f"{condition} chain={locator}"
+    by, value = locator
+    return f"{condition} {by}={value}"
+
+
+class TimingStore:
+    """
+    - path: 기록 파일 (JSON)
+    - factor: p99에 곱할 여유 배수
+    - min_timeout / max_timeout: 타임아웃 하한/상한 (초)
+    - min_samples: 이 개수 이상 쌓여야 적응형 타임아웃 사용
+    - max_samples: locator별로 최근 기록만 유지
+    """
+
+    def __init__(self, path, factor=3.0, min_timeout=5, max_timeout=30,
+                 min_samples=10, max_samples=200, drift_ratio=2.0):
+        self.path = path
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.drift_ratio = drift_ratio
+        self._history = self._read()   # 이전 실행까지의 기록
+        self._session = {}             # 이번 실행에서 새로 쌓인 기록
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def samples(self, key):
+        return self._history.get(key, []) + self._session.get(key, [])
+
+    def record(self, key, seconds):
+        with self._lock:
+            self._session.setdefault(key, []).append(round(seconds, 3))
+
+    def timeout_for(self, key, default):
+        """학습된 타임아웃 (표본이 부족하면 default)"""
+        samples = self.samples(key)
+        if len(samples) < self.min_samples:
+            return default
+        learned = percentile(samples, 99) * self.factor
+        return min(max(learned, self.min_timeout), self.max_timeout)
+
+    def drift_report(self, min_session_samples=3):
+        """
+        이번 실행에서 이전보다 drift_ratio배 이상 느려진 locator
+        반환: [(key, 이전 중앙값, 이번 중앙값)] (느려진 비율 큰 순)
+        """
+        drifted = []
+        for key, recent in self._session.items():
+            past = self._history.get(key, [])
+            if len(recent) < min_session_samples or len(past) < self.min_samples:
+                continue
+            before, now = statistics.median(past), statistics.median(recent)
+            if before > 0 and now / before >= self.drift_ratio:
+                drifted.append((key, before, now))
+        return sorted(drifted, key=lambda d: d[2] / d[1], reverse=True)
+
+    def save(self):
+        """이번 실행 기록을 파일에 합쳐서 저장 (원자적 교체)"""
+        with self._lock:
+            if not self._session:
+                return
+            merged = self._read()
+            for key, recent in self._session.items():
+                merged[key] = (merged.get(key, []) + recent)[-self.max_samples:]
+            self._history, self._session = merged, {}
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(merged, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+_store = None
+
+
+def store_path():
+    """
+    기록 파일 위치: TIMING_STORE_PATH가 있으면 그대로, 없으면 실행 대상별 기본 파일
+    - 재생 응답은 네트워크를 타지 않아 훨씬 빠름 → 같은 파일에 섞이면 실서비스 타임아웃이 너무 짧아짐
+    """
+    if settings.TIMING_STORE_PATH:
+        return settings.TIMING_STORE_PATH
+    if settings.STANDIN_APP:  # 대역 앱은 응답 속도를 설정으로 정하므로 실서비스 기록과 무관
+        return ".cache/wait_timings.standin.json"
+    if settings.TRAFFIC_MODE == "replay":
+        return ".cache/wait_timings.replay.json"
+    return ".cache/wait_timings.json"
+
+
+def get_store():
+    """프로세스 공용 TimingStore (ADAPTIVE_TIMEOUTS=0이면 None)"""
+    global _store
+    if not settings.ADAPTIVE_TIMEOUTS:
+        return None
+    if _store is None:
+        _store = TimingStore(
+            store_path(),
+            factor=settings.ADAPTIVE_TIMEOUT_FACTOR,
+            min_timeout=settings.ADAPTIVE_TIMEOUT_MIN,
+            max_timeout=settings.DEFAULT_TIMEOUT,
+            min_samples=settings.ADAPTIVE_MIN_SAMPLES,
+        )
+    return _store
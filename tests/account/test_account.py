@@ -305,6 +305,8 @@ def test_account_management_page_ui(driver, login):
 
 
 # AC-019: 프로필 이미지 업로드 및 반영 확인
+@pytest.mark.ui
+@pytest.mark.visual
 def test_profile_image_upload_and_reflection(driver, login):
     """
     프로필 이미지 업로드 후 모든 페이지에서 반영되는지 확인
@@ -423,6 +425,8 @@ def test_profile_image_upload_and_reflection(driver, login):
 
 
 # AC-020: 프로필 이미지 제거 및 반영 확인
+@pytest.mark.ui
+@pytest.mark.visual
 def test_profile_image_removal_and_reflection(driver, login):
     """
     프로필 이미지 제거 후 기본 이미지(PersonIcon)로 변경되는지 확인
@@ -1,6 +1,5 @@
 import pytest
 import re
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -79,6 +78,8 @@ def test_credit_button_visible_and_amount_format(driver, login):
 
 
 # BILL-003: 성공률 80% (2/10 XFAIL)
+@pytest.mark.ui
+@pytest.mark.visual
 def test_credit_button_hover_color(driver, login):
     driver = login()
     wait = WebDriverWait(driver, 10)
@@ -93,13 +94,13 @@ def test_credit_button_hover_color(driver, login):
     WebDriverWait(driver, 1).until(lambda d: d.execute_script("return document.readyState") == "complete")
 
     # 2) hover 전 상태 캡처
-    before = {p: billing.get_css(credit, p) for p in billing.HOVER_PROPS}
+    before = billing.hover_props(credit)
 
     # 3) hover 적용
     billing.hover(credit)
 
-    # CSS transition 완료 대기 (간단하게 고정 시간)
-    time.sleep(0.5)  # transition 시작 + 완료
+    # CSS transition 완료 대기
+    billing.wait_until_settled()
 
     # 4) 타겟 요소 찾기
     target = credit
@@ -113,15 +114,13 @@ def test_credit_button_hover_color(driver, login):
             pass
 
     # 5) hover 후 상태 캡처
-    after = {p: billing.get_css(target, p) for p in billing.HOVER_PROPS}
-    changed = any(before[p] != after[p] for p in billing.HOVER_PROPS)
+    changed, after = billing.any_prop_changed(target, before)
 
     # 재시도
     if not changed:
         billing.hover(target)
-        time.sleep(0.5)  # 재시도 후 대기
-        after_retry = {p: billing.get_css(target, p) for p in billing.HOVER_PROPS}
-        changed = any(before[p] != after_retry[p] for p in billing.HOVER_PROPS)
+        billing.wait_until_settled()  # 재시도 후 transition 완료 대기
+        changed, _ = billing.any_prop_changed(target, before)
 
     if not changed:
         pytest.xfail(f"2번 시도 후에도 hover 변화 미감지\nbefore={before}\nafter={after}")
@@ -183,14 +182,16 @@ def test_prompt_decreases_credit(driver, login):
     WebDriverWait(driver, 1).until(
         lambda d: d.execute_script("return document.activeElement === arguments[0]", prompt_input)
     )
+    mark = billing.network.mark()
     prompt_input.send_keys("안녕")
     prompt_input.send_keys(Keys.RETURN)
     
     print("✅ 메시지 전송")
     
-    WebDriverWait(driver, 10).until(
-        lambda d: d.execute_script("return document.readyState") == "complete"
-    )
+    # 전송 이후 시작된 요청(응답 스트리밍 포함)이 모두 끝나야 크레딧 차감이 반영됨
+    # (SPA라 document.readyState는 전송 전후 모두 "complete")
+    finished = billing.wait_for_network_idle(idle_ms=1000, timeout=60, after=mark)
+    print(f"✅ 백엔드 요청 {len(finished)}건 완료")
     
     # 재로그인
     driver.get("https://qaproject.elice.io/ai-helpy-chat")
@@ -543,7 +544,7 @@ def test_credit_charge_button_disabled_without_selection(driver, login):
         print("✅ ₩50,000 크레딧 선택 확인 (is_selected)")
     
     # 🆕 React 상태 업데이트 대기
-    time.sleep(0.5)
+    BillingPage(driver).wait_until_settled()
     
     # 4) 크레딧 충전 버튼 찾기
     charge_btn = wait.until(EC.presence_of_element_located((
@@ -0,0 +1,56 @@
+# 여러 세션 동시 채팅 부하 테스트 (LOAD_SESSIONS > 0일 때만 실행)
+
+import json
+import os
+
+import allure
+import pytest
+
+from src.config.settings import (
+    BENCHMARK_DIR,
+    BENCHMARK_PROMPTS,
+    LOAD_BUCKET_S,
+    LOAD_MAX_ERROR_RATE,
+    LOAD_RAMP_UP_S,
+    LOAD_RATE_PER_MIN,
+    LOAD_SESSIONS,
+    LOAD_STEADY_S,
+)
+from src.utils.benchmark import load_prompts, save_report
+from src.utils.load_generator import LoadGenerator, LoadProfile, save_time_series
+
+pytestmark = [
+    pytest.mark.lean,
+    pytest.mark.skipif(LOAD_SESSIONS <= 0, reason="LOAD_SESSIONS가 설정되지 않아 부하 테스트 생략"),
+]
+
+
+@pytest.mark.performance
+@pytest.mark.low
+def test_chat_concurrent_load(chat_session_factory):
+    profile = LoadProfile(
+        sessions=LOAD_SESSIONS,
+        ramp_up_s=LOAD_RAMP_UP_S,
+        steady_s=LOAD_STEADY_S,
+        rate_per_min=LOAD_RATE_PER_MIN,
+        bucket_s=LOAD_BUCKET_S,
+    )
+    report = LoadGenerator(chat_session_factory, load_prompts(BENCHMARK_PROMPTS), profile).run()
+
+    save_report(report, os.path.join(BENCHMARK_DIR, "chat_load_latest.json"))
+    save_time_series(report["series"], os.path.join(BENCHMARK_DIR, "chat_load_series.csv"))
+    allure.attach(
+        json.dumps(report["series"], ensure_ascii=False, indent=2),
+        name="chat_load_series",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    steady = report["phases"]["steady"]
+    for phase, summary in report["phases"].items():
+        complete = summary["complete_ms"] or {}
+        print(f"[load] {phase}: 요청 {summary['requests']}건 / 오류 {summary['errors']}건 / "
+              f"완료 p50 {complete.get('p50')}ms, p95 {complete.get('p95')}ms")
+
+    assert steady["requests"] > 0, "steady 구간에 보낸 요청이 없습니다."
+    error_rate = steady["errors"] / steady["requests"]
+    assert error_rate <= LOAD_MAX_ERROR_RATE, f"steady 구간 오류율 {error_rate:.1%}"
@@ -6,6 +6,9 @@ from dotenv import load_dotenv
 load_dotenv()  # env 파일 전체를 미리 읽어서 login()에서 사용 가능하게 함
 
 import re
+import functools
+from urllib.parse import quote
+import threading
 from datetime import datetime
 
 # ───────────────────────────────────────────────────────────────
@@ -19,7 +22,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 import allure
 import subprocess
 import tempfile
@@ -29,13 +31,57 @@ import tempfile
 # ───────────────────────────────────────────────────────────────
 from src.pages.base_page import BasePage
 from src.pages.account_page import AccountPage
-from src.config.settings import get_default_admin
+from src.pages.chat_page import ChatPage
+from src.utils import element_proxy, timing_store
+from src.utils.locator_chain import fallback_report
+from src.config.settings import ALL_ADMINS, BASE_URL, LOGIN_URL, get_default_admin, release_admin_lease, SESSION_CACHE, SESSION_CACHE_DIR, SESSION_CACHE_TTL
+from src.config.settings import STANDIN_APP, STANDIN_PORT
+from src.config.settings import ACCOUNT_LEASE, lease_extra_admin
+from src.config.settings import TRAFFIC_CASSETTE_DIR, TRAFFIC_MODE, TRAFFIC_REPLAY_MISSING, TRAFFIC_REPLAY_TIMING
+from tests.helpers.driver_pool import DriverPool
+from tests.helpers.session_cache import SessionCache
+from tests.helpers.chrome_profile import ChromeProfileTemplate
+from tests.helpers.driver_resolver import ChromeDriverResolver
+from tests.helpers.lazy_driver import LazyDriver
+from tests.helpers import lean_mode, traffic_cassette
+from tests.helpers.browser_contexts import BrowserContextManager
 
 # ───────────────────────────────────────────────────────────────
 # 4. 환경변수 기반 아티팩트 설정
 # ───────────────────────────────────────────────────────────────
 ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", "artifacts")  # 저장 폴더
 CAPTURE_ON_XFAIL = os.getenv("CAPTURE_ON_XFAIL", "0") == "1"  # XFAIL도 캡처할지
+LEAN_MODE = os.getenv("LEAN_MODE", "0") == "1"  # 모든 테스트에 경량 렌더링 적용 (visual 마커 제외)
+CHROMEDRIVER_CACHE_DIR = os.getenv(
+    "CHROMEDRIVER_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "team4", "chromedriver")
+)  # 버전별 ChromeDriver 캐시
+CHROME_PROFILE_TEMPLATE = os.getenv("CHROME_PROFILE_TEMPLATE", "0") == "1"  # 워밍된 프로필 템플릿 사용
+
+# ───────────────────────────────────────────────────────────────
+# 4-1. 로컬 대역 앱 (STANDIN_APP=1)
+#      세션 fixture(프로필 워밍 등)보다 먼저 떠 있어야 하므로 configure 훅에서 시작
+#      -n 실행의 controller는 테스트를 돌리지 않으므로 띄우지 않음 (gw0과 같은 포트를 잡게 됨)
+# ───────────────────────────────────────────────────────────────
+_standin_app = None
+
+
+def _is_xdist_controller(config):
+    return not hasattr(config, "workerinput") and bool(getattr(config.option, "numprocesses", None))
+
+
+def pytest_configure(config):
+    global _standin_app
+    if STANDIN_APP and _standin_app is None and not _is_xdist_controller(config):
+        from tests.helpers.standin import StandinApp, StandinConfig
+        _standin_app = StandinApp(StandinConfig.from_env(), port=STANDIN_PORT).start()
+        print(f"[standin] 대역 앱 시작: {_standin_app.base_url}")
+
+
+def pytest_unconfigure(config):
+    global _standin_app
+    if _standin_app is not None:
+        _standin_app.stop()
+        _standin_app = None
 
 # ───────────────────────────────────────────────────────────────
 # 5. 유틸 함수
@@ -96,26 +142,40 @@ def chrome_options():
     return opts
 
 # ───────────────────────────────────────────────────────────────
-# 7. 크롬 드라이버 경로 (webdriver-manager)   --- 11/19 수정(황지애)
+# 7. 크롬 드라이버 경로 (로컬 캐시 우선)
 # ───────────────────────────────────────────────────────────────
 
-@pytest.fixture(scope="session")
-def chrome_driver_path():
-    """ChromeDriver 경로"""
+@functools.lru_cache(maxsize=None)
+def _resolve_chrome_driver_path():
     if os.getenv("CI"):
         return None   # ← Selenium이 PATH에서 찾음
     else:
-        return ChromeDriverManager().install()
+        # 설치된 Chrome과 major 버전이 같은 드라이버가 캐시에 있으면 네트워크 없이 바로 사용
+        return ChromeDriverResolver(CHROMEDRIVER_CACHE_DIR).resolve()
+
+
+@pytest.fixture(scope="session")
+def chrome_driver_path():
+    """ChromeDriver 경로"""
+    return _resolve_chrome_driver_path()
 
 
 # ───────────────────────────────────────────────────────────────
-# 8. driver fixture (function scope)       --- 11/19 수정(황지애)
+# 8. driver fixture (드라이버 풀에서 대여)
 # ───────────────────────────────────────────────────────────────
 
-@pytest.fixture
-def driver(chrome_driver_path):
-    
-    # 각 테스트마다 새 브라우저 인스턴스 생성
+def pytest_addoption(parser):
+    parser.addoption(
+        "--driver-pool-size",
+        action="store",
+        type=int,
+        default=int(os.getenv("DRIVER_POOL_SIZE", "1")),
+        help="세션 동안 대기시켜 둘 Chrome 드라이버 수 (0이면 테스트마다 새로 실행)",
+    )
+
+
+def _create_browser(chrome_driver_path, user_data_dir=None):
+    """새 Chrome 인스턴스 생성 (user_data_dir: 사용할 프로필 폴더, 없으면 빈 임시 프로필)"""
     opts = Options()
     
     # CI 환경(GitHub Actions)에서만 headless
@@ -134,25 +194,146 @@ def driver(chrome_driver_path):
         'intl.accept_languages': 'ko-KR,ko,en-US,en'
     })
     
+    if user_data_dir:
+        opts.add_argument(f"--user-data-dir={user_data_dir}")
+    
+    # Network 이벤트를 performance 로그로 수집 (lean 모드 통계 등)
+    opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    opts.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    
     # None이면 Service() 경로 없이 생성
     if chrome_driver_path:
         service = Service(chrome_driver_path)
     else:
         service = Service()  # Selenium이 PATH에서 자동으로 찾음
     
-    browser = webdriver.Chrome(service=service, options=opts)
+    return webdriver.Chrome(service=service, options=opts)
+
+
+@pytest.fixture(scope="session")
+def browser_factory():
+    """Chrome 생성 함수 (user_data_dir=None → 빈 프로필), 드라이버 경로는 처음 실행할 때 결정"""
+    return lambda user_data_dir=None: _create_browser(_resolve_chrome_driver_path(), user_data_dir)
+
+
+def _warm_chat_bundles(driver):
+    """로그인 후에만 내려받는 Helpy 채팅 번들까지 캐시에 올리기 (계정 정보가 없으면 생략)"""
+    acc = get_default_admin()
+    if acc.username and acc.password:
+        _form_login(driver, acc)
+
+
+@pytest.fixture(scope="session")
+def chrome_profile_template(tmp_path_factory, browser_factory):
+    """
+    워밍된 Chrome 프로필 템플릿 (CHROME_PROFILE_TEMPLATE=1일 때만)
+    - 실행(워커)마다 한 번 생성하고, 드라이버마다 복제본을 사용
+    """
+    if not CHROME_PROFILE_TEMPLATE:
+        yield None
+        return
+    template = ChromeProfileTemplate(str(tmp_path_factory.mktemp("chrome_profiles")))
+    template.build(
+        launch=browser_factory,
+        warm_urls=[BASE_URL, f"{BASE_URL}/custom-agent"],
+        warm=_warm_chat_bundles,
+    )
+    yield template
+    template.cleanup()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, browser_factory, chrome_profile_template):
+    """세션 동안 warm 상태의 Chrome을 유지하는 드라이버 풀"""
+    if chrome_profile_template:
+        factory = lambda: browser_factory(chrome_profile_template.clone())
+    else:
+        factory = browser_factory
+    pool = DriverPool(
+        factory=factory,
+        size=request.config.getoption("--driver-pool-size"),
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(driver_pool):
+    
+    # 첫 WebDriver 명령 시점에 풀에서 대여 (끝까지 안 쓰면 Chrome을 띄우지 않음)
+    browser = LazyDriver(driver_pool)
     
     yield browser
     
-    # 테스트 종료 후 브라우저 닫기
-    browser.quit()
+    # 테스트 종료 후 쿠키/스토리지/탭 정리 후 반납
+    browser.release()
+
+@pytest.fixture
+def browser_contexts(driver):
+    """
+    같은 Chrome 안에서 쿠키/스토리지가 분리된 컨텍스트 생성
+    (비로그인 화면 확인, 재로그인, 여러 계정 동시 사용 등)
+    """
+    manager = BrowserContextManager(driver)
+    yield manager
+    if driver.started:
+        manager.close()
 
 # ───────────────────────────────────────────────────────────────
 # 9. login fixture                         --- 11/13 수정(황지애)
 # ───────────────────────────────────────────────────────────────
 
+@pytest.fixture(scope="session")
+def session_cache():
+    """계정별 로그인 세션 스냅샷 캐시 (SESSION_CACHE=0이면 비활성화)"""
+    if not SESSION_CACHE:
+        return None
+    return SessionCache(SESSION_CACHE_DIR, SESSION_CACHE_TTL)
+
+
+def _form_login(driver, acc):
+    """로그인 폼에 아이디/비밀번호를 입력해서 로그인"""
+    
+    # 1. 로그인 페이지 이동
+    driver.get(f"{LOGIN_URL}?continue_to={quote(BASE_URL, safe='')}")
+    
+    # 2. 쿠키/스토리지 정리
+    driver.delete_all_cookies()
+    try:
+        driver.execute_script("window.localStorage.clear();")
+        driver.execute_script("window.sessionStorage.clear();")
+    except Exception:
+        pass
+    
+    # 3. 로그인 필드 대기
+    WebDriverWait(driver, 10).until(
+        EC.visibility_of_element_located(
+            (By.CSS_SELECTOR, "input[autocomplete='username'], input[type='email']")
+        )
+    )
+    
+    # 4. 아이디/비밀번호 입력
+    id_input = driver.find_element(By.CSS_SELECTOR, "input[autocomplete='username'], input[type='email']")
+    pw_input = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+
+    id_input.clear()
+    pw_input.clear()
+    id_input.send_keys(acc.username)
+    pw_input.send_keys(acc.password)
+    
+    # 5. 로그인 버튼 클릭
+    driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+    
+    # 6. 로그인 완료 대기
+    WebDriverWait(driver, 30).until(EC.url_contains("/ai-helpy-chat"))
+    
+    # 7. 언어를 한국어로 설정
+    account_page = AccountPage(driver)
+    account_page.set_language_korean()
+
+
 @pytest.fixture
-def login(driver):
+def login(driver, session_cache):
     def _login(account=None):
         
         # 1. 계정 선택
@@ -163,50 +344,68 @@ def login(driver):
             raise ValueError(f"계정 정보가 .env에 없습니다: {acc}")
         print(f"\n[로그인] {acc.description} ({acc.username})")
         
-        # 3. 로그인 페이지 이동
-        driver.get(
-            "https://accounts.elice.io/accounts/signin/me"
-            "?continue_to=https%3A%2F%2Fqaproject.elice.io%2Fai-helpy-chat"
-        )
+        # 3. 저장된 세션 스냅샷이 유효하면 폼 로그인 생략 (한국어 설정도 스냅샷에 포함)
+        if session_cache and session_cache.restore(driver, acc):
+            return driver
         
-        # 4. 쿠키/스토리지 정리
-        driver.delete_all_cookies()
-        try:
-            driver.execute_script("window.localStorage.clear();")
-            driver.execute_script("window.sessionStorage.clear();")
-        except Exception:
-            pass
-        
-        # 5. 로그인 필드 대기
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, "input[autocomplete='username'], input[type='email']")
-            )
-        )
-        
-        # 6. 아이디/비밀번호 입력
-        id_input = driver.find_element(By.CSS_SELECTOR, "input[autocomplete='username'], input[type='email']")
-        pw_input = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-
-        id_input.clear()
-        pw_input.clear()
-        id_input.send_keys(acc.username)
-        pw_input.send_keys(acc.password)
-        
-        # 7. 로그인 버튼 클릭
-        driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-        
-        # 8. 로그인 완료 대기
-        WebDriverWait(driver, 30).until(EC.url_contains("/ai-helpy-chat"))
-        
-        # 9. 언어를 한국어로 설정
-        account_page = AccountPage(driver)
-        account_page.set_language_korean()
+        # 4. 폼 로그인 후 다음 테스트를 위해 스냅샷 저장
+        _form_login(driver, acc)
+        if session_cache:
+            session_cache.store(driver, acc)
 
         return driver
 
     return _login
 
+
+@pytest.fixture
+def chat_session_factory(request, browser_factory, session_cache):
+    """
+    부하 생성용 세션 팩토리: factory(index) → 별도 Chrome에서 로그인한 ChatPage
+    - 세션마다 브라우저를 새로 띄우므로 스레드마다 독립적으로 사용 가능
+    - 계정: xdist 워커이거나 ACCOUNT_LEASE=1이면 세션마다 따로 임대 (빈 계정이 모자라면 대기),
+      아니면 ALL_ADMINS를 index 순서로 번갈아 사용
+    - 테스트의 lean 마커(또는 LEAN_MODE=1)를 세션 브라우저에도 적용, 테스트가 끝나면 모두 종료/반납
+    """
+    browsers, leases = [], []
+    lock = threading.Lock()
+    use_lease = ACCOUNT_LEASE or os.getenv("PYTEST_XDIST_WORKER")
+    lean = _wants_lean(request.node)
+
+    def _factory(index):
+        if use_lease:
+            lease = lease_extra_admin(f"{os.getenv('PYTEST_XDIST_WORKER', 'master')}-load{index}")
+            with lock:
+                leases.append(lease)
+            acc = lease.account
+        else:
+            acc = ALL_ADMINS[index % len(ALL_ADMINS)]
+        if not acc.username or not acc.password:
+            raise ValueError(f"계정 정보가 .env에 없습니다: {acc}")
+        browser = browser_factory()
+        with lock:
+            browsers.append(browser)
+        if lean:
+            lean_mode.enable(browser)
+        if not (session_cache and session_cache.restore(browser, acc)):
+            _form_login(browser, acc)
+            if session_cache:
+                session_cache.store(browser, acc)
+        chat = ChatPage(browser)
+        chat.wait_for_present((By.CSS_SELECTOR, 'textarea:not([aria-hidden="true"])'))
+        print(f"[load] 세션 {index} 준비 ({acc.description})")
+        return chat
+
+    yield _factory
+
+    for browser in browsers:
+        try:
+            browser.quit()
+        except WebDriverException:
+            pass
+    for lease in leases:
+        lease.release()
+
 # ───────────────────────────────────────────────────────────────
 # 10. 실패 아티팩트 공통 훅 (테스트 결과 캡처) - 각 테스트 단계(setup/call/teardown) 리포트를 node에 붙여줌
 # ───────────────────────────────────────────────────────────────
@@ -216,6 +415,23 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
     setattr(item, "rep_" + rep.when, rep)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # 병렬 실행 시 워커가 임대한 계정 반납
+    release_admin_lease()
+
+    # 요소 대기 시간 기록 저장 + 평소보다 느려진 locator 보고
+    store = timing_store.get_store()
+    if store:
+        for key, before, now in store.drift_report():
+            print(f"[timing] 지연 증가 {before:.2f}s → {now:.2f}s (x{now / before:.1f}): {key}")
+        store.save()
+
+    # 첫 번째 대안이 빗나가 fallback으로 찾은 locator 체인 (셀렉터 정리 대상)
+    for chain, hits in fallback_report():
+        detail = ", ".join(f"{index + 1}번째 {count}회" for index, count in sorted(hits.items()))
+        print(f"[locator] {chain}: {detail}")
     
 # ───────────────────────────────────────────────────────────────
 # 11. auto screenshot fixture (테스트 실패 시 자동 캡처)
@@ -225,8 +441,14 @@ def pytest_runtest_makereport(item, call):
 CAPTURE_XFAIL = False
 
 @pytest.fixture(autouse=True)
-def _auto_artifacts_on_fail(request, driver):
+def _auto_artifacts_on_fail(request, driver, browser_contexts):
+    # browser_contexts에 의존 → 컨텍스트 탭을 닫기 전에 먼저 캡처 (매니저는 처음 쓸 때만 CDP 연결)
     yield
+    
+    # 브라우저를 한 번도 띄우지 않은 테스트는 캡처할 화면이 없음
+    if not driver.started:
+        return
+    
     nodeid = request.node.nodeid
     rep_setup = getattr(request.node, "rep_setup", None)
     rep_call = getattr(request.node, "rep_call", None)
@@ -245,6 +467,95 @@ def _auto_artifacts_on_fail(request, driver):
     if CAPTURE_XFAIL and rep_call and rep_call.skipped and "xfail" in rep_call.keywords:
         _capture(driver, nodeid, tag="xfail")
 
+# ───────────────────────────────────────────────────────────────
+# 11-1. 경량 렌더링(lean) 모드
+# ───────────────────────────────────────────────────────────────
+
+@pytest.fixture(scope="session")
+def lean_report():
+    return lean_mode.LeanReport()
+
+
+def _wants_lean(node):
+    return (LEAN_MODE or node.get_closest_marker("lean")) and not node.get_closest_marker("visual")
+
+
+@pytest.fixture(autouse=True)
+def _lean_mode(request, driver, lean_report):
+    """
+    lean 마커(또는 LEAN_MODE=1) 테스트는 이미지/미디어/폰트/텔레메트리 요청 차단
+    - visual 마커(아바타, hover 색상 등 시각 검증) 테스트는 항상 전체 렌더링
+    """
+    node = request.node
+    lean = _wants_lean(node)
+    if lean:
+        driver.on_start(lean_mode.enable)
+    
+    yield
+    
+    if not driver.started:
+        return
+    # 일반 테스트도 전송 크기를 학습해 두어야 lean 테스트의 절감량을 추정할 수 있음
+    summary = lean_report.collect(lean_mode.read_network_events(driver))
+    if lean:
+        lean_mode.disable(driver)
+        node.user_properties.append(("lean_mode", summary))
+        print(lean_report.format(summary))
+
+# ───────────────────────────────────────────────────────────────
+# 11-2. stale 요소 재탐색 통계
+# ───────────────────────────────────────────────────────────────
+
+@pytest.fixture(autouse=True)
+def _element_resolve_stats(request):
+    """
+    BasePage가 돌려준 요소가 stale 되어 다시 찾은 횟수를 테스트별로 기록
+    (allure/junit의 user_properties "stale_re_resolve")
+    """
+    element_proxy.RESOLVE_STATS.reset()
+    yield
+    summary = element_proxy.RESOLVE_STATS.summary()
+    if summary["re_resolved"] or summary["failed"]:
+        request.node.user_properties.append(("stale_re_resolve", summary))
+        print(f"[stale] 재탐색 {summary['re_resolved']}회 / 실패 {summary['failed']}회: {summary['by_locator']}")
+
+# ───────────────────────────────────────────────────────────────
+# 11-3. API 트래픽 녹화/재생 (TRAFFIC_MODE)
+# ───────────────────────────────────────────────────────────────
+
+@pytest.fixture(autouse=True)
+def _traffic_cassette(request, driver):
+    """
+    record: 테스트가 끝나면 API 응답을 tests/cassettes/<테스트>.har.json.gz로 저장
+    replay: 저장된 카세트로 API 요청에 응답 (카세트가 없는 테스트는 skip)
+    """
+    if TRAFFIC_MODE not in ("record", "replay"):
+        yield
+        return
+
+    nodeid = request.node.nodeid
+    path = traffic_cassette.cassette_path(TRAFFIC_CASSETTE_DIR, nodeid)
+    replayer = None
+    if TRAFFIC_MODE == "replay":
+        entries = traffic_cassette.load_cassette(path)
+        if entries is None:
+            pytest.skip(f"녹화된 카세트가 없습니다: {path}")
+        replayer = traffic_cassette.FetchReplayer(entries, TRAFFIC_REPLAY_TIMING, TRAFFIC_REPLAY_MISSING)
+        driver.on_start(replayer.start)
+
+    yield
+
+    if not driver.started:
+        return
+    if replayer:
+        replayer.stop()
+        print(f"[replay] 카세트 응답 {replayer.served}건 / 카세트에 없는 요청 {len(replayer.misses)}건")
+        for miss in replayer.misses:
+            print(f"[replay]   {miss}")
+    else:
+        saved, missing = traffic_cassette.record_cassette(driver, path, nodeid)
+        print(f"[record] {saved}건 저장 (본문 없음 {missing}건): {path}")
+
 # ───────────────────────────────────────────────────────────────
 # 12. Page Object 주입 fixture (11/10 김은아. 해당 기능 추가)
 # ───────────────────────────────────────────────────────────────
@@ -266,7 +577,7 @@ def custom_agent_page(login, page):
     Custom Agent 페이지로 이동한 BasePage 객체를 반환
     """
     driver = login()
-    page.open("https://qaproject.elice.io/ai-helpy-chat/custom-agent")
+    page.open(f"{BASE_URL}/custom-agent")
     return page
 
 # ───────────────────────────────────────────────────────────────
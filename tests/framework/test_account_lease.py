@@ -0,0 +1,32 @@
+# 부하 세션용 추가 계정 임대 (잠금 파일만 사용, 브라우저 없이 실행)
+
+import pytest
+
+from src.config import settings
+from src.config.settings import AdminAccount, lease_extra_admin
+
+ACCOUNTS = [AdminAccount(f"qa{i}@standin.local", "pw", f"QA {i}") for i in range(3)]
+
+
+@pytest.fixture(autouse=True)
+def _accounts(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ALL_ADMINS", ACCOUNTS)
+    monkeypatch.setattr(settings, "ACCOUNT_LOCK_DIR", str(tmp_path / "locks"))
+    monkeypatch.setattr(settings, "ACCOUNT_LEASE_TIMEOUT", 0)
+
+
+def test_sessions_in_one_process_get_distinct_accounts():
+    leases = [lease_extra_admin(f"master-load{i}") for i in range(3)]
+    try:
+        assert {lease.account.username for lease in leases} == {a.username for a in ACCOUNTS}
+        # 빈 계정이 없으면 기다리다 (timeout=0) 실패
+        with pytest.raises(TimeoutError):
+            lease_extra_admin("master-load3")
+    finally:
+        for lease in leases:
+            lease.release()
+
+    # 반납한 계정은 다시 임대 가능
+    lease = lease_extra_admin("master-load0")
+    assert lease.account in ACCOUNTS
+    lease.release()
@@ -0,0 +1,61 @@
+# 벤치마크 통계 요약 / 기준선 비교 (브라우저 없이 실행)
+
+from types import SimpleNamespace
+
+from selenium.common.exceptions import TimeoutException
+
+from src.utils.benchmark import ChatBenchmark, compare_to_baseline, summarize
+
+
+def test_summarize_percentiles():
+    stats = summarize([float(v) for v in range(1, 101)])
+
+    assert stats.count == 100
+    assert (stats.min, stats.max, stats.mean) == (1.0, 100.0, 50.5)
+    assert (stats.p50, stats.p90, stats.p95, stats.p99) == (50.0, 90.0, 95.0, 99.0)
+    assert stats.stddev == 29.0
+
+
+def test_summarize_edge_cases():
+    assert summarize([]) is None
+    single = summarize([120.0])
+    assert single.stddev == 0.0 and single.p99 == 120.0
+
+
+def _report(ttft_p50, ttft_p95):
+    stats = summarize([100.0])._asdict()
+    return {"metrics": {"ttft_ms": dict(stats, p50=ttft_p50, p95=ttft_p95), "complete_ms": stats}}
+
+
+def test_regression_gate():
+    baseline = _report(1000.0, 2000.0)
+
+    assert compare_to_baseline(_report(1150.0, 2300.0), baseline, tolerance=0.2) == []
+    assert compare_to_baseline(_report(1300.0, 2300.0), baseline, tolerance=0.2) == [
+        ("ttft_ms", "p50", 1000.0, 1300.0)
+    ]
+    assert compare_to_baseline(_report(9999.0, 9999.0), None) == []
+
+
+class _FlakyChat:
+    """첫 전송(예열)만 시간 초과, 이후 정상 응답"""
+
+    def __init__(self):
+        self.sent = 0
+
+    def reset_chat(self):
+        pass
+
+    def send_message_observed(self, prompt, timeout):
+        self.sent += 1
+        if self.sent == 1:
+            raise TimeoutException("예열 시간 초과")
+        return SimpleNamespace(completed=True, ttft_ms=100.0, total_ms=500.0, tokens_per_sec=20.0)
+
+
+def test_warmup_timeout_is_recorded_not_raised():
+    report = ChatBenchmark(_FlakyChat(), ["안녕"], iterations=2, warmup=1).run()
+
+    [error] = report["errors"]
+    assert error["iteration"] == "warmup" and "예열 시간 초과" in error["error"]
+    assert len(report["samples"]) == 2
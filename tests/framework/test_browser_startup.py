@@ -0,0 +1,65 @@
+# 테스트 프레임워크 자체(브라우저 기동)의 성능 측정
+
+import json
+import os
+import statistics
+import time
+
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from src.config.settings import BASE_URL
+from tests.helpers.chrome_profile import ChromeProfileTemplate
+
+RUNS = int(os.getenv("STARTUP_BENCH_RUNS", "3"))
+# 실제 사이트로 Chrome을 2 × RUNS + 1번 띄우므로 명시적으로 켰을 때만 실행
+STARTUP_BENCH = os.getenv("STARTUP_BENCH", "0") == "1"
+
+# 비로그인 상태로 BASE_URL 진입 → 로그인 페이지의 아이디 입력창이 보이면 "사용 가능" 시점
+FIRST_INTERACTIVE = (By.CSS_SELECTOR, "input[autocomplete='username'], input[type='email']")
+
+
+def _launch_to_interactive(launch):
+    """Chrome 실행 ~ 첫 화면 입력 가능 시점까지 걸린 시간(초)"""
+    start = time.perf_counter()
+    driver = launch()
+    try:
+        driver.get(BASE_URL)
+        WebDriverWait(driver, 30).until(EC.visibility_of_element_located(FIRST_INTERACTIVE))
+        return time.perf_counter() - start
+    finally:
+        driver.quit()
+
+
+@pytest.mark.performance
+@pytest.mark.low
+@pytest.mark.skipif(not STARTUP_BENCH, reason="STARTUP_BENCH=1일 때만 실행")
+def test_profile_template_startup_benchmark(browser_factory, tmp_path):
+    # 1) 템플릿 생성 (측정 대상 아님)
+    template = ChromeProfileTemplate(str(tmp_path))
+    template.build(launch=browser_factory, warm_urls=[BASE_URL])
+
+    # 2) 빈 프로필 vs 템플릿 복제본 번갈아 측정 (네트워크 상태 변화 영향 분산)
+    cold, warm = [], []
+    for _ in range(RUNS):
+        cold.append(_launch_to_interactive(browser_factory))
+        warm.append(_launch_to_interactive(lambda: browser_factory(template.clone())))
+
+    result = {
+        "runs": RUNS,
+        "cold_median_s": round(statistics.median(cold), 3),
+        "template_median_s": round(statistics.median(warm), 3),
+        "cold_s": [round(t, 3) for t in cold],
+        "template_s": [round(t, 3) for t in warm],
+    }
+    print(f"[startup] 빈 프로필 {result['cold_median_s']}s / 템플릿 {result['template_median_s']}s (중앙값, {RUNS}회)")
+    allure.attach(
+        json.dumps(result, indent=2),
+        name="chrome_startup_benchmark",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    assert result["template_median_s"] < result["cold_median_s"], "프로필 템플릿이 빈 프로필보다 빠르지 않습니다."
@@ -0,0 +1,113 @@
+# 브라우저 없는 채팅 클라이언트 (로컬 SSE 대역 서버로 실행)
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.api.chat_client import ChatClient, ChatEndpoint, SSEParser, discover_endpoint, extract_delta
+from src.utils.load_generator import LoadGenerator, LoadProfile
+from src.utils.network_tracker import RequestRecord
+
+CHUNKS = ["안녕하세요", ", 저는 ", "Helpy", "입니다."]
+
+
+class _StandInChatHandler(BaseHTTPRequestHandler):
+    """쿠키가 있으면 받은 메시지 앞에 CHUNKS를 SSE로 흘려보내는 대역 서버"""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if "session=abc" not in (self.headers.get("Cookie") or ""):
+            self.send_response(401)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for chunk in CHUNKS + [f" ({body['messages'][-1]['content']})"]:
+            time.sleep(0.02)
+            payload = json.dumps({"choices": [{"delta": {"content": chunk}}]}, ensure_ascii=False)
+            self.wfile.write(f"data: {payload}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stand_in_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/chat"
+    server.shutdown()
+
+
+def _endpoint(url):
+    body = {"model": "helpy", "messages": [{"role": "user", "content": "__message__"}]}
+    return ChatEndpoint(url, "POST", {}, body, ["messages", 0, "content"])
+
+
+def _snapshot():
+    return {"cookies": [{"name": "session", "value": "abc", "domain": "127.0.0.1", "path": "/"}]}
+
+
+def test_streams_deltas_with_timing(stand_in_server):
+    client = ChatClient.from_snapshot(_endpoint(stand_in_server), _snapshot())
+    seen = []
+
+    result = client.send_message_observed("hi", on_delta=lambda ms, delta: seen.append((ms, delta)))
+
+    assert [delta for _, delta in seen][:4] == CHUNKS
+    assert result.text == "안녕하세요, 저는 Helpy입니다. (hi)"
+    assert result.chunks == 5
+    assert result.ttft_ms >= 15 and result.generation_ms >= 60
+    assert seen == sorted(seen)
+
+
+def test_unauthenticated_request_fails(stand_in_server):
+    import requests
+    with pytest.raises(requests.HTTPError):
+        ChatClient(_endpoint(stand_in_server)).send_message("hi")
+
+
+def test_load_generator_drives_browserless_sessions(stand_in_server):
+    profile = LoadProfile(sessions=8, ramp_up_s=0.1, steady_s=0.5, rate_per_min=600, bucket_s=0.2)
+    factory = lambda index: ChatClient.from_snapshot(_endpoint(stand_in_server), _snapshot())
+
+    report = LoadGenerator(factory, ["a", "b"], profile).run()
+
+    assert report["phases"]["steady"]["requests"] > 8
+    assert report["phases"]["steady"]["errors"] == 0
+
+
+def test_discover_endpoint_from_tracker_records():
+    def record(url, post_data, mime, started, finished):
+        return RequestRecord("1", url, "POST", "Fetch", started, finished, 200, 10, False, None,
+                             {"Content-Type": "application/json", "User-Agent": "Chrome"}, post_data, mime)
+
+    records = [
+        record("https://host/api/log", json.dumps({"event": "send", "text": "안녕"}), "application/json", 0, 0.1),
+        record("https://host/api/chat", json.dumps({"thread": 1, "input": {"text": "안녕"}}), "text/event-stream", 0, 3),
+    ]
+    endpoint = discover_endpoint(records, "안녕")
+
+    assert endpoint.url == "https://host/api/chat"
+    assert endpoint.headers == {"Content-Type": "application/json"}
+    assert endpoint.build_body("다른 질문") == {"thread": 1, "input": {"text": "다른 질문"}}
+    assert discover_endpoint(records, "없는 메시지") is None
+
+
+def test_sse_parsing_and_delta_extraction():
+    parser = SSEParser()
+    assert parser.feed('data: {"text": "a') == []
+    assert parser.feed('b"}\r\n\r\ndata: x\ndata: y\n') == ['{"text": "ab"}']
+    assert parser.flush() == ["x\ny"]
+
+    assert extract_delta('{"text": "ab"}') == "ab"
+    assert extract_delta('"plain"') == "plain"
+    assert extract_delta("raw text") == "raw text"
+    assert extract_delta('{"type": "ping"}') == ""
+    assert extract_delta("[DONE]") is None
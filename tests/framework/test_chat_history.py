@@ -0,0 +1,174 @@
+# 가상 스크롤 대화 목록 수집 (브라우저 없이 Virtuoso 흉내 드라이버로 실행)
+
+import pytest
+
+from src.utils import chat_history, settle
+from src.utils.chat_history import ChatHistoryEntry, ChatHistorySnapshot
+
+
+class _VirtualListDriver:
+    """
+    보이는 범위(+overscan)의 행만 돌려주는 가짜 드라이버
+    pages: 끝에 닿아 UI 안정화를 기다릴 때마다 뒤에 붙일 추가 페이지 크기 목록
+    """
+
+    ITEM = 44
+    HEIGHT = 440
+    OVERSCAN = 2
+
+    def __init__(self, size, pages=()):
+        self.titles = [f"대화 {i:04d}" for i in range(size)]
+        self.pages = list(pages)
+        self.scroll_top = 0
+        self.harvest_calls = 0
+        self.settle_calls = 0
+        self.reveal_calls = []
+
+    def rendered(self):
+        first = max(0, self.scroll_top // self.ITEM - self.OVERSCAN)
+        return first, min(len(self.titles), (self.scroll_top + self.HEIGHT) // self.ITEM + self.OVERSCAN)
+
+    @property
+    def max_scroll(self):
+        return max(0, len(self.titles) * self.ITEM - self.HEIGHT)
+
+    def execute_async_script(self, script, *args):
+        if script == chat_history.REVEAL_SCRIPT:
+            self.reveal_calls.append(args[4])
+            target = args[4]
+            if "id" in target:
+                index = int(target["id"][1:])
+            elif "position" in target:
+                index = target["position"]
+            else:  # 제목은 그려진 행에서만 찾음
+                rendered = range(*self.rendered())
+                index = next((i for i in rendered if self.titles[i] == target["title"]), None)
+            if index is None or index >= len(self.titles):
+                return None
+            return {"link": f"a-{index}", "menu": f"button-{index}"}
+        if script == settle.SETTLE_SCRIPT:
+            self.settle_calls += 1
+            if self.pages:
+                start = len(self.titles)
+                self.titles += [f"대화 {i:04d}" for i in range(start, start + self.pages.pop(0))]
+            return {"settled": True}
+
+        self.harvest_calls += 1
+        _, _, _, _, step, reset, _ = args
+        if reset:
+            self.scroll_top = 0
+        else:
+            self.scroll_top = min(self.max_scroll, self.scroll_top + int(self.HEIGHT * step))
+        first, last = self.rendered()
+        rows = [
+            {"id": f"c{i:05d}", "href": f"http://app/ai-helpy-chat/chats/c{i:05d}",
+             "title": self.titles[i], "timestamp": None, "position": i, "hasMenu": True}
+            for i in range(first, last)
+        ]
+        return {"rows": rows, "atEnd": self.scroll_top >= self.max_scroll, "scrollTop": self.scroll_top}
+
+
+def test_harvests_every_row_once_in_order():
+    driver = _VirtualListDriver(500)
+    rows = list(chat_history.iter_chat_history(driver))
+
+    assert [r.position for r in rows] == list(range(500))
+    assert len({r.id for r in rows}) == 500
+    # 한 화면(10행)씩 내려가므로 스크립트 호출은 대략 행 수 / 9
+    assert driver.harvest_calls < 500 / 8
+
+
+def test_stops_scrolling_when_caller_breaks():
+    driver = _VirtualListDriver(5000)
+    for row in chat_history.iter_chat_history(driver):
+        if row.title == "대화 0030":
+            break
+    assert driver.harvest_calls <= 5
+    assert driver.scroll_top < 50 * driver.ITEM
+
+
+def test_waits_once_at_end_for_more_pages():
+    driver = _VirtualListDriver(40, pages=[30])
+    rows = list(chat_history.iter_chat_history(driver))
+
+    assert len(rows) == 70
+    assert driver.settle_calls == 2  # 추가 페이지 1번 + 더 없음을 확인 1번
+
+
+def test_stops_when_scroll_makes_no_progress():
+    class _StuckList(_VirtualListDriver):
+        """scrollTop이 중간에서 더 내려가지 않는데 atEnd도 되지 않는 목록 (높이 계산이 어긋난 경우)"""
+
+        max_scroll = 20 * _VirtualListDriver.ITEM
+
+        def execute_async_script(self, script, *args):
+            state = super().execute_async_script(script, *args)
+            if script == chat_history.HARVEST_SCRIPT:
+                state["atEnd"] = False
+            return state
+
+    driver = _StuckList(100)
+    rows = list(chat_history.iter_chat_history(driver))
+
+    assert [r.position for r in rows] == list(range(len(rows)))
+    assert driver.settle_calls == 1  # 끝으로 보고 추가 로드를 한 번만 기다림
+    assert driver.harvest_calls < 20
+
+
+def test_missing_list_yields_nothing():
+    class _NoList:
+        def execute_async_script(self, script, *args):
+            return None
+
+    assert list(chat_history.iter_chat_history(_NoList())) == []
+
+
+def _entry(i, title=None):
+    return ChatHistoryEntry(f"c{i}", f"/chats/c{i}", title or f"대화 {i}", i, True)
+
+
+def test_capture_with_limit_is_partial():
+    driver = _VirtualListDriver(500)
+    snapshot = ChatHistorySnapshot.capture(driver, limit=25)
+
+    assert len(snapshot) == 25 and not snapshot.complete
+    assert snapshot.by_id("c00024").title == "대화 0024"
+    assert snapshot.by_title("0003", exact=False).position == 3
+    assert driver.harvest_calls <= 4
+
+
+def test_snapshot_diff():
+    before = ChatHistorySnapshot([_entry(1), _entry(2), _entry(3)])
+    after = ChatHistorySnapshot([_entry(4), _entry(1, "바뀐 이름"), _entry(3)])
+
+    diff = before.diff(after)
+    assert [e.id for e in diff.added] == ["c4"]
+    assert [e.id for e in diff.removed] == ["c2"]
+    assert diff.renamed == [(_entry(1), _entry(1, "바뀐 이름"))]
+    assert before.diff(before).empty
+
+
+def test_entries_are_compact_and_immutable():
+    entry = _entry(1)
+    assert not hasattr(entry, "__dict__")
+    with pytest.raises(AttributeError):
+        entry.title = "다른 제목"
+
+
+def test_menu_button_by_position_reveals_only_that_row():
+    driver = _VirtualListDriver(1000)
+    assert chat_history.find_menu_buttons(driver, target=700) == ["button-700"]
+    assert driver.reveal_calls == [{"position": 700}]
+    assert driver.harvest_calls == 0
+
+
+def test_menu_button_by_title_falls_back_to_harvest():
+    driver = _VirtualListDriver(1000)
+    assert chat_history.find_menu_buttons(driver, target="대화 0005") == ["button-5"]
+    assert driver.harvest_calls == 0  # 처음 화면에 그려져 있음
+
+    assert chat_history.find_menu_buttons(driver, target="대화 0040") == ["button-40"]
+    assert driver.reveal_calls[-1] == {"id": "c00040", "position": 40}
+    assert driver.harvest_calls <= 6  # 찾은 화면에서 멈춤
+
+    assert chat_history.find_menu_buttons(_VirtualListDriver(30), target="없는 대화") == []
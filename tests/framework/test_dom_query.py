@@ -0,0 +1,41 @@
+# query_many 인자 처리 (브라우저 없이 실행)
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from src.utils import dom_query
+
+
+class _RecordingDriver:
+    """execute_script 인자만 기록하는 가짜 드라이버"""
+
+    def __init__(self):
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append(args)
+        return []
+
+    def find_elements(self, by, value):
+        return []
+
+
+def test_single_locator_is_expanded_in_page():
+    driver = _RecordingDriver()
+    dom_query.query_many(driver, (By.ID, "credit"), ["text", "css::before:content"])
+
+    specs, fields = driver.calls[0]
+    assert specs == [{"alternatives": [["css", '[id="credit"]']]}]
+    assert fields == ["text", "css::before:content"]
+
+
+@pytest.mark.parametrize("field", ["color", "attr:", "css::before", "rect:x"])
+def test_unknown_field_is_rejected(field):
+    with pytest.raises(ValueError):
+        dom_query.query_many(_RecordingDriver(), (By.CSS_SELECTOR, "a"), [field])
+
+
+def test_empty_targets_skip_round_trip():
+    driver = _RecordingDriver()
+    assert dom_query.query_many(driver, [], ["text"]) == []
+    assert driver.calls == []
@@ -0,0 +1,77 @@
+# ChromeDriver 경로 결정 (가짜 드라이버 파일로 실행, 네트워크/Chrome 없음)
+
+import os
+import sys
+import types
+
+import pytest
+
+from tests.helpers import driver_resolver
+from tests.helpers.driver_resolver import ChromeDriverResolver, _EXE
+
+
+def _fake_driver(directory, version):
+    """버전 문자열을 내용으로 가진 가짜 드라이버 파일"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, _EXE)
+    with open(path, "w") as f:
+        f.write(version)
+    return path
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch):
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setattr(driver_resolver, "installed_chrome_version", lambda: "131.0.6778.86")
+    monkeypatch.setattr(driver_resolver, "driver_version", lambda path: open(path).read() or None)
+    monkeypatch.setattr(driver_resolver.shutil, "which", lambda name: None)
+    return ChromeDriverResolver(str(tmp_path / "cache"), wdm_dir=str(tmp_path / "wdm"))
+
+
+def _forbid_download(monkeypatch):
+    def install(self):
+        raise AssertionError("다운로드하면 안 됨")
+
+    module = types.SimpleNamespace(ChromeDriverManager=type("Manager", (), {"install": install}))
+    monkeypatch.setitem(sys.modules, "webdriver_manager.chrome", module)
+
+
+def test_cache_hit_picks_newest_matching_major(resolver, monkeypatch):
+    _forbid_download(monkeypatch)
+    _fake_driver(os.path.join(resolver.cache_dir, "131.0.6778.69"), "131.0.6778.69")
+    newest = _fake_driver(os.path.join(resolver.cache_dir, "131.0.6778.85"), "131.0.6778.85")
+    _fake_driver(os.path.join(resolver.cache_dir, "132.0.6834.57"), "132.0.6834.57")
+    _fake_driver(os.path.join(resolver.cache_dir, "131.0.6778.99-backup"), "131.0.6778.99")  # 버전 폴더가 아님
+
+    assert resolver.resolve() == newest
+
+
+def test_version_mismatch_reuses_matching_local_driver(resolver, monkeypatch, tmp_path):
+    _forbid_download(monkeypatch)
+    _fake_driver(os.path.join(resolver.cache_dir, "130.0.6723.91"), "130.0.6723.91")
+    _fake_driver(str(tmp_path / "wdm" / "drivers" / "chromedriver" / "linux64" / "old"), "129.0.6668.100")
+    _fake_driver(str(tmp_path / "wdm" / "drivers" / "chromedriver" / "linux64" / "new"), "131.0.6778.85")
+
+    path = resolver.resolve()
+    assert path == os.path.join(resolver.cache_dir, "131.0.6778.85", _EXE)
+    assert open(path).read() == "131.0.6778.85"
+    assert not [f for f in os.listdir(os.path.dirname(path)) if f.endswith(".tmp")]
+
+
+def test_download_fallback_is_stored_in_cache(resolver, monkeypatch, tmp_path):
+    downloaded = _fake_driver(str(tmp_path / "download"), "131.0.6778.85")
+    module = types.SimpleNamespace(
+        ChromeDriverManager=type("Manager", (), {"install": lambda self: downloaded})
+    )
+    monkeypatch.setitem(sys.modules, "webdriver_manager.chrome", module)
+
+    path = resolver.resolve()
+    assert path == os.path.join(resolver.cache_dir, "131.0.6778.85", _EXE)
+    # 다음 실행은 네트워크 없이 캐시에서
+    _forbid_download(monkeypatch)
+    assert resolver.resolve() == path
+
+
+def test_download_failure_leaves_it_to_selenium(resolver, monkeypatch):
+    _forbid_download(monkeypatch)
+    assert resolver.resolve() is None
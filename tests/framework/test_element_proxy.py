@@ -0,0 +1,66 @@
+# ElementProxy stale 재탐색 (브라우저 없이 가짜 드라이버로 실행)
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from src.utils.element_proxy import RESOLVE_STATS, ElementProxy
+from src.utils.locator_chain import LocatorChain, css
+
+LOCATOR = (By.CSS_SELECTOR, "a.chat-item")
+
+
+class _ReRenderingDriver:
+    """live_ids에 없는 요소 id로 명령이 오면 stale 예외를 내는 가짜 드라이버"""
+
+    def __init__(self, live_ids):
+        self.live_ids = list(live_ids)
+        self.commands = []
+
+    def execute(self, command, params):
+        self.commands.append((command, params["id"]))
+        if params["id"] not in self.live_ids:
+            raise StaleElementReferenceException("stale")
+        return {"value": f"text of {params['id']}"}
+
+    def find_elements(self, by, value):
+        return [WebElement(self, element_id) for element_id in self.live_ids]
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    RESOLVE_STATS.reset()
+    yield
+    RESOLVE_STATS.reset()
+
+
+def test_stale_element_is_re_resolved_by_index():
+    driver = _ReRenderingDriver(["a0", "a1"])
+    proxy = ElementProxy(WebElement(driver, "a1"), LOCATOR, index=1)
+
+    # 목록이 다시 그려져 기존 id가 모두 무효화됨
+    driver.live_ids = ["b0", "b1"]
+    assert proxy.text == "text of b1"
+    assert proxy.id == "b1"
+    assert RESOLVE_STATS.summary()["by_locator"] == {"css selector=a.chat-item": 1}
+
+
+def test_gives_up_when_element_is_gone():
+    driver = _ReRenderingDriver(["a0"])
+    proxy = ElementProxy(WebElement(driver, "a0"), LOCATOR, index=0)
+
+    driver.live_ids = []
+    with pytest.raises(StaleElementReferenceException):
+        proxy.text
+    assert RESOLVE_STATS.summary()["failed"] == 1
+
+
+def test_re_resolve_does_not_count_as_chain_hit():
+    chain = LocatorChain(css("a.chat-item"), name="대화 항목")
+    driver = _ReRenderingDriver(["a0"])
+    proxy = ElementProxy(WebElement(driver, "a0"), chain, index=0)
+
+    driver.live_ids = ["b0"]
+    assert proxy.text == "text of b0"
+    assert not chain.hits  # fallback 리포트는 대기에서 실제로 쓰인 대안만 셈
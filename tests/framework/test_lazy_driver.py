@@ -0,0 +1,52 @@
+# 지연 실행 드라이버 핸들 검증 (실제 Chrome 없이 동작)
+
+from tests.helpers.lazy_driver import LazyDriver
+
+
+class _FakeDriver:
+    title = "fake"
+
+
+class _FakePool:
+    def __init__(self):
+        self.acquired = 0
+        self.released = []
+
+    def acquire(self):
+        self.acquired += 1
+        return _FakeDriver()
+
+    def release(self, driver):
+        self.released.append(driver)
+
+
+def test_lazy_driver_starts_on_first_command():
+    pool = _FakePool()
+    driver = LazyDriver(pool)
+    assert not driver.started
+    assert pool.acquired == 0
+
+    assert driver.title == "fake"
+    assert driver.title == "fake"
+    assert driver.started
+    assert pool.acquired == 1
+
+    driver.release()
+    assert len(pool.released) == 1
+    assert not driver.started
+
+
+def test_lazy_driver_release_without_start_is_noop():
+    pool = _FakePool()
+    driver = LazyDriver(pool)
+    repr(driver)
+    driver.release()
+    assert pool.acquired == 0
+    assert pool.released == []
+
+
+def test_unused_driver_fixture_never_launches_chrome(driver):
+    # autouse 실패 캡처 fixture도 driver를 요청하지만 이 테스트의 핸들은 브라우저를 띄우지 않아야 함
+    # (세션 풀의 launched는 앞서 실행된 다른 테스트의 Chrome까지 세므로 보지 않음)
+    assert isinstance(driver, LazyDriver)
+    assert not driver.started
@@ -0,0 +1,65 @@
+# 부하 생성기 단계/집계 (브라우저 없이 가짜 세션으로 실행)
+
+import time
+
+import pytest
+
+from src.utils.load_generator import LoadGenerator, LoadProfile, time_series
+from src.utils.stream_observer import StreamingResult
+
+
+class _FakeSession:
+
+    def __init__(self, fail_prompt=None):
+        self.fail_prompt = fail_prompt
+        self.sent = []
+
+    def send_message_observed(self, prompt, timeout):
+        self.sent.append(prompt)
+        time.sleep(0.01)
+        if prompt == self.fail_prompt:
+            raise TimeoutError("응답 없음")
+        return StreamingResult(5.0, 5.0, 10.0, 3, 1, 300.0, 100.0, 2, True, "abc")
+
+
+def test_sessions_ramp_up_and_send_at_target_rate():
+    sessions = {}
+
+    def factory(index):
+        sessions[index] = _FakeSession(fail_prompt="b" if index == 1 else None)
+        return sessions[index]
+
+    # 세션당 초당 10회, 0.2초에 걸쳐 2개 세션 시작 → 0.6초 실행
+    profile = LoadProfile(sessions=2, ramp_up_s=0.2, steady_s=0.4, rate_per_min=600, bucket_s=0.2)
+    report = LoadGenerator(factory, ["a", "b"], profile).run()
+
+    assert set(sessions) == {0, 1}
+    assert 3 <= len(sessions[1].sent) <= len(sessions[0].sent) <= 7
+    samples = report["samples"]
+    assert min(s["started_s"] for s in samples if s["session"] == 1) >= 0.1
+    assert all(s["error"].startswith("TimeoutError") for s in samples if s["prompt"] == "b" and s["session"] == 1)
+    assert report["phases"]["steady"]["errors"] > 0
+    assert report["phases"]["steady"]["complete_ms"]["p50"] == 10.0
+    assert [b["phase"] for b in report["series"][:2]] == ["ramp_up", "steady"]
+
+
+def test_session_factory_failure_is_recorded():
+    def factory(index):
+        raise RuntimeError("로그인 실패")
+
+    report = LoadGenerator(factory, ["a"], LoadProfile(sessions=1, ramp_up_s=0, steady_s=0.1)).run()
+    assert report["samples"][0]["error"].startswith("세션 생성 실패 RuntimeError")
+
+
+def test_time_series_buckets_include_idle_intervals():
+    profile = LoadProfile(sessions=1, ramp_up_s=0, steady_s=3, bucket_s=1)
+    series = time_series([], profile, {0: (0.0, 1.5)})
+
+    assert [b["t"] for b in series] == [0, 1, 2, 3]
+    assert [b["active_sessions"] for b in series] == [1, 1, 0, 0]
+    assert series[0]["ttft_p50_ms"] is None and series[0]["error_rate"] == 0.0
+
+
+def test_requires_prompts():
+    with pytest.raises(ValueError):
+        LoadGenerator(lambda i: None, [])
@@ -0,0 +1,53 @@
+# LocatorChain 대안 컴파일/평가 (브라우저 없이 실행)
+
+from selenium.webdriver.common.by import By
+
+from src.utils import dom_wait
+from src.utils.locator_chain import LocatorChain, css, role, text, xpath
+
+
+class _FakeElement:
+    def __init__(self, name):
+        self.name = name
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class _FakeDriver:
+    """(by, value)별로 정해 둔 요소를 돌려주는 가짜 드라이버"""
+
+    def __init__(self, elements):
+        self.elements = elements
+
+    def find_elements(self, by, value):
+        return self.elements.get((by, value), [])
+
+
+def test_alternatives_compile_to_css_and_xpath():
+    chain = LocatorChain(
+        css("button.save"),
+        text("Save", tag="button"),
+        role("button", name="Save"),
+        (By.ID, "save"),
+    )
+    kinds = [kind for kind, _ in dom_wait.to_alternatives(chain)]
+    assert kinds == ["css", "xpath", "xpath", "css"]
+    assert chain.compiled[1][1] == "//button[text()[normalize-space(.)='Save']]"
+    assert "self::button" in chain.compiled[2][1]
+
+
+def test_first_matching_alternative_wins_and_is_recorded():
+    chain = LocatorChain(css(".missing"), xpath("//p[@id='a']"), css("#b"), name="테스트 체인")
+    driver = _FakeDriver({
+        (By.XPATH, "//p[@id='a']"): [_FakeElement("a")],
+        (By.CSS_SELECTOR, "#b"): [_FakeElement("b")],
+    })
+
+    assert chain.condition("clickable")(driver).name == "a"
+    assert [e.name for e in chain.find_elements(driver)] == ["a"]
+    assert dict(chain.hits) == {1: 2}
+    assert str(chain) == "테스트 체인"
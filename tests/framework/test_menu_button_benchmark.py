@@ -0,0 +1,112 @@
+# 대화 메뉴 버튼 조회 비용: 기존 방식(0.5초 sleep 스크롤 + 항목별 find_elements) vs 대상 행만 꺼내는 스크립트 조회
+# 대화 기록이 많은 계정을 로컬 대역 앱으로 재현해서 측정 (네트워크 지연과 분리)
+# 두 방식 모두 "목록 뒤쪽 같은 대화의 메뉴 버튼 하나"를 찾고, 같은 행의 버튼인지 확인한 뒤 시간을 비교
+
+import json
+import os
+import statistics
+import time
+
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from src.pages.chat_page import ChatPage
+from tests.helpers.standin import StandinApp, StandinConfig
+from tests.helpers.standin.browser import sign_in
+
+RUNS = int(os.getenv("MENU_BENCH_RUNS", "3"))
+HISTORY = int(os.getenv("MENU_BENCH_HISTORY", "500"))
+MENU_BENCH = os.getenv("MENU_BENCH", "0") == "1"
+
+TARGET_POSITION = HISTORY * 4 // 5
+TARGET_TITLE = f"대화 기록 {HISTORY - TARGET_POSITION:04d}"  # 대역 앱 기록은 최신 순으로 번호가 줄어듦
+
+
+def _legacy_menu_button(driver, title):
+    """기존 흐름: 한 화면씩 스크롤(0.5초 sleep) → 그려진 항목마다 find_elements로 제목 비교 → svg 부모 button"""
+    scroller = driver.find_element(By.CSS_SELECTOR, "[data-virtuoso-scroller]")
+    driver.execute_script("arguments[0].scrollTop = 0", scroller)
+    prev_top = -1
+    while True:
+        container = driver.find_element(By.CSS_SELECTOR, '[data-testid="virtuoso-item-list"]')
+        for item in container.find_elements(By.CSS_SELECTOR, "a"):
+            titles = item.find_elements(By.CSS_SELECTOR, ChatPage.TITLE_IN_ITEM)
+            if titles and titles[0].text == title:
+                return item.find_element(By.CSS_SELECTOR, "svg[data-testid='ellipsis-verticalIcon']") \
+                    .find_element(By.XPATH, "./..")
+        driver.execute_script("arguments[0].scrollTop += arguments[0].clientHeight", scroller)
+        time.sleep(0.5)
+        curr_top = driver.execute_script("return arguments[0].scrollTop", scroller)
+        if curr_top == prev_top:
+            return None
+        prev_top = curr_top
+
+
+def _row_href(driver, button):
+    return driver.execute_script("return arguments[0].closest('a').href", button)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+@pytest.mark.performance
+@pytest.mark.low
+@pytest.mark.skipif(not MENU_BENCH, reason="MENU_BENCH=1일 때만 실행")
+def test_menu_button_discovery_benchmark(browser_factory):
+    app = StandinApp(StandinConfig(history_size=HISTORY, api_latency_ms=0)).start()
+    driver = browser_factory()
+    try:
+        sign_in(driver, app)
+        page = ChatPage(driver)
+        page.wait_for_present(ChatPage.CHAT_ITEMS, 10)
+
+        legacy, by_title, by_position = [], [], []
+        for _ in range(RUNS):
+            driver.refresh()
+            page.wait_for_present(ChatPage.CHAT_ITEMS, 10)
+            elapsed, button = _timed(lambda: _legacy_menu_button(driver, TARGET_TITLE))
+            legacy.append(elapsed)
+            assert button is not None, f"기존 방식으로 '{TARGET_TITLE}'를 찾지 못함"
+            expected = _row_href(driver, button)
+
+            driver.refresh()
+            page.wait_for_present(ChatPage.CHAT_ITEMS, 10)
+            elapsed, buttons = _timed(lambda: page.get_menu_buttons(target=TARGET_TITLE))
+            by_title.append(elapsed)
+            assert len(buttons) == 1 and _row_href(driver, buttons[0]) == expected
+
+            # 위치를 알고 있으면 그 행만 바로 꺼냄
+            driver.refresh()
+            page.wait_for_present(ChatPage.CHAT_ITEMS, 10)
+            elapsed, buttons = _timed(lambda: page.get_menu_buttons(target=TARGET_POSITION))
+            by_position.append(elapsed)
+            assert len(buttons) == 1 and _row_href(driver, buttons[0]) == expected
+    finally:
+        driver.quit()
+        app.stop()
+
+    result = {
+        "runs": RUNS,
+        "history": HISTORY,
+        "target": {"position": TARGET_POSITION, "title": TARGET_TITLE},
+        "legacy_median_s": round(statistics.median(legacy), 3),
+        "title_median_s": round(statistics.median(by_title), 3),
+        "position_median_s": round(statistics.median(by_position), 3),
+        "legacy_s": [round(t, 3) for t in legacy],
+        "title_s": [round(t, 3) for t in by_title],
+        "position_s": [round(t, 3) for t in by_position],
+    }
+    print(f"[menu] 기존 {result['legacy_median_s']}s / 제목 {result['title_median_s']}s / "
+          f"위치 {result['position_median_s']}s (대화 {HISTORY}개 중 {TARGET_POSITION}번째, 중앙값 {RUNS}회)")
+    allure.attach(
+        json.dumps(result, ensure_ascii=False, indent=2),
+        name="menu_button_benchmark",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    assert result["title_median_s"] < result["legacy_median_s"]
+    assert result["position_median_s"] < result["legacy_median_s"]
@@ -0,0 +1,68 @@
+# NetworkTracker 이벤트 처리 (브라우저 없이 가짜 performance 로그로 실행)
+
+import json
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from src.utils.network_tracker import NetworkTracker
+
+
+class _FakeLogDriver:
+    """get_log("performance")가 쌓아 둔 이벤트를 한 번씩 돌려주는 가짜 드라이버"""
+
+    session_id = "fake"
+
+    def __init__(self):
+        self.pending = []
+
+    def emit(self, method, **params):
+        message = {"message": {"method": method, "params": params}}
+        self.pending.append({"message": json.dumps(message)})
+
+    def get_log(self, name):
+        entries, self.pending = self.pending, []
+        return entries
+
+
+def _start(driver, request_id, url, ts):
+    driver.emit("Network.requestWillBeSent", requestId=request_id,
+                request={"url": url, "method": "POST"}, type="Fetch", timestamp=ts)
+
+
+def _finish(driver, request_id, ts, size=100):
+    driver.emit("Network.loadingFinished", requestId=request_id, timestamp=ts, encodedDataLength=size)
+
+
+def test_inflight_and_records_by_pattern():
+    driver = _FakeLogDriver()
+    tracker = NetworkTracker(driver)
+    _start(driver, "1", "https://host/api/chat", 10.0)
+    _start(driver, "2", "https://host/static/app.js", 10.0)
+
+    assert tracker.inflight() == 2
+    assert tracker.inflight("/api/") == 1
+
+    _finish(driver, "1", 10.25)
+    assert tracker.inflight("/api/") == 0
+    [record] = tracker.records("*/api/*")
+    assert record.method == "POST"
+    assert record.duration_ms == pytest.approx(250)
+
+    # lean 모드 등 다른 소비자는 원본 이벤트를 넘겨받음
+    assert len(tracker.take_events()) == 3
+    assert tracker.take_events() == []
+
+
+def test_wait_for_network_idle_requires_request_after_mark():
+    driver = _FakeLogDriver()
+    tracker = NetworkTracker(driver)
+    mark = tracker.mark()
+
+    with pytest.raises(TimeoutException):
+        tracker.wait_for_network_idle(idle_ms=0, timeout=0.2, after=mark)
+
+    _start(driver, "1", "https://host/api/chat", 1.0)
+    _finish(driver, "1", 2.0)
+    done = tracker.wait_for_network_idle(idle_ms=50, timeout=2, after=mark)
+    assert [r.request_id for r in done] == ["1"]
@@ -0,0 +1,56 @@
+# CompletionDetector 스크립트 분할 호출 (브라우저 없이 가짜 드라이버로 실행)
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from src.utils.response_completion import CARD_SELECTOR, CompletionDetector
+
+
+class _ScriptedDriver:
+    """execute_async_script 결과를 순서대로 돌려주는 가짜 드라이버"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = []
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(args)
+        return self.results.pop(0)
+
+
+def test_state_is_carried_across_script_chunks():
+    carry = {"text": "안녕", "changedAt": 1234.0, "sawStop": True}
+    driver = _ScriptedDriver([{"reason": None, "carry": carry}, {"reason": "stop", "carry": carry}])
+    detector = CompletionDetector(quiet_ms=2000, settle_ms=100)
+
+    assert detector.wait(driver, prev_count=3) == "stop"
+    selector, prev_count, options, first_carry = driver.calls[0][:4]
+    assert (prev_count, first_carry) == (3, None)
+    assert options["quietMs"] == 2000 and options["settleMs"] == 100
+    assert options["cardSelector"] == CARD_SELECTOR
+    assert driver.calls[1][3] == carry
+
+
+@pytest.mark.parametrize("reason", ["toolbar", "stop", "quiet"])
+def test_first_text_switches_to_completion_budget(reason):
+    carry = {"text": "안", "changedAt": 1234.0, "sawStop": False}
+    driver = _ScriptedDriver([{"reason": "started", "carry": carry}, {"reason": reason, "carry": carry}])
+
+    assert CompletionDetector().wait(driver, prev_count=0, timeout=5, completion_timeout=60) == reason
+    first, second = driver.calls
+    assert first[2]["reportStart"] and first[4] <= 5000
+    # 첫 글자 이후에는 완료 한도로 (스크립트 한 번은 최대 20초씩)
+    assert not second[2]["reportStart"] and second[3] == carry and second[4] > 5000
+
+
+def test_timeout_raises():
+    driver = _ScriptedDriver([])
+    with pytest.raises(TimeoutException):
+        CompletionDetector().wait(driver, prev_count=0, timeout=0)
+
+
+def test_completion_timeout_raises_after_first_text():
+    carry = {"text": "안", "changedAt": 1234.0, "sawStop": False}
+    driver = _ScriptedDriver([{"reason": "started", "carry": carry}])
+    with pytest.raises(TimeoutException, match="시작된 뒤"):
+        CompletionDetector().wait(driver, prev_count=0, timeout=5, completion_timeout=0)
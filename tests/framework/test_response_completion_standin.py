@@ -0,0 +1,84 @@
+# CompletionDetector 종료 판정 (로컬 대역 앱 + 실제 브라우저)
+# 종료 신호를 하나씩 가려서 툴바 / 중지 버튼 / 글자 멈춤 판정이 각각 스트리밍이 끝난 뒤에만 나오는지 확인
+
+import time
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from src.pages.chat_page import ChatPage
+from src.utils.response_completion import CompletionDetector
+from tests.helpers.standin import StandinApp, StandinConfig
+from tests.helpers.standin.browser import sign_in
+
+# 4글자 / 30ms → 2초 가까이 스트리밍 (중간에 끊기면 글자 수로 드러남)
+RESPONSE = "대역 앱이 천천히 보내는 응답입니다. " * 12
+NO_MATCH = "[data-testid='never-rendered']"
+
+# 아직 쓰는 중인 답변: 본문 안 코드 블록 복사 버튼 + 답변 바깥(페이지 뒤쪽)의 같은 아이콘 버튼, 툴바는 없음
+INJECT_STREAMING_ANSWER = """
+const copy = '<button type="button" class="code-copy"><svg class="lucide lucide-copy" width="16" height="16"></svg>복사</button>';
+const wrapper = document.createElement('div');
+wrapper.innerHTML = '<div role="article">코드 예시입니다<pre><code>print(1)</code>' + copy + '</pre></div>';
+document.getElementById('messages').appendChild(wrapper);
+const outside = document.createElement('div');
+outside.className = 'composer-extra';
+outside.innerHTML = copy;
+document.body.appendChild(outside);
+"""
+ADD_ANSWER_TOOLBAR = """
+const wrapper = Array.from(document.querySelectorAll('div[role="article"]')).pop().parentElement;
+addToolbar(wrapper);
+document.querySelectorAll('.composer-extra').forEach(el => el.remove());
+"""
+
+
+@pytest.fixture(scope="module")
+def standin_chat(browser_factory):
+    app = StandinApp(StandinConfig(response_text=RESPONSE, api_latency_ms=0)).start()
+    driver = browser_factory()
+    try:
+        sign_in(driver, app)
+        page = ChatPage(driver)
+        page.wait_for_present(ChatPage.CHAT_ITEMS, 10)
+        yield driver
+    finally:
+        driver.quit()
+        app.stop()
+
+
+def _send(driver, message):
+    prev_count = len(driver.find_elements(By.CSS_SELECTOR, 'div[role="article"]'))
+    input_box = driver.find_element(By.CSS_SELECTOR, 'textarea:not([aria-hidden="true"])')
+    input_box.send_keys(message)
+    input_box.send_keys("\n")
+    return prev_count
+
+
+@pytest.mark.parametrize("reason, detector", [
+    ("toolbar", CompletionDetector()),
+    ("stop", CompletionDetector(toolbar_selector=NO_MATCH)),
+    ("quiet", CompletionDetector(toolbar_selector=NO_MATCH, stop_selector=NO_MATCH, quiet_ms=1000)),
+])
+def test_each_finish_reason_waits_for_full_response(standin_chat, reason, detector):
+    driver = standin_chat
+    prev_count = _send(driver, f"{reason} 판정 확인")
+
+    assert detector.wait(driver, prev_count, timeout=10, completion_timeout=20) == reason
+    latest = driver.find_elements(By.CSS_SELECTOR, 'div[role="article"]')[-1]
+    assert latest.text.strip() == RESPONSE.strip()
+
+
+def test_copy_buttons_outside_answer_toolbar_do_not_finish(standin_chat):
+    driver = standin_chat
+    prev_count = len(driver.find_elements(By.CSS_SELECTOR, 'div[role="article"]'))
+    driver.execute_script(INJECT_STREAMING_ANSWER)
+    # 중지 버튼 신호가 없는 화면이어도 코드 블록/페이지의 복사 버튼으로 끝내면 안 됨 → 글자 멈춤으로만 종료
+    detector = CompletionDetector(stop_selector=NO_MATCH, quiet_ms=1500, settle_ms=300)
+
+    started = time.monotonic()
+    assert detector.wait(driver, prev_count, timeout=5, completion_timeout=10) == "quiet"
+    assert time.monotonic() - started >= 1.5
+
+    driver.execute_script(ADD_ANSWER_TOOLBAR)
+    assert detector.wait(driver, prev_count, timeout=5, completion_timeout=10) == "toolbar"
@@ -0,0 +1,94 @@
+# 로컬 대역 앱 (브라우저 없이 HTTP만 확인)
+
+import pytest
+import requests
+
+from src.api.chat_client import ChatClient, ChatEndpoint
+from tests.helpers.standin import StandinApp, StandinConfig
+
+FAST = dict(chars_per_tick=10, tick_ms=5, first_token_ms=50, api_latency_ms=0)
+
+
+@pytest.fixture
+def standin():
+    apps = []
+
+    def start(**overrides):
+        app = StandinApp(StandinConfig(**{**FAST, **overrides})).start()
+        apps.append(app)
+        return app
+
+    yield start
+    for app in apps:
+        app.stop()
+
+
+def _login(app):
+    session = requests.Session()
+    response = session.post(
+        f"{app.origin}/accounts/signin",
+        params={"continue_to": app.base_url},
+        data={"username": "qa@standin.local", "password": "pw"},
+        allow_redirects=False,
+    )
+    assert response.status_code == 302
+    assert response.headers["Location"] == app.base_url
+    return session
+
+
+def _client(app, session):
+    endpoint = ChatEndpoint(f"{app.origin}/api/chat", "POST", {}, {"message": "", "conversation_id": None},
+                            ["message"])
+    return ChatClient(endpoint, session=session, timeout=10)
+
+
+def test_redirects_to_login_until_signed_in(standin):
+    app = standin()
+    response = requests.get(app.base_url, allow_redirects=False)
+    assert response.status_code == 302
+    assert response.headers["Location"].startswith("/accounts/signin/me?continue_to=")
+
+    page = _login(app).get(app.base_url)
+    assert page.status_code == 200
+    assert 'data-testid="virtuoso-item-list"' in page.text
+
+
+def test_streams_response_at_configured_pace(standin):
+    app = standin(response_text="가" * 100)
+    result = _client(app, _login(app)).send_message_observed("안녕")
+
+    assert result.text == "가" * 100
+    assert result.chunks == 10
+    assert result.ttft_ms >= 50
+    assert result.generation_ms >= 9 * 5
+
+
+def test_chat_creates_conversation_on_top_of_history(standin):
+    app = standin(history_size=200)
+    session = _login(app)
+    assert len(session.get(f"{app.origin}/api/conversations").json()) == 200
+
+    _client(app, session).send_message("새 질문입니다")
+    conversations = session.get(f"{app.origin}/api/conversations").json()
+    assert len(conversations) == 201
+    assert conversations[0]["title"] == "새 질문입니다"
+
+    target = conversations[1]["id"]
+    assert session.patch(f"{app.origin}/api/conversations/{target}", json={"title": "바뀐 이름"}).ok
+    assert session.delete(f"{app.origin}/api/conversations/{conversations[2]['id']}").ok
+    titles = [c["title"] for c in session.get(f"{app.origin}/api/conversations").json()]
+    assert titles[1] == "바뀐 이름" and len(titles) == 200
+
+
+def test_error_injection(standin):
+    app = standin(error_rate=1.0)
+    with pytest.raises(requests.HTTPError) as excinfo:
+        _client(app, _login(app)).send_message("안녕")
+    assert excinfo.value.response.status_code == 500
+
+
+def test_config_from_env():
+    config = StandinConfig.from_env({"STANDIN_HISTORY": "1000", "STANDIN_ERROR_RATE": "0.25"})
+    assert config.history_size == 1000
+    assert config.error_rate == 0.25
+    assert config.tick_ms == StandinConfig().tick_ms
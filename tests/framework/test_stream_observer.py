@@ -0,0 +1,35 @@
+# StreamingResult 지표 계산 (브라우저 없이 COLLECT_SCRIPT 결과 형태로 실행)
+
+from src.utils.stream_observer import StreamingResult, count_tokens
+
+
+def test_metrics_from_chunks():
+    raw = {
+        "installedAt": 900.0,
+        "submitAt": 1000.0,
+        "chunks": [[1800.0, 5], [2300.0, 20], [2800.0, 40]],
+        "text": "안녕하세요, 저는 Helpy 입니다.",
+    }
+    result = StreamingResult.from_raw(raw)
+
+    assert result.ttft_ms == 800.0
+    assert result.generation_ms == 1000.0
+    assert result.total_ms == 1800.0
+    assert result.chunks == 3
+    assert result.chars == len(raw["text"])
+    assert result.tokens == count_tokens(raw["text"]) == 6
+    assert result.tokens_per_sec == 6.0
+
+
+def test_falls_back_to_install_time_and_handles_single_chunk():
+    raw = {"installedAt": 100.0, "submitAt": None, "chunks": [[400.0, 3]], "text": "abc"}
+    result = StreamingResult.from_raw(raw, completed=False)
+
+    assert result.ttft_ms == 300.0
+    assert result.generation_ms == 0
+    assert result.tokens_per_sec == 0.0
+    assert not result.completed
+
+
+def test_no_response_returns_none():
+    assert StreamingResult.from_raw({"installedAt": 0, "submitAt": 10, "chunks": [], "text": ""}) is None
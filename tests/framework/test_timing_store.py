@@ -0,0 +1,72 @@
+# 적응형 타임아웃 계산 (브라우저 없이 실행)
+
+import json
+
+from src.config import settings
+from src.utils.timing_store import TimingStore, percentile, store_path
+
+KEY = "visible css selector=#chat"
+
+
+def _store(tmp_path, **kwargs):
+    return TimingStore(str(tmp_path / "timings.json"), min_samples=5, **kwargs)
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 99) == 99
+    assert percentile(values, 50) == 50
+    assert percentile([3.0], 99) == 3.0
+
+
+def test_default_until_enough_samples(tmp_path):
+    store = _store(tmp_path)
+    for _ in range(4):
+        store.record(KEY, 0.5)
+    assert store.timeout_for(KEY, default=30) == 30
+
+    store.record(KEY, 0.5)
+    assert store.timeout_for(KEY, default=30) == 5  # 0.5 × 3 → 하한 5초
+
+
+def test_learned_timeout_is_clamped(tmp_path):
+    store = _store(tmp_path, factor=3.0, min_timeout=1, max_timeout=20)
+    for seconds in (2, 2, 2, 2, 4):
+        store.record(KEY, seconds)
+    assert store.timeout_for(KEY, default=30) == 12
+
+    store.record(KEY, 9)
+    assert store.timeout_for(KEY, default=30) == 20
+
+
+def test_save_merges_and_reports_drift(tmp_path):
+    first = _store(tmp_path)
+    for _ in range(5):
+        first.record(KEY, 1.0)
+    first.save()
+
+    # 다른 워커가 저장한 기록과 합쳐짐
+    second = _store(tmp_path)
+    for _ in range(3):
+        second.record(KEY, 2.5)
+    assert second.drift_report() == [(KEY, 1.0, 2.5)]
+    second.save()
+
+    with open(tmp_path / "timings.json", encoding="utf-8") as f:
+        assert json.load(f)[KEY] == [1.0] * 5 + [2.5] * 3
+
+
+def test_replay_and_standin_runs_use_separate_store(monkeypatch):
+    monkeypatch.setattr(settings, "TIMING_STORE_PATH", None)
+    monkeypatch.setattr(settings, "STANDIN_APP", False)
+    monkeypatch.setattr(settings, "TRAFFIC_MODE", "off")
+    assert store_path() == ".cache/wait_timings.json"
+
+    monkeypatch.setattr(settings, "TRAFFIC_MODE", "replay")
+    assert store_path() == ".cache/wait_timings.replay.json"
+
+    monkeypatch.setattr(settings, "STANDIN_APP", True)
+    assert store_path() == ".cache/wait_timings.standin.json"
+
+    monkeypatch.setattr(settings, "TIMING_STORE_PATH", "custom/timings.json")
+    assert store_path() == "custom/timings.json"
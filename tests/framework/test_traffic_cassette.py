@@ -0,0 +1,88 @@
+# 트래픽 카세트 저장/매칭/재생 응답 (브라우저 없이 실행)
+
+import base64
+
+from src.utils.network_tracker import RequestRecord
+from tests.helpers.traffic_cassette import (
+    CassetteMatcher,
+    FetchReplayer,
+    cassette_path,
+    load_cassette,
+    save_cassette,
+    to_entry,
+)
+
+SSE_BODY = "data: 안녕\n\ndata: [DONE]\n\n"
+
+
+def _record(url, post_data=None, started=10.0):
+    return RequestRecord(
+        "1", url, "POST", "Fetch", started, started + 2.0, 200, 120, False, None,
+        {}, post_data, "text/event-stream", started + 0.5, ((started + 0.6, 60), (started + 1.9, 60)),
+    )
+
+
+def test_entry_round_trip(tmp_path):
+    entry = to_entry(_record("https://host/api/chat", '{"q": "a"}'), SSE_BODY)
+    assert entry["time"] == 2000.0
+    assert entry["timings"] == {"wait": 500.0, "receive": 1500.0}
+    assert entry["_chunks"] == [[600.0, 60], [1900.0, 60]]
+
+    path = cassette_path(str(tmp_path), "tests/chat_basic/test_chat_basic.py::test_chat_basic_001")
+    assert path.endswith("tests_chat_basic_test_chat_basic.py_test_chat_basic_001.har.json.gz")
+    save_cassette(path, "nodeid", [entry])
+    assert load_cassette(path) == [entry]
+    assert load_cassette(str(tmp_path / "missing.har.json.gz")) is None
+
+
+def test_matcher_prefers_same_body_and_replays_in_order():
+    entries = [
+        to_entry(_record("https://host/api/chat", '{"q": "a"}'), "first"),
+        to_entry(_record("https://host/api/chat", '{"q": "b"}'), "second"),
+        to_entry(_record("https://host/api/chat", '{"q": "a"}'), "third"),
+    ]
+    matcher = CassetteMatcher(entries)
+    text = lambda e: e["response"]["content"]["text"]
+
+    assert text(matcher.match("POST", "https://host/api/chat", '{"q": "b"}')) == "second"
+    assert text(matcher.match("POST", "https://host/api/chat", '{"q": "a"}')) == "first"
+    assert text(matcher.match("POST", "https://host/api/chat", '{"q": "a"}')) == "third"
+    assert text(matcher.match("POST", "https://host/api/chat", '{"q": "a"}')) == "third"
+    assert matcher.match("GET", "https://host/api/chat") is None
+
+
+class _PostRecorder:
+    def __init__(self):
+        self.posted = []
+
+    def post(self, method, params, session_id=None):
+        self.posted.append((method, params))
+
+
+def _paused(url, post_data=None):
+    request = {"method": "POST", "url": url, "headers": {"Origin": "https://qaproject.elice.io"}}
+    if post_data:
+        request["postData"] = post_data
+    return {"requestId": "interception-1", "request": request}
+
+
+def test_replayer_fulfills_known_and_fails_unknown_requests():
+    replayer = FetchReplayer([to_entry(_record("https://host/api/chat"), SSE_BODY)], timing="zero")
+    replayer.cdp = _PostRecorder()
+
+    replayer.handle(_paused("https://host/api/chat"))
+    replayer.handle(_paused("https://host/api/unknown"))
+
+    (method, fulfill), (failed, fail) = replayer.cdp.posted
+    assert method == "Fetch.fulfillRequest"
+    assert base64.b64decode(fulfill["body"]).decode("utf-8") == SSE_BODY
+    assert {"name": "Access-Control-Allow-Origin", "value": "https://qaproject.elice.io"} in fulfill["responseHeaders"]
+    assert (failed, fail["errorReason"]) == ("Fetch.failRequest", "InternetDisconnected")
+    assert replayer.served == 1 and replayer.misses == ["POST https://host/api/unknown"]
+
+
+def test_replayer_can_pass_unknown_requests_to_live_server():
+    replayer = FetchReplayer([], missing="live")
+    replayer.cdp = _PostRecorder()
+    replayer.handle(_paused("https://host/api/unknown"))
+    assert replayer.cdp.posted == [("Fetch.continueRequest", {"requestId": "interception-1"})]
@@ -0,0 +1,76 @@
+# 요소 대기 방식(event / poll)별 감지 지연 마이크로벤치마크
+
+import json
+import os
+import statistics
+import time
+
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from src.pages import base_page
+from src.pages.base_page import BasePage
+
+RUNS = int(os.getenv("WAIT_BENCH_RUNS", "10"))
+WAIT_BENCH = os.getenv("WAIT_BENCH", "0") == "1"
+
+TARGET = (By.CSS_SELECTOR, "#bench-target")
+
+# delay ms 뒤에 요소를 추가하고, 추가한 시각(epoch ms)을 window.__insertedAt에 남긴다
+SCHEDULE_INSERT = """
+const delay = arguments[0];
+document.body.innerHTML = '';
+window.__insertedAt = null;
+setTimeout(() => {
+    const el = document.createElement('div');
+    el.id = 'bench-target';
+    el.textContent = 'ready';
+    document.body.appendChild(el);
+    window.__insertedAt = Date.now();
+}, delay);
+"""
+
+
+def _detection_latency_ms(page, delay_ms):
+    """요소가 DOM에 추가된 시점 ~ wait_for_element가 반환한 시점 (ms)"""
+    page.driver.execute_script(SCHEDULE_INSERT, delay_ms)
+    page.wait_for_element(TARGET, timeout=10)
+    returned_at = time.time() * 1000
+    inserted_at = page.driver.execute_script("return window.__insertedAt;")
+    return returned_at - inserted_at
+
+
+@pytest.mark.performance
+@pytest.mark.low
+@pytest.mark.skipif(not WAIT_BENCH, reason="WAIT_BENCH=1일 때만 실행")
+def test_wait_backend_detection_latency(driver, monkeypatch):
+    driver.get("data:text/html,<html><body></body></html>")
+    page = BasePage(driver)
+
+    latencies = {"event": [], "poll": []}
+    for i in range(RUNS):
+        # 폴링 주기(500ms)와 겹치지 않도록 지연을 조금씩 바꿔 가며 번갈아 측정
+        delay_ms = 150 + (i * 37) % 400
+        for backend in latencies:
+            monkeypatch.setattr(base_page, "WAIT_BACKEND", backend)
+            latencies[backend].append(_detection_latency_ms(page, delay_ms))
+
+    result = {
+        "runs": RUNS,
+        "event_median_ms": round(statistics.median(latencies["event"]), 1),
+        "poll_median_ms": round(statistics.median(latencies["poll"]), 1),
+        "event_max_ms": round(max(latencies["event"]), 1),
+        "poll_max_ms": round(max(latencies["poll"]), 1),
+    }
+    print(
+        f"[wait] 감지 지연 중앙값 event {result['event_median_ms']}ms / "
+        f"poll {result['poll_median_ms']}ms ({RUNS}회)"
+    )
+    allure.attach(
+        json.dumps(result, indent=2),
+        name="wait_backend_latency",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    assert result["event_median_ms"] < result["poll_median_ms"]
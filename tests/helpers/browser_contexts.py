@@ -0,0 +1,106 @@
+"""
+하나의 Chrome 안에서 테스트/계정별로 격리된 브라우저 컨텍스트 사용
+
+Target.createBrowserContext로 만든 컨텍스트는 시크릿 창처럼 쿠키/스토리지가 완전히 분리된다.
+Chrome 프로세스를 새로 띄우지 않으므로 생성에 수 밀리초면 충분하고,
+여러 계정을 같은 브라우저 안에서 나란히 로그인시켜 둘 수 있다.
+
+ChromeDriver의 창 핸들은 CDP target id와 같으므로,
+컨텍스트 안에 만든 탭은 driver.switch_to.window()로 그대로 전환해서 쓴다.
+"""
+
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from tests.helpers.cdp_client import BrowserCDP, CDPError
+
+
+class BrowserContext:
+    """격리된 컨텍스트 + 그 안의 탭 하나"""
+
+    def __init__(self, manager, context_id, handle):
+        self.manager = manager
+        self.context_id = context_id
+        self.handle = handle
+
+    @property
+    def driver(self):
+        return self.manager.driver
+
+    def activate(self):
+        """이 컨텍스트의 탭으로 전환 (이후 driver 명령은 이 컨텍스트에서 실행)"""
+        self.driver.switch_to.window(self.handle)
+        return self.driver
+
+    def close(self):
+        self.manager.close_context(self)
+
+
+class BrowserContextManager:
+    """
+    사용 예)
+        ctx = browser_contexts.new_context()      # 새 컨텍스트의 탭으로 전환됨
+        login(ADMIN2)                              # 이 컨텍스트에만 로그인
+        browser_contexts.activate_default()        # 원래 탭으로 복귀
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.contexts = []
+        self._cdp = None
+        self._default_handle = None
+
+    def _browser(self):
+        if self._cdp is None:
+            self._default_handle = self.driver.current_window_handle
+            self._cdp = BrowserCDP(self.driver)
+        return self._cdp
+
+    def new_context(self, url="about:blank", activate=True):
+        """새 컨텍스트 + 탭 생성 (activate=True면 바로 전환)"""
+        cdp = self._browser()
+        start = time.perf_counter()
+        context_id = cdp.send("Target.createBrowserContext")["browserContextId"]
+        target_id = cdp.send(
+            "Target.createTarget", {"url": url, "browserContextId": context_id}
+        )["targetId"]
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"[context] 컨텍스트 생성 {elapsed_ms:.0f}ms")
+
+        context = BrowserContext(self, context_id, target_id)
+        self.contexts.append(context)
+        if activate:
+            context.activate()
+        return context
+
+    def activate_default(self):
+        """컨텍스트를 만들기 전의 원래 탭으로 복귀"""
+        if self._default_handle:
+            self.driver.switch_to.window(self._default_handle)
+        return self.driver
+
+    def close_context(self, context):
+        if context not in self.contexts:
+            return
+        self.contexts.remove(context)
+        try:
+            self._cdp.send("Target.closeTarget", {"targetId": context.handle})
+        except CDPError:
+            pass
+        try:
+            self._cdp.send("Target.disposeBrowserContext", {"browserContextId": context.context_id})
+        except CDPError:
+            pass
+
+    def close(self):
+        """모든 컨텍스트 정리 후 원래 탭으로 복귀"""
+        for context in list(self.contexts):
+            self.close_context(context)
+        if self._cdp is not None:
+            self._cdp.close()
+            self._cdp = None
+            try:
+                self.activate_default()
+            except WebDriverException:
+                pass
@@ -0,0 +1,84 @@
+"""
+브라우저 레벨 CDP 클라이언트
+
+driver.execute_cdp_cmd()는 현재 탭(page) 세션으로만 명령을 보내기 때문에
+Target.createBrowserContext 같은 브라우저 전용 명령은 거부된다.
+ChromeDriver가 띄운 Chrome의 debuggerAddress로 직접 웹소켓을 열어 브라우저 세션에 명령을 보낸다.
+"""
+
+import itertools
+import json
+import threading
+
+import requests
+import websocket
+
+
+def browser_ws_url(driver):
+    """ChromeDriver가 띄운 Chrome의 브라우저 웹소켓 주소"""
+    address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    return requests.get(f"http://{address}/json/version", timeout=5).json()["webSocketDebuggerUrl"]
+
+
+class CDPError(Exception):
+    pass
+
+
+class BrowserCDP:
+    """
+    브라우저 세션에 CDP 명령을 동기식으로 보내는 클라이언트
+    - send(method, params): 응답(result) 반환, 실패 시 CDPError
+    - 기다리는 동안 받은 이벤트는 events 리스트에 쌓임
+    - 이벤트 루프용: post()는 응답을 기다리지 않고 보내기만 하고, next_event()로 이벤트를 하나씩 꺼냄
+      (한 스레드가 next_event로 읽는 동안 다른 스레드는 post만 사용)
+    """
+
+    def __init__(self, driver, timeout=10):
+        # Chrome 111+는 Origin 헤더가 있는 웹소켓 연결을 거부하므로 헤더 생략
+        self._ws = websocket.create_connection(
+            browser_ws_url(driver), timeout=timeout, suppress_origin=True
+        )
+        self._timeout = timeout
+        self._ids = itertools.count(1)
+        self._write_lock = threading.Lock()
+        self.events = []
+
+    def post(self, method, params=None, session_id=None):
+        message = {"id": next(self._ids), "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        with self._write_lock:
+            self._ws.send(json.dumps(message))
+        return message
+
+    def next_event(self, timeout=1.0):
+        """쌓인 이벤트 또는 새로 받은 이벤트 하나 (timeout 안에 없으면 None, 명령 응답은 버림)"""
+        if self.events:
+            return self.events.pop(0)
+        self._ws.settimeout(timeout)
+        try:
+            reply = json.loads(self._ws.recv())
+        except websocket.WebSocketTimeoutException:
+            return None
+        finally:
+            self._ws.settimeout(self._timeout)
+        return reply if "method" in reply else None
+
+    def send(self, method, params=None, session_id=None):
+        message = self.post(method, params, session_id)
+
+        while True:
+            reply = json.loads(self._ws.recv())
+            if reply.get("id") != message["id"]:
+                if "method" in reply:
+                    self.events.append(reply)
+                continue
+            if "error" in reply:
+                raise CDPError(f"{method}: {reply['error'].get('message')}")
+            return reply.get("result", {})
+
+    def close(self):
+        try:
+            self._ws.close()
+        except Exception:
+            pass
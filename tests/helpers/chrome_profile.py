@@ -0,0 +1,101 @@
+"""
+미리 데워둔(pre-warmed) Chrome 프로필 템플릿
+
+- 실행마다 한 번, 한국어 설정 + HTTP 캐시/코드 캐시가 채워진 user-data-dir을 만든다.
+- 드라이버마다 템플릿을 임시 폴더로 복제해서 사용한다.
+  · Linux에서는 reflink(FICLONE)로 복제 → 지원 파일시스템(btrfs/xfs 등)에서는 실제 복사 없이 copy-on-write
+  · 지원하지 않으면 일반 복사로 대체
+  · 하드링크는 쓰지 않음: Chrome이 캐시 파일을 제자리에서 수정하므로 템플릿/다른 복제본까지 오염됨
+- 쿠키/스토리지/세션 파일은 복제하지 않는다 (빈 프로필과 같은 로그인 상태로 시작)
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+# 복제 대상에서 제외할 파일/폴더 (잠금 파일 + 로그인/세션 상태)
+SKIP_NAMES = {
+    "SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile",
+    "Cookies", "Cookies-journal",
+    "Local Storage", "Session Storage", "Sessions", "IndexedDB", "Service Worker",
+    "Current Session", "Current Tabs", "Last Session", "Last Tabs",
+}
+
+_FICLONE = 0x40049409  # linux/fs.h
+
+# 한 번 실패하면(파일시스템 미지원) 이후로는 바로 일반 복사
+_reflink_supported = sys.platform.startswith("linux")
+
+
+def _clone_file(src, dst):
+    """가능하면 reflink, 아니면 일반 복사"""
+    global _reflink_supported
+    if _reflink_supported:
+        import fcntl
+        try:
+            with open(src, "rb") as fs, open(dst, "wb") as fd:
+                fcntl.ioctl(fd.fileno(), _FICLONE, fs.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            _reflink_supported = False
+    return shutil.copy2(src, dst)
+
+
+def _ignore(_dir, names):
+    return [n for n in names if n in SKIP_NAMES]
+
+
+def wait_for_page_load(driver, timeout=30):
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+
+class ChromeProfileTemplate:
+    """
+    프로필 템플릿 + 복제본 관리
+    - root_dir: 템플릿과 복제본을 만들 폴더 (세션 종료 시 cleanup()으로 통째로 삭제)
+    """
+
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self.template_dir = os.path.join(root_dir, "template")
+
+    def build(self, launch, warm_urls=(), warm=None, visits=2):
+        """
+        템플릿 생성
+        - launch(user_data_dir): 해당 프로필로 Chrome을 띄우는 함수 (언어 prefs 등은 launch 쪽 옵션으로 기록됨)
+        - warm_urls: 캐시를 채울 URL 목록
+        - warm(driver): 추가 워밍 동작 (예: 로그인 후에만 내려받는 채팅 번들 로드)
+        - visits: URL당 방문 횟수 (V8 코드 캐시는 두 번째 실행부터 기록됨)
+        """
+        os.makedirs(self.template_dir, exist_ok=True)
+        driver = launch(self.template_dir)
+        try:
+            if warm:
+                warm(driver)
+            for _ in range(visits):
+                for url in warm_urls:
+                    driver.get(url)
+                    wait_for_page_load(driver)
+        finally:
+            # 종료해야 캐시가 디스크에 완전히 기록됨
+            driver.quit()
+        print(f"[profile] 템플릿 생성 완료: {self.template_dir}")
+        return self
+
+    def clone(self):
+        """템플릿 복제본 경로 반환 (드라이버마다 하나씩)"""
+        dest = tempfile.mkdtemp(prefix="profile-", dir=self.root_dir)
+        shutil.copytree(
+            self.template_dir, dest,
+            ignore=_ignore, copy_function=_clone_file, dirs_exist_ok=True,
+        )
+        return dest
+
+    def cleanup(self):
+        shutil.rmtree(self.root_dir, ignore_errors=True)
@@ -0,0 +1,138 @@
+"""
+세션 단위 Chrome 드라이버 풀
+
+- 테스트마다 Chrome을 새로 띄우는 대신, 이미 떠 있는(warm) 드라이버를 재사용한다.
+- 반납 시 쿠키/스토리지/추가 탭/방문 기록을 정리해서 다음 테스트에 깨끗한 상태로 넘긴다.
+- 정리에 실패한 드라이버는 풀에 다시 넣지 않고 바로 종료한다.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from src.utils import network_tracker
+
+# 반납 시 스토리지를 지울 origin 목록 (현재 열린 탭의 origin은 자동으로 추가됨)
+RESET_ORIGINS = (
+    "https://qaproject.elice.io",
+    "https://accounts.elice.io",
+    "https://payments.elice.io",
+)
+
+# 쿠키는 Network.clearBrowserCookies로 전부 지우고, 나머지는 origin 단위로 지운다.
+# HTTP 캐시는 일부러 남겨둔다 (다음 테스트의 첫 페이지 로드가 빨라짐)
+RESET_STORAGE_TYPES = "cookies,local_storage,indexeddb,websql,service_workers,cache_storage,file_systems"
+
+
+def _origin(url):
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def reset_driver(driver, origins=RESET_ORIGINS):
+    """
+    드라이버를 "방금 띄운 브라우저"와 같은 상태로 되돌린다.
+    - 열린 alert 닫기
+    - 새 탭 하나만 남기고 기존 탭 전부 닫기 (sessionStorage, 방문 기록까지 같이 사라짐)
+    - 모든 쿠키 + origin별 localStorage/IndexedDB 등 삭제
+    - performance 로그 + 네트워크 요청 기록 비우기
+    """
+    try:
+        driver.switch_to.alert.dismiss()
+    except WebDriverException:
+        pass
+
+    old_handles = driver.window_handles
+    visited = set(origins)
+    for handle in old_handles:
+        driver.switch_to.window(handle)
+        origin = _origin(driver.current_url)
+        if origin:
+            visited.add(origin)
+
+    # 새 탭은 방문 기록/sessionStorage가 비어 있으므로 기존 탭을 닫는 것만으로 정리된다
+    driver.switch_to.new_window("tab")
+    fresh_handle = driver.current_window_handle
+    for handle in old_handles:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(fresh_handle)
+
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    for origin in sorted(visited):
+        driver.execute_cdp_cmd(
+            "Storage.clearDataForOrigin",
+            {"origin": origin, "storageTypes": RESET_STORAGE_TYPES},
+        )
+
+    # 이전 테스트의 네트워크 로그/요청 기록이 다음 테스트 통계에 섞이지 않도록 비움
+    try:
+        driver.get_log("performance")
+    except WebDriverException:
+        pass
+    network_tracker.tracker_for(driver).reset()
+
+
+class DriverPool:
+    """
+    Chrome 드라이버 풀
+    - factory: 새 드라이버를 만드는 함수 (인자 없음)
+    - size: 풀에 대기시켜 둘 최대 드라이버 수 (0이면 풀링 없이 매번 종료)
+    """
+
+    def __init__(self, factory, size=1):
+        self.factory = factory
+        self.size = max(0, int(size))
+        self._idle = []
+        self._lock = threading.Lock()
+        self.launched = 0   # 실제로 Chrome을 띄운 횟수
+        self.reused = 0     # 풀에서 재사용한 횟수
+
+    def acquire(self):
+        """대기 중인 드라이버를 꺼내고, 없으면 새로 띄운다."""
+        with self._lock:
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+        driver = self.factory()
+        with self._lock:
+            self.launched += 1
+        return driver
+
+    def release(self, driver):
+        """드라이버를 정리한 뒤 풀에 반납한다. 풀이 꽉 찼거나 정리에 실패하면 종료한다."""
+        if self.size == 0:
+            self._dispose(driver)
+            return
+
+        try:
+            reset_driver(driver)
+        except WebDriverException as e:
+            print(f"[pool] 드라이버 정리 실패 → 종료: {e}")
+            self._dispose(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(driver)
+                return
+        self._dispose(driver)
+
+    def close(self):
+        """세션 종료 시 대기 중인 드라이버 전부 종료"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._dispose(driver)
+        print(f"[pool] Chrome 실행 {self.launched}회 / 재사용 {self.reused}회")
+
+    @staticmethod
+    def _dispose(driver):
+        network_tracker.discard(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
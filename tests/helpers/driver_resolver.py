@@ -0,0 +1,148 @@
+"""
+오프라인 우선 ChromeDriver 경로 결정
+
+세션마다 ChromeDriverManager().install()을 부르면 버전 조회(네트워크)가 매번 일어나고,
+인터넷이 막힌 러너에서는 실패한다. 아래 순서로 찾고, 네트워크는 마지막 수단으로만 쓴다.
+
+1. CHROMEDRIVER_PATH 환경변수 (명시 경로)
+2. 로컬 캐시 폴더 (<cache_dir>/<드라이버 버전>/chromedriver) 중 설치된 Chrome과 major 버전이 같은 것
+3. webdriver-manager 캐시(~/.wdm) 또는 PATH에 있는 chromedriver 중 major 버전이 같은 것 → 로컬 캐시로 복사
+4. ChromeDriverManager().install() (네트워크) → 받은 드라이버를 로컬 캐시에 저장
+
+어떤 경로를 왜 골랐는지는 [chromedriver] 로그로 남긴다.
+"""
+
+import glob
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+_EXE = "chromedriver.exe" if os.name == "nt" else "chromedriver"
+
+
+def _major(version):
+    m = re.match(r"(\d+)\.", version or "")
+    return m.group(1) if m else None
+
+
+def installed_chrome_version():
+    """설치된 Chrome 버전 (로컬 명령/레지스트리만 조회, 네트워크 사용 안 함)"""
+    try:
+        from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+
+def driver_version(path):
+    """'ChromeDriver 131.0.6778.85 (...)' → '131.0.6778.85'"""
+    try:
+        out = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    m = re.search(r"ChromeDriver\s+([\d.]+)", out)
+    return m.group(1) if m else None
+
+
+class ChromeDriverResolver:
+    """
+    설치된 Chrome에 맞는 ChromeDriver 경로를 결정
+    - cache_dir: 버전별 드라이버를 보관할 로컬 캐시 폴더
+    """
+
+    def __init__(self, cache_dir, wdm_dir=None):
+        self.cache_dir = cache_dir
+        self.wdm_dir = wdm_dir or os.path.join(os.path.expanduser("~"), ".wdm")
+
+    def _log(self, message):
+        print(f"[chromedriver] {message}")
+
+    # ======================
+    # ✅ 후보 탐색
+    # ======================
+
+    def _cached(self, major):
+        """로컬 캐시에서 major 버전이 같은 드라이버 (여러 개면 최신 버전)"""
+        found = []
+        for path in glob.glob(os.path.join(self.cache_dir, "*", _EXE)):
+            version = os.path.basename(os.path.dirname(path))
+            if not re.fullmatch(r"\d+(\.\d+)*", version):
+                continue  # 버전 폴더가 아닌 것 (수동으로 만든 폴더 등)
+            if _major(version) == major:
+                found.append((tuple(int(p) for p in version.split(".")), path))
+        return max(found)[1] if found else None
+
+    def _local_candidates(self):
+        """이미 디스크에 있는 다른 드라이버들 (webdriver-manager 캐시, PATH)"""
+        candidates = glob.glob(os.path.join(self.wdm_dir, "drivers", "chromedriver", "**", _EXE), recursive=True)
+        on_path = shutil.which("chromedriver")
+        if on_path:
+            candidates.append(on_path)
+        return candidates
+
+    def _store(self, path, version):
+        """드라이버를 <cache_dir>/<version>/ 에 복사하고 복사본 경로 반환"""
+        dest_dir = os.path.join(self.cache_dir, version)
+        os.makedirs(dest_dir, exist_ok=True)
+        dest = os.path.join(dest_dir, _EXE)
+        if os.path.abspath(path) != os.path.abspath(dest):
+            # 워커마다 다른 임시 파일에 복사한 뒤 교체 (xdist 워커가 동시에 등록해도 안전)
+            fd, tmp = tempfile.mkstemp(dir=dest_dir, suffix=".tmp")
+            os.close(fd)
+            shutil.copy2(path, tmp)
+            os.replace(tmp, dest)
+        os.chmod(dest, 0o755)
+        return dest
+
+    # ======================
+    # ✅ 경로 결정
+    # ======================
+
+    def resolve(self):
+        """
+        ChromeDriver 경로 반환
+        - None이면 Selenium(Selenium Manager)이 직접 찾도록 맡김
+        """
+        explicit = os.getenv("CHROMEDRIVER_PATH")
+        if explicit:
+            self._log(f"CHROMEDRIVER_PATH 사용: {explicit}")
+            return explicit
+
+        chrome = installed_chrome_version()
+        major = _major(chrome)
+        if major:
+            self._log(f"설치된 Chrome {chrome} (major {major})")
+
+            cached = self._cached(major)
+            if cached:
+                self._log(f"로컬 캐시 사용 (네트워크 없음): {cached}")
+                return cached
+
+            for path in self._local_candidates():
+                version = driver_version(path)
+                if _major(version) == major:
+                    stored = self._store(path, version)
+                    self._log(f"기존 드라이버 {version} 재사용 → 캐시 등록: {stored}")
+                    return stored
+            self._log(f"major {major}에 맞는 드라이버가 로컬에 없음 → 다운로드 시도")
+        else:
+            self._log("Chrome 버전 확인 실패 → 다운로드 시도")
+
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+        except Exception as e:
+            self._log(f"다운로드 실패 ({e}) → Selenium이 PATH에서 찾도록 맡김")
+            return None
+
+        version = driver_version(path)
+        if not version:
+            self._log(f"다운로드한 드라이버 버전 확인 실패, 캐시 없이 사용: {path}")
+            return path
+        stored = self._store(path, version)
+        self._log(f"다운로드한 드라이버 {version} 캐시 등록: {stored}")
+        return stored
@@ -0,0 +1,56 @@
+"""
+지연 실행(lazy) 드라이버 핸들
+
+driver fixture를 요청만 하고 실제로는 쓰지 않는 테스트(직접 브라우저를 띄우는 테스트,
+로그인 없이 끝나는 테스트 등)에서 Chrome이 뜨지 않도록,
+첫 WebDriver 명령(속성 접근) 시점에 풀에서 드라이버를 빌려온다.
+"""
+
+
+class LazyDriver:
+    """
+    WebDriver처럼 쓰는 핸들
+    - driver.get(...), driver.find_element(...) 등 첫 접근 시 pool.acquire()
+    - started: 실제 브라우저가 실행됐는지 여부
+    - wrapped_driver: 실제 WebDriver (없으면 이 시점에 실행)
+    - on_start(callback): 브라우저가 실행되는 시점에 callback(driver) 호출 (이미 실행 중이면 즉시)
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._driver = None
+        self._on_start = []
+
+    @property
+    def started(self):
+        return self._driver is not None
+
+    @property
+    def wrapped_driver(self):
+        if self._driver is None:
+            self._driver = self._pool.acquire()
+            for callback in self._on_start:
+                callback(self._driver)
+        return self._driver
+
+    def on_start(self, callback):
+        if self._driver is not None:
+            callback(self._driver)
+        else:
+            self._on_start.append(callback)
+
+    def __getattr__(self, name):
+        # __deepcopy__ 같은 특수 속성 조회로 브라우저가 뜨지 않도록 제외
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.wrapped_driver, name)
+
+    def release(self):
+        """빌려온 드라이버가 있으면 풀에 반납"""
+        if self._driver is not None:
+            driver, self._driver = self._driver, None
+            self._pool.release(driver)
+
+    def __repr__(self):
+        state = repr(self._driver) if self._driver is not None else "not started"
+        return f"<LazyDriver: {state}>"
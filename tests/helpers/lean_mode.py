@@ -0,0 +1,117 @@
+"""
+경량 렌더링(lean) 모드
+
+DOM 텍스트/개수만 확인하는 테스트에서 이미지·미디어·폰트·외부 분석 스크립트를 받지 않도록
+CDP Network.setBlockedURLs로 요청을 차단한다.
+
+- 차단 기준: 파일 확장자(리소스 종류) + 알려진 텔레메트리 호스트
+  (setBlockedURLs는 URL 패턴만 받으므로 리소스 종류는 확장자 패턴으로 표현)
+- 테스트가 끝나면 NetworkTracker가 모아 둔 Network 이벤트로 차단 건수/절감량을 집계한다.
+  차단된 요청은 실제로 받지 않았으므로, 같은 세션의 일반 렌더링 테스트에서 받았던 크기로 절감량을 추정한다.
+"""
+
+from collections import Counter
+
+from selenium.common.exceptions import WebDriverException
+
+from src.utils import network_tracker
+
+BLOCKED_EXTENSIONS = {
+    "Image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "ico", "bmp"),
+    "Font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "Media": ("mp4", "webm", "mp3", "m4a", "ogg", "wav"),
+}
+
+TELEMETRY_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "sentry.io", "amplitude.com", "hotjar.com", "clarity.ms",
+    "datadoghq.com", "mixpanel.com", "segment.io", "facebook.net",
+)
+
+
+def blocked_url_patterns():
+    patterns = []
+    for extensions in BLOCKED_EXTENSIONS.values():
+        for ext in extensions:
+            # 쿼리스트링이 붙은 URL도 차단
+            patterns += [f"*.{ext}", f"*.{ext}?*"]
+    patterns += [f"*{host}*" for host in TELEMETRY_HOSTS]
+    return patterns
+
+
+def enable(driver):
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns()})
+
+
+def disable(driver):
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+    except WebDriverException:
+        pass
+
+
+def read_network_events(driver):
+    """
+    이 드라이버에서 지금까지 발생한 Network.* 이벤트를 꺼낸다 (꺼낸 이벤트는 비워짐)
+    performance 로그는 NetworkTracker 하나만 읽으므로 테스트 중 wait_for_network_idle 등이
+    먼저 읽은 이벤트도 빠짐없이 포함된다.
+    """
+    return network_tracker.tracker_for(driver).take_events()
+
+
+class LeanReport:
+    """
+    세션 단위 네트워크 집계
+    - known_sizes: URL별 실제 전송 크기 (일반 렌더링 테스트에서 학습, 절감량 추정에 사용)
+    """
+
+    def __init__(self):
+        self.known_sizes = {}
+
+    def collect(self, events):
+        """이벤트 목록 → 테스트 1건의 요약 (known_sizes도 갱신)"""
+        requests = {}
+        transferred = 0
+        finished = 0
+        blocked = Counter()
+        blocked_urls = []
+
+        for event in events:
+            params = event["params"]
+            method = event["method"]
+            if method == "Network.requestWillBeSent":
+                requests[params["requestId"]] = (params["request"]["url"], params.get("type", "Other"))
+            elif method == "Network.loadingFinished":
+                size = int(params.get("encodedDataLength", 0))
+                transferred += size
+                finished += 1
+                url, _ = requests.get(params["requestId"], (None, None))
+                if url:
+                    self.known_sizes[url] = size
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                url, _ = requests.get(params["requestId"], (None, None))
+                blocked[params.get("type", "Other")] += 1
+                if url:
+                    blocked_urls.append(url)
+
+        saved_known = [self.known_sizes[u] for u in blocked_urls if u in self.known_sizes]
+        return {
+            "requests": finished,
+            "transferred_bytes": transferred,
+            "blocked_requests": sum(blocked.values()),
+            "blocked_by_type": dict(blocked),
+            "saved_bytes_estimate": sum(saved_known),
+            "saved_bytes_unknown": len(blocked_urls) - len(saved_known),
+        }
+
+    @staticmethod
+    def format(summary):
+        by_type = ", ".join(f"{k} {v}" for k, v in sorted(summary["blocked_by_type"].items())) or "-"
+        unknown = summary["saved_bytes_unknown"]
+        return (
+            f"[lean] 차단 {summary['blocked_requests']}건 ({by_type}) / "
+            f"절감 추정 {summary['saved_bytes_estimate'] / 1024:.1f}KB"
+            + (f" (+크기 미상 {unknown}건)" if unknown else "")
+            + f" / 실제 전송 {summary['requests']}건 {summary['transferred_bytes'] / 1024:.1f}KB"
+        )
@@ -0,0 +1,174 @@
+"""
+로그인 세션 스냅샷 캐시
+
+- 폼 로그인에 성공하면 쿠키(전체 도메인) + localStorage/sessionStorage를 계정별로 디스크에 저장한다.
+- 다음 로그인부터는 스냅샷을 브라우저에 바로 주입해서 로그인 폼/리다이렉트/언어 재로드를 건너뛴다.
+- 스냅샷이 만료(TTL)됐거나, 주입 후 메인 페이지 진입에 실패하면 스냅샷을 버리고 폼 로그인으로 돌아간다.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.pages.base_page import BasePage
+
+# Network.getAllCookies 결과 중 Network.setCookies에 그대로 넘길 수 있는 필드
+_COOKIE_FIELDS = (
+    "name", "value", "domain", "path", "secure", "httpOnly",
+    "sameSite", "expires", "priority", "sourceScheme", "sourcePort",
+)
+
+# 스냅샷의 localStorage/sessionStorage를 앱 스크립트보다 먼저 심어두는 스크립트
+_SEED_STORAGE_JS = """
+(function (origin, local, session) {
+    if (location.origin !== origin) return;
+    for (const [k, v] of Object.entries(local)) localStorage.setItem(k, v);
+    for (const [k, v] of Object.entries(session)) sessionStorage.setItem(k, v);
+})(%s, %s, %s);
+"""
+
+
+def _cookie_param(cookie):
+    param = {k: cookie[k] for k in _COOKIE_FIELDS if k in cookie}
+    # 세션 쿠키는 expires=-1로 내려오므로 그대로 넣으면 즉시 만료된다
+    if cookie.get("session") or param.get("expires", 0) < 0:
+        param.pop("expires", None)
+    return param
+
+
+class SessionCache:
+    """계정별 로그인 세션 스냅샷 저장소"""
+
+    def __init__(self, cache_dir, ttl, probe_timeout=10):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.probe_timeout = probe_timeout
+
+    # ======================
+    # ✅ 디스크 입출력
+    # ======================
+
+    def path_for(self, account):
+        # 파일명에 이메일이 그대로 드러나지 않도록 해시 사용
+        key = hashlib.sha1(account.username.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def load(self, account):
+        """유효한(TTL 이내) 스냅샷 반환, 없거나 만료되면 None"""
+        path = self.path_for(account)
+        try:
+            with open(path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - snapshot.get("created_at", 0) > self.ttl:
+            print(f"[세션 캐시] 만료된 스냅샷 삭제: {account.description}")
+            self.invalidate(account)
+            return None
+        return snapshot
+
+    def save(self, account, snapshot):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path_for(account)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        # 인증 쿠키가 들어있으므로 본인만 읽을 수 있게 저장
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def invalidate(self, account):
+        try:
+            os.remove(self.path_for(account))
+        except OSError:
+            pass
+
+    # ======================
+    # ✅ 브라우저 ↔ 스냅샷
+    # ======================
+
+    def capture(self, driver):
+        """현재 브라우저의 로그인 상태를 스냅샷으로 만든다 (메인 페이지에 있는 상태에서 호출)"""
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        origin, local, session = driver.execute_script(
+            "return [location.origin, Object.assign({}, localStorage), Object.assign({}, sessionStorage)];"
+        )
+        return {
+            "created_at": time.time(),
+            "url": driver.current_url,
+            "origin": origin,
+            "cookies": cookies,
+            "local_storage": local,
+            "session_storage": session,
+        }
+
+    def store(self, driver, account):
+        """폼 로그인 직후 호출: 스냅샷 저장 (실패해도 테스트는 계속 진행)"""
+        try:
+            self.save(account, self.capture(driver))
+            print(f"[세션 캐시] 스냅샷 저장: {account.description}")
+        except (OSError, WebDriverException) as e:
+            print(f"⚠️ [세션 캐시] 스냅샷 저장 실패: {e}")
+
+    def restore(self, driver, account):
+        """
+        스냅샷으로 로그인 상태 복원
+        - True: 메인 페이지에 로그인된 상태로 진입 완료
+        - False: 스냅샷 없음/만료/거부 → 호출 측에서 폼 로그인 진행
+        """
+        snapshot = self.load(account)
+        if not snapshot:
+            return False
+
+        try:
+            driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [_cookie_param(c) for c in snapshot["cookies"]]},
+            )
+            seed = driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": _SEED_STORAGE_JS % (
+                    json.dumps(snapshot["origin"]),
+                    json.dumps(snapshot["local_storage"]),
+                    json.dumps(snapshot["session_storage"]),
+                )},
+            )
+            try:
+                driver.get(snapshot["url"])
+            finally:
+                driver.execute_cdp_cmd(
+                    "Page.removeScriptToEvaluateOnNewDocument", {"identifier": seed["identifier"]}
+                )
+
+            if self._is_authenticated(driver):
+                print(f"[세션 캐시] 스냅샷으로 로그인 복원: {account.description}")
+                return True
+        except WebDriverException as e:
+            print(f"⚠️ [세션 캐시] 복원 중 오류: {e}")
+
+        # 서버가 세션을 거부함 (로그아웃/만료 등) → 스냅샷 폐기 후 폼 로그인
+        print(f"[세션 캐시] 스냅샷 거부됨 → 폼 로그인: {account.description}")
+        self.invalidate(account)
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except WebDriverException:
+            pass
+        return False
+
+    def _is_authenticated(self, driver):
+        """메인 페이지에 남아 프로필 버튼이 보이면 유효, 로그인 페이지로 튕기면 무효"""
+        try:
+            WebDriverWait(driver, self.probe_timeout).until(
+                lambda d: "signin" in d.current_url
+                or d.find_elements(*BasePage.PROFILE_BUTTON)
+            )
+        except TimeoutException:
+            return False
+        url = driver.current_url
+        return "/ai-helpy-chat" in url and "signin" not in url
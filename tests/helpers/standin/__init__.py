@@ -0,0 +1,3 @@
+from tests.helpers.standin.server import StandinApp, StandinConfig
+
+__all__ = ["StandinApp", "StandinConfig"]
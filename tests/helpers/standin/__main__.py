@@ -0,0 +1,28 @@
+"""
+대역 앱 단독 실행 (브라우저로 직접 확인할 때)
+    STANDIN_HISTORY=500 python -m tests.helpers.standin --port 8765
+"""
+
+import argparse
+import time
+
+from tests.helpers.standin import StandinApp, StandinConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Helpy 대역 앱")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    app = StandinApp(StandinConfig.from_env(), args.host, args.port).start()
+    print(f"[standin] {app.base_url} (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        app.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+# 대역 앱 브라우저 조작 (실제 서비스와 같은 로그인 폼 흐름)
+
+from urllib.parse import quote
+
+from selenium.webdriver.common.by import By
+
+
+def sign_in(driver, app, username="qa@standin.local", password="standin"):
+    """로그인 폼을 채워 대역 앱 채팅 화면으로 이동"""
+    driver.get(f"{app.login_url}?continue_to={quote(app.base_url, safe='')}")
+    driver.find_element(By.CSS_SELECTOR, "input[type='email']").send_keys(username)
+    driver.find_element(By.CSS_SELECTOR, "input[type='password']").send_keys(password)
+    driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
@@ -0,0 +1,273 @@
+"""
+오프라인용 Helpy 대역(stand-in) 앱
+
+페이지 객체가 의존하는 DOM 구조(div[role="article"], virtuoso-item-list, input[cmdk-input], #chat-submit,
+div[data-testid='ai-card'], button.MuiAvatar-root 등)만 재현한 작은 로컬 웹앱.
+네트워크 없는 환경에서 스위트 전체와 대기 로직을 돌려 "프레임워크 자체 비용"을 서비스 지연과 분리해서 잰다.
+
+- /accounts/signin/me        : 로그인 폼 (아무 아이디/비밀번호나 통과, continue_to로 이동)
+- /ai-helpy-chat[...]        : 채팅 / 대화 목록(가상 스크롤) / 검색 / 이름 변경·삭제 / 커스텀 에이전트
+- /api/chat                  : SSE 스트리밍 응답
+- /api/conversations[/<id>]  : 대화 목록 조회 / 이름 변경(PATCH) / 삭제(DELETE)
+
+StandinConfig로 스트리밍 속도, 첫 글자 지연, API 지연, 대화 목록 크기, 오류 주입 비율을 조절한다.
+
+    app = StandinApp(StandinConfig(history_size=500, error_rate=0.1)).start()
+    app.base_url   # http://127.0.0.1:<port>/ai-helpy-chat
+    app.stop()
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+from urllib.parse import parse_qs, quote, urlsplit
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+SESSION_COOKIE = "standin_session"
+
+DEFAULT_RESPONSE = (
+    "안녕하세요! 저는 Helpy 대역 앱입니다. 이 응답은 실제 모델이 아니라 로컬 서버가 "
+    "정해진 속도로 흘려보내는 문장이며, 테스트 프레임워크의 대기와 측정 비용만 확인하기 위해 사용됩니다."
+)
+
+
+class StandinConfig(NamedTuple):
+    chars_per_tick: int = 4       # 스트리밍 한 번에 보내는 글자 수
+    tick_ms: int = 30             # 스트리밍 간격
+    first_token_ms: int = 300     # 전송 → 첫 글자
+    api_latency_ms: int = 30      # 그 밖의 API 응답 지연
+    history_size: int = 30        # 미리 만들어 둘 대화 수
+    error_rate: float = 0.0       # /api/chat 이 500을 돌려줄 확률
+    response_text: str = DEFAULT_RESPONSE
+    seed: int = 0
+
+    @classmethod
+    def from_env(cls, environ=os.environ):
+        """STANDIN_* 환경변수 → 설정 (없는 값은 기본값)"""
+        fields = {
+            "chars_per_tick": ("STANDIN_CHARS_PER_TICK", int),
+            "tick_ms": ("STANDIN_TICK_MS", int),
+            "first_token_ms": ("STANDIN_FIRST_TOKEN_MS", int),
+            "api_latency_ms": ("STANDIN_API_LATENCY_MS", int),
+            "history_size": ("STANDIN_HISTORY", int),
+            "error_rate": ("STANDIN_ERROR_RATE", float),
+        }
+        values = {name: cast(environ[key]) for name, (key, cast) in fields.items() if key in environ}
+        return cls(**values)
+
+
+class ChatStore:
+    """대화 목록 (메모리, 최신 순)"""
+
+    def __init__(self, history_size):
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self.conversations = []
+        now = datetime.now()
+        for i in range(history_size):
+            self.create(f"대화 기록 {history_size - i:04d}", now - timedelta(minutes=history_size - i))
+
+    def create(self, title, updated=None):
+        with self._lock:
+            conversation = {
+                "id": f"c{self._next_id:05d}",
+                "title": title,
+                "updated": (updated or datetime.now()).isoformat(timespec="seconds"),
+            }
+            self._next_id += 1
+            self.conversations.insert(0, conversation)
+            return conversation
+
+    def find(self, conversation_id):
+        return next((c for c in self.conversations if c["id"] == conversation_id), None)
+
+    def rename(self, conversation_id, title):
+        with self._lock:
+            conversation = self.find(conversation_id)
+            if conversation:
+                conversation["title"] = title
+            return conversation
+
+    def delete(self, conversation_id):
+        with self._lock:
+            before = len(self.conversations)
+            self.conversations = [c for c in self.conversations if c["id"] != conversation_id]
+            return len(self.conversations) < before
+
+
+def _static(name):
+    with open(os.path.join(STATIC_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    app = None  # StandinApp (서버마다 하위 클래스로 주입)
+
+    def log_message(self, *args):
+        pass
+
+    # ---------- 응답 헬퍼 ----------
+
+    def _send(self, status, body=b"", content_type="text/plain; charset=utf-8", headers=()):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False), "application/json; charset=utf-8")
+
+    def _redirect(self, location, headers=()):
+        self._send(302, headers=[("Location", location), *headers])
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length).decode("utf-8") if length else ""
+
+    def _logged_in(self):
+        cookie = SimpleCookie(self.headers.get("Cookie") or "")
+        return SESSION_COOKIE in cookie
+
+    def _api_delay(self):
+        time.sleep(self.app.config.api_latency_ms / 1000)
+
+    # ---------- 라우팅 ----------
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        if path == "/accounts/signin/me":
+            return self._send(200, _static("login.html"), "text/html; charset=utf-8")
+        if path == "/" or path.startswith("/ai-helpy-chat"):
+            if not self._logged_in():
+                return self._redirect(f"/accounts/signin/me?continue_to={quote(self.path, safe='')}")
+            return self._send(200, _static("app.html"), "text/html; charset=utf-8")
+        if path == "/api/conversations":
+            self._api_delay()
+            return self._json(200, self.app.store.conversations)
+        if path == "/api/agents":
+            self._api_delay()
+            return self._json(200, [{"id": f"a{i}", "name": f"에이전트 {i}"} for i in range(1, 7)])
+        self._send(404, "not found")
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path == "/accounts/signin":
+            form = parse_qs(self._body())
+            if not form.get("username") or not form.get("password"):
+                return self._redirect("/accounts/signin/me?error=1")
+            target = parse_qs(url.query).get("continue_to", ["/ai-helpy-chat"])[0]
+            return self._redirect(target, [("Set-Cookie", f"{SESSION_COOKIE}=1; Path=/; HttpOnly")])
+        if url.path == "/api/logout":
+            return self._send(200, "{}", "application/json",
+                              [("Set-Cookie", f"{SESSION_COOKIE}=; Path=/; Max-Age=0")])
+        if url.path == "/api/chat":
+            return self._chat(json.loads(self._body() or "{}"))
+        self._send(404, "not found")
+
+    def do_PATCH(self):
+        conversation_id = urlsplit(self.path).path.rsplit("/", 1)[-1]
+        self._api_delay()
+        title = json.loads(self._body() or "{}").get("title", "")
+        conversation = self.app.store.rename(conversation_id, title)
+        self._json(200 if conversation else 404, conversation or {})
+
+    def do_DELETE(self):
+        conversation_id = urlsplit(self.path).path.rsplit("/", 1)[-1]
+        self._api_delay()
+        self._json(200 if self.app.store.delete(conversation_id) else 404, {})
+
+    # ---------- 채팅 스트리밍 ----------
+
+    def _chat(self, request):
+        config = self.app.config
+        if not self._logged_in():
+            return self._json(401, {"error": "unauthorized"})
+        if self.app.should_fail():
+            time.sleep(config.first_token_ms / 1000)
+            return self._json(500, {"error": "injected failure"})
+
+        message = (request.get("message") or "").strip()
+        conversation = self.app.store.find(request.get("conversation_id") or "")
+        if conversation is None:
+            conversation = self.app.store.create(message[:30] or "새 대화")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def chunk(data):
+            data = data.encode("utf-8")
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+
+        def event(payload):
+            chunk(f"data: {json.dumps(payload, ensure_ascii=False)}\n\n")
+
+        try:
+            event({"type": "conversation", "conversation": conversation})
+            time.sleep(config.first_token_ms / 1000)
+            text = config.response_text
+            step = max(1, config.chars_per_tick)
+            for i in range(0, len(text), step):
+                event({"delta": text[i:i + step]})
+                time.sleep(config.tick_ms / 1000)
+            chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 사용자가 중지 버튼을 눌러 연결을 끊음
+
+
+class StandinApp:
+
+    def __init__(self, config=StandinConfig(), host="127.0.0.1", port=0):
+        self.config = config
+        self.store = ChatStore(config.history_size)
+        self._random = random.Random(config.seed)
+        self._random_lock = threading.Lock()
+        handler = type("StandinHandler", (_Handler,), {"app": self})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def origin(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self):
+        return f"{self.origin}/ai-helpy-chat"
+
+    @property
+    def login_url(self):
+        return f"{self.origin}/accounts/signin/me"
+
+    def should_fail(self):
+        with self._random_lock:
+            return self._random.random() < self.config.error_rate
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="standin-app", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,248 @@
+"""
+API 트래픽 녹화(record) / 재생(replay)
+
+record: 테스트가 끝날 때 NetworkTracker 기록 중 API 요청(Fetch/XHR/EventSource)의 응답 본문을
+        Network.getResponseBody로 받아 테스트별 HAR 형식 카세트(*.har.json.gz)로 저장한다.
+replay: 브라우저 웹소켓(BrowserCDP)으로 현재 탭에 Fetch 가로채기를 걸고,
+        같은 요청(method + URL, 가능하면 본문까지)이 오면 카세트의 응답으로 Fetch.fulfillRequest 한다.
+        실제 서버에 가지 않으므로 LLM 응답 시간/내용이 매번 같고 크레딧도 쓰지 않는다.
+
+- 재생 타이밍: original(녹화 당시 걸린 시간만큼 기다렸다 응답) / zero(즉시 응답)
+  fulfillRequest는 본문을 한 번에 넘기므로 SSE도 녹화 시간이 지난 뒤 한꺼번에 도착한다.
+  (조각별 타이밍은 _chunks에 남겨 둠)
+- 카세트에 없는 요청: fail(네트워크 오류로 실패시키고 목록 보고) / live(실제 서버로 통과)
+- 페이지 이동(Document)과 정적 리소스는 가로채지 않는다. (로그인/페이지 로드는 그대로 진행)
+"""
+
+import base64
+import gzip
+import json
+import os
+import re
+import threading
+from datetime import datetime
+
+from selenium.common.exceptions import WebDriverException
+
+from src.utils import network_tracker
+from tests.helpers.cdp_client import BrowserCDP
+
+RECORD_TYPES = ("Fetch", "XHR", "EventSource")
+
+
+def cassette_path(cassette_dir, nodeid):
+    name = re.sub(r"[^\w.-]+", "_", nodeid).strip("_")
+    return os.path.join(cassette_dir, f"{name}.har.json.gz")
+
+
+# ======================
+# ✅ 카세트 파일
+# ======================
+
+def to_entry(record, body, base64_encoded=False):
+    """RequestRecord + 응답 본문 → HAR entry (시간은 ms)"""
+    wait = ((record.responded or record.finished) - record.started) * 1000
+    return {
+        "request": {
+            "method": record.method,
+            "url": record.url,
+            "postData": {"text": record.post_data} if record.post_data else None,
+        },
+        "response": {
+            "status": record.status or 200,
+            "content": {
+                "mimeType": record.mime_type or "",
+                "text": body,
+                "encoding": "base64" if base64_encoded else None,
+            },
+        },
+        "time": round(record.duration_ms, 1),
+        "timings": {"wait": round(wait, 1), "receive": round(record.duration_ms - wait, 1)},
+        "_resourceType": record.resource_type,
+        "_chunks": [[round((ts - record.started) * 1000, 1), size] for ts, size in record.data_chunks],
+    }
+
+
+def save_cassette(path, nodeid, entries):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    har = {
+        "log": {
+            "version": "1.2",
+            "creator": {"name": "helpy-qa traffic_cassette", "version": "1"},
+            "_test": nodeid,
+            "_recorded": datetime.now().isoformat(timespec="seconds"),
+            "entries": entries,
+        }
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(har, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load_cassette(path):
+    """카세트의 entry 목록 (파일이 없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)["log"]["entries"]
+
+
+def record_cassette(driver, path, nodeid, types=RECORD_TYPES):
+    """
+    이번 테스트에서 끝난 API 요청을 카세트로 저장
+    반환: (저장한 수, 본문을 받지 못한 수)  — 저장할 요청이 없으면 파일을 만들지 않음
+    """
+    records = sorted(
+        (r for r in network_tracker.tracker_for(driver).records()
+         if r.resource_type in types and not r.failed),
+        key=lambda r: r.started,
+    )
+    entries, missing = [], 0
+    for record in records:
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": record.request_id})
+        except WebDriverException:
+            # 페이지 이동 등으로 본문이 이미 사라진 요청
+            missing += 1
+            continue
+        entries.append(to_entry(record, body["body"], body["base64Encoded"]))
+    if entries:
+        save_cassette(path, nodeid, entries)
+    return len(entries), missing
+
+
+# ======================
+# ✅ 재생
+# ======================
+
+class CassetteMatcher:
+    """
+    요청 → 카세트 entry
+    - method + URL이 같은 entry 중 본문까지 같은 것을 우선, 녹화 순서대로 하나씩 사용
+    - 모두 사용했으면 마지막 entry를 반복 (폴링 요청 등)
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.used = set()
+
+    def match(self, method, url, post_data=None):
+        candidates = [i for i, e in enumerate(self.entries)
+                      if e["request"]["method"] == method and e["request"]["url"] == url]
+        if not candidates:
+            return None
+        exact = [i for i in candidates
+                 if (self.entries[i]["request"].get("postData") or {}).get("text") == post_data]
+        pool = exact or candidates
+        unused = [i for i in pool if i not in self.used]
+        index = unused[0] if unused else pool[-1]
+        self.used.add(index)
+        return self.entries[index]
+
+
+def fulfill_params(request_id, entry, origin=None):
+    """Fetch.fulfillRequest 인자"""
+    content = entry["response"]["content"]
+    body = content.get("text") or ""
+    if content.get("encoding") != "base64":
+        body = base64.b64encode(body.encode("utf-8")).decode("ascii")
+    headers = [
+        {"name": "Content-Type", "value": content.get("mimeType") or "application/octet-stream"},
+        {"name": "Cache-Control", "value": "no-store"},
+    ]
+    if origin:
+        # 다른 출처 API 호출도 CORS 검사를 통과하도록
+        headers += [
+            {"name": "Access-Control-Allow-Origin", "value": origin},
+            {"name": "Access-Control-Allow-Credentials", "value": "true"},
+        ]
+    return {
+        "requestId": request_id,
+        "responseCode": entry["response"]["status"],
+        "responseHeaders": headers,
+        "body": body,
+    }
+
+
+class FetchReplayer:
+    """
+    현재 탭에 Fetch 가로채기를 걸고 카세트로 응답
+        replayer = FetchReplayer(load_cassette(path))
+        driver.on_start(replayer.start)   # 탭이 정해진 뒤 시작
+        ...
+        replayer.stop()
+    """
+
+    def __init__(self, entries, timing="original", missing="fail", types=RECORD_TYPES):
+        self.matcher = CassetteMatcher(entries)
+        self.timing = timing
+        self.missing = missing
+        self.types = types
+        self.served = 0
+        self.misses = []
+        self.cdp = None
+        self.session_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, driver):
+        self.cdp = BrowserCDP(driver)
+        self.session_id = self.cdp.send(
+            "Target.attachToTarget", {"targetId": driver.current_window_handle, "flatten": True}
+        )["sessionId"]
+        patterns = [{"urlPattern": "*", "resourceType": t, "requestStage": "Request"} for t in self.types]
+        self.cdp.send("Fetch.enable", {"patterns": patterns}, session_id=self.session_id)
+        self._thread = threading.Thread(target=self._loop, name="fetch-replayer", daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                event = self.cdp.next_event(timeout=0.2)
+            except Exception:  # 브라우저 종료 등으로 연결이 끊김
+                return
+            if event and event["method"] == "Fetch.requestPaused":
+                self.handle(event["params"])
+
+    def _post(self, method, params):
+        try:
+            self.cdp.post(method, params, session_id=self.session_id)
+        except Exception:  # 테스트가 끝나 연결을 닫은 뒤 도착한 지연 응답
+            pass
+
+    def handle(self, params):
+        request = params["request"]
+        entry = self.matcher.match(request["method"], request["url"], request.get("postData"))
+        if entry is None:
+            self.misses.append(f"{request['method']} {request['url']}")
+            if self.missing == "live":
+                self._post("Fetch.continueRequest", {"requestId": params["requestId"]})
+            else:
+                self._post("Fetch.failRequest",
+                           {"requestId": params["requestId"], "errorReason": "InternetDisconnected"})
+            return
+
+        self.served += 1
+        headers = {k.lower(): v for k, v in request.get("headers", {}).items()}
+        fulfill = fulfill_params(params["requestId"], entry, headers.get("origin"))
+        delay = entry["time"] / 1000 if self.timing == "original" else 0
+        if delay > 0:
+            timer = threading.Timer(delay, self._post, ("Fetch.fulfillRequest", fulfill))
+            timer.daemon = True
+            timer.start()
+        else:
+            self._post("Fetch.fulfillRequest", fulfill)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self.cdp is None:
+            return
+        try:
+            self.cdp.send("Fetch.disable", session_id=self.session_id)
+            self.cdp.send("Target.detachFromTarget", {"sessionId": self.session_id})
+        except Exception:
+            pass
+        self.cdp.close()